@@ -1,5 +1,7 @@
+import importlib
 import os
 import socket
+import sys
 
 from ansys.dpf.core._version import __version__
 
@@ -43,15 +45,19 @@ from ansys.dpf.core.core import (
     download_files_in_folder,
     make_tmp_dir_server,
 )
+from ansys.dpf.core.file_transfer import FileTransferManager
 from ansys.dpf.core.time_freq_support import TimeFreqSupport
 from ansys.dpf.core.meshed_region import MeshedRegion
 from ansys.dpf.core.elements import element_types
 from ansys.dpf.core.result_info import ResultInfo
 from ansys.dpf.core.collection import Collection
 from ansys.dpf.core.workflow import Workflow
+from ansys.dpf.core.distributed_executor import DistributedExecutor
+from ansys.dpf.core.server_pool import ServerPool
+from ansys.dpf.core.profiler import profile
+from ansys.dpf.core.transport import TransportPolicy, transport_policy
 from ansys.dpf.core.cyclic_support import CyclicSupport
 from ansys.dpf.core.element_descriptor import ElementDescriptor
-from ansys.dpf.core import operators
 from ansys.dpf.core.fields_factory import field_from_array
 from ansys.dpf.core import (
     fields_container_factory,
@@ -88,4 +94,20 @@ SERVER = None
 
 _server_instances = []
 
-settings.set_default_pyvista_config()
\ No newline at end of file
+settings.set_default_pyvista_config()
+
+# the generated operators package is the longest to import, it is only
+# imported on first access (PEP 562)
+_LAZY_SUBMODULES = ["operators"]
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    from ansys.dpf.core import operators
+else:
+
+    def __getattr__(name):
+        if name in _LAZY_SUBMODULES:
+            return importlib.import_module("." + name, __name__)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted(list(globals()) + _LAZY_SUBMODULES)
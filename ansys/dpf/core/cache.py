@@ -1,5 +1,23 @@
+import itertools
+import sys
+import threading
+import weakref
+from collections import OrderedDict
 from typing import NamedTuple
 
+import numpy as np
+
+# default bounds of the caches of the instances, see ``set_cache_limits``
+_MAX_ENTRIES = 256
+_MAX_BYTES = None
+_MAX_TOTAL_BYTES = None
+
+# all the live cache handlers, to inspect and bound the memory they use
+_REGISTRY = weakref.WeakSet()
+_REGISTRY_LOCK = threading.RLock()
+# increasing counter giving the recency of the cached entries across handlers
+_CLOCK = itertools.count()
+
 
 def class_handling_cache(cls):
     """Class decorator used to handle cache.
@@ -28,6 +46,68 @@ def class_handling_cache(cls):
     return cls
 
 
+class _ArrayKey(NamedTuple):
+    """Hashable content of a numpy array."""
+    dtype: str
+    shape: tuple
+    data: bytes
+
+
+class _IdentityKey:
+    """Hashable reference to an unhashable object, compared by identity.
+
+    The reference keeps the object alive while the key is cached so that its
+    ``id`` cannot be reused by another object.
+    """
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __eq__(self, other):
+        return isinstance(other, _IdentityKey) and self.obj is other.obj
+
+    def __hash__(self):
+        return id(self.obj)
+
+
+def _hashable(value):
+    """Hashable equivalent of the arguments of a cached method.
+
+    Lists, dictionaries and sets are converted to tuples and frozen sets,
+    arrays to their content and other unhashable objects are compared by
+    identity.
+    """
+    if isinstance(value, (str, bytes, int, float, type(None), _ArrayKey, _IdentityKey)):
+        return value
+    if isinstance(value, (tuple, list)):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, dict):
+        return frozenset((k, _hashable(v)) for k, v in value.items())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_hashable(v) for v in value)
+    if isinstance(value, np.ndarray):
+        return _ArrayKey(value.dtype.str, value.shape, value.tobytes())
+    try:
+        hash(value)
+    except TypeError:
+        return _IdentityKey(value)
+    return value
+
+
+def _sizeof(value, _depth=0):
+    """Approximate number of bytes used by a cached value on the client."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes + sys.getsizeof(np.empty(0))
+    size = sys.getsizeof(value)
+    if _depth < 2 and isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_sizeof(v, _depth + 1) for v in value)
+    elif _depth < 2 and isinstance(value, dict):
+        size += sum(_sizeof(k, _depth + 1) + _sizeof(v, _depth + 1) for k, v in value.items())
+    return size
+
+
 class MethodIdentifier(NamedTuple):
     method_name: str
     args: list
@@ -38,18 +118,44 @@ class MethodIdentifier(NamedTuple):
             return self.method_name == other
         else:
             return self.method_name == other.method_name \
-                   and self.args == other.args \
-                   and self.kwargs == other.kwargs
+                   and _hashable(self.args) == _hashable(other.args) \
+                   and _hashable(self.kwargs) == _hashable(other.kwargs)
 
     def __hash__(self):
         hash = self.method_name.__hash__()
         if self.args:
-            hash += self.args.__hash__()
+            hash += _hashable(self.args).__hash__()
         if self.kwargs:
-            hash += self.kwargs.__hash__()
+            hash += _hashable(self.kwargs).__hash__()
         return hash
 
 
+class CacheStats(NamedTuple):
+    """Statistics of one or several caches.
+
+    Attributes
+    ----------
+    entries : int
+        Number of cached results.
+    bytes : int
+        Approximate size of the cached results on the client in bytes.
+    hits : int
+        Number of calls whose result was found in the cache.
+    misses : int
+        Number of calls whose result was computed and cached.
+    evictions : int
+        Number of results removed to respect the bounds of the caches.
+    """
+    entries: int = 0
+    bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def __add__(self, other):
+        return CacheStats(*(a + b for a, b in zip(self, other)))
+
+
 class CacheHandler:
     """"Handle cache complexity.
     Is initialized by a class and a dictionary mapping the getters
@@ -60,6 +166,9 @@ class CacheHandler:
     When the setters associated to getters in the input dictionary are called,
     their associated getters' caches are cleared.
 
+    The least recently used results are evicted when the number of cached
+    results or their size exceeds the bounds set with :func:`set_cache_limits`.
+
     Parameters
     ----------
     cls : type
@@ -67,9 +176,17 @@ class CacheHandler:
 
     getters_to_setters_dict : dict[function:list[function]]
         Map class getters to their list of setters which need to be cached
-    """
-    def __init__(self, cls, getters_to_setters_dict):
 
+    max_entries : int, optional
+        Maximum number of cached results. The default is ``None``, in which
+        case the bound set with :func:`set_cache_limits` is used.
+
+    max_bytes : int, optional
+        Maximum size of the cached results in bytes. The default is ``None``,
+        in which case the bound set with :func:`set_cache_limits` is used.
+    """
+    def __init__(self, cls, getters_to_setters_dict, max_entries=None, max_bytes=None):
+        self.cls = cls
         self.getter_to_setters_name = {}
         for getter, setters in getters_to_setters_dict.items():
             setters_name = []
@@ -81,26 +198,206 @@ class CacheHandler:
         self.setter_to_getter_names = {}
         for getter, setters in self.getter_to_setters_name.items():
             for setter in setters:
-                self.setter_to_getter_names[setter] = getter
+                self.setter_to_getter_names.setdefault(setter, []).append(getter)
 
-        self.cached = {}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.cached = OrderedDict()
+        self._sizes = {}
+        self._ticks = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.RLock()
+        with _REGISTRY_LOCK:
+            _REGISTRY.add(self)
 
     def handle(self, object, func, *args, **kwargs):
-        identifier = MethodIdentifier(func.__name__, args, kwargs)
-        if identifier in self.cached:
-            return self.cached[identifier]
-        elif func.__name__ in self.getter_to_setters_name:
-            self.cached[identifier] = func(object, *args, **kwargs)
+        if func.__name__ in self.getter_to_setters_name:
+            # only the getters' arguments are hashed, the setters can
+            # receive unhashable arguments such as arrays
+            identifier = MethodIdentifier(func.__name__, _hashable(args), _hashable(kwargs))
+            with self._lock:
+                if identifier in self.cached:
+                    self._hits += 1
+                    self.cached.move_to_end(identifier)
+                    self._ticks[identifier] = next(_CLOCK)
+                    return self.cached[identifier]
+                self._misses += 1
+            out = func(object, *args, **kwargs)
             setattr(func, "under_cache", False)
-            return self.cached[identifier]
+            self._store(identifier, out)
+            return out
         else:
-            if func.__name__ in self.setter_to_getter_names \
-                    and self.setter_to_getter_names[func.__name__] in self.cached:
-                del self.cached[self.setter_to_getter_names[func.__name__]]
-            return func(object, *args, **kwargs)
+            # the getters can be called inside the setter, the cache is cleared after the call
+            out = func(object, *args, **kwargs)
+            getters = self.setter_to_getter_names.get(func.__name__)
+            if getters:
+                with self._lock:
+                    for identifier in [i for i in self.cached if i.method_name in getters]:
+                        self._remove(identifier)
+            return out
+
+    def _store(self, identifier, value):
+        size = _sizeof(value)
+        with self._lock:
+            if identifier in self.cached:
+                self._remove(identifier)
+            self.cached[identifier] = value
+            self._sizes[identifier] = size
+            self._ticks[identifier] = next(_CLOCK)
+            self._bytes += size
+            max_entries = self.max_entries if self.max_entries is not None else _MAX_ENTRIES
+            max_bytes = self.max_bytes if self.max_bytes is not None else _MAX_BYTES
+            # the result just stored is kept even if it is larger than the bound
+            while len(self.cached) > 1 and (
+                (max_entries is not None and len(self.cached) > max_entries)
+                or (max_bytes is not None and self._bytes > max_bytes)
+            ):
+                self._evict_oldest()
+        if _MAX_TOTAL_BYTES is not None:
+            _enforce_total_bytes(_MAX_TOTAL_BYTES)
+
+    def _remove(self, identifier):
+        del self.cached[identifier]
+        self._bytes -= self._sizes.pop(identifier)
+        del self._ticks[identifier]
+
+    def _evict_oldest(self):
+        self._remove(next(iter(self.cached)))
+        self._evictions += 1
+
+    def _oldest_tick(self):
+        with self._lock:
+            if not self.cached:
+                return None
+            return self._ticks[next(iter(self.cached))]
+
+    @property
+    def stats(self):
+        """Statistics of this cache.
+
+        Returns
+        -------
+        CacheStats
+        """
+        with self._lock:
+            return CacheStats(
+                len(self.cached), self._bytes, self._hits, self._misses, self._evictions
+            )
 
     def clear(self):
-        self.cached = {}
+        with self._lock:
+            self.cached = OrderedDict()
+            self._sizes = {}
+            self._ticks = {}
+            self._bytes = 0
+
+
+def _enforce_total_bytes(max_total_bytes):
+    """Evict the least recently used results across all the caches until
+    their total size is below ``max_total_bytes``."""
+    with _REGISTRY_LOCK:
+        handlers = list(_REGISTRY)
+        total = sum(h.stats.bytes for h in handlers)
+        while total > max_total_bytes:
+            oldest = None
+            for handler in handlers:
+                tick = handler._oldest_tick()
+                if tick is not None and (oldest is None or tick < oldest[0]):
+                    oldest = (tick, handler)
+            if oldest is None:
+                return
+            handler = oldest[1]
+            with handler._lock:
+                before = handler._bytes
+                if handler.cached:
+                    handler._evict_oldest()
+                total -= before - handler._bytes
+
+
+def set_cache_limits(max_entries=256, max_bytes=None, max_total_bytes=None):
+    """Bound the memory used by the caches of the DPF objects, such as the
+    named selections of the meshes or the units of the fields.
+
+    The least recently used results are evicted first.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        Maximum number of cached results per object. ``None`` for no limit.
+        The default is ``256``.
+    max_bytes : int, optional
+        Maximum size in bytes of the cached results per object. ``None`` for
+        no limit, which is the default.
+    max_total_bytes : int, optional
+        Maximum size in bytes of the cached results of all the objects.
+        ``None`` for no limit, which is the default.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> dpf.cache.set_cache_limits(max_entries=16, max_total_bytes=2**20)
+    >>> dpf.cache.set_cache_limits()
+
+    """
+    global _MAX_ENTRIES, _MAX_BYTES, _MAX_TOTAL_BYTES
+    _MAX_ENTRIES = max_entries
+    _MAX_BYTES = max_bytes
+    _MAX_TOTAL_BYTES = max_total_bytes
+    with _REGISTRY_LOCK:
+        handlers = list(_REGISTRY)
+    for handler in handlers:
+        with handler._lock:
+            handler_max_entries = (
+                handler.max_entries if handler.max_entries is not None else max_entries
+            )
+            handler_max_bytes = handler.max_bytes if handler.max_bytes is not None else max_bytes
+            while handler.cached and (
+                (handler_max_entries is not None and len(handler.cached) > handler_max_entries)
+                or (handler_max_bytes is not None and handler._bytes > handler_max_bytes)
+            ):
+                handler._evict_oldest()
+    if max_total_bytes is not None:
+        _enforce_total_bytes(max_total_bytes)
+
+
+def cache_stats():
+    """Statistics of the caches of all the DPF objects alive, per class.
+
+    Returns
+    -------
+    dict[str, CacheStats]
+        Statistics of the caches of the instances of each class, and their
+        sum under the ``"total"`` key.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> stats = dpf.cache.cache_stats()
+    >>> total_bytes = stats["total"].bytes
+
+    """
+    with _REGISTRY_LOCK:
+        handlers = list(_REGISTRY)
+    out = {}
+    total = CacheStats()
+    for handler in handlers:
+        stats = handler.stats
+        name = handler.cls.__name__
+        out[name] = out.get(name, CacheStats()) + stats
+        total = total + stats
+    out["total"] = total
+    return out
+
+
+def clear_caches():
+    """Clear the caches of all the DPF objects alive."""
+    with _REGISTRY_LOCK:
+        handlers = list(_REGISTRY)
+    for handler in handlers:
+        handler.clear()
 
 
 def _handle_cache(func):
@@ -116,7 +413,7 @@ def _handle_cache(func):
         if hasattr(self, "_cache"):
             return self._cache.handle(self, func, *args, **kwargs)
         else:
-            func(self, *args, **kwargs)
+            return func(self, *args, **kwargs)
 
     return wrapper
 
@@ -18,6 +18,8 @@ from ansys.dpf.core.time_freq_support import TimeFreqSupport
 from ansys.dpf.core.errors import protect_grpc
 from ansys.dpf.core import server
 from ansys.dpf.core import scoping
+from ansys.dpf.core import release_queue
+from ansys.dpf.core import transport
 
 
 class Collection:
@@ -67,6 +69,7 @@ class Collection:
 
         if self._type == None:
             self._type = types(int(self._message.type) + 1)
+        release_queue._track(self)
 
     @staticmethod
     def integral_collection(inpt, server: server.DpfServer = None):
@@ -228,7 +231,29 @@ class Collection:
         elif isinstance(label_space_or_index, int):
             request.index = label_space_or_index
 
-        out = self._stub.GetEntries(request)
+        return self._entries_tuple_from_response(self._stub.GetEntries(request))
+
+    def _get_all_entries_tuple(self):
+        """Retrieve all the entries with their label spaces in one request.
+
+        Returns
+        -------
+        entries : list[_CollectionEntry]
+            Entries of the collection, ordered by index.
+        """
+        request = collection_pb2.EntryRequest()
+        request.collection.CopyFrom(self._message)
+        # an empty label space matches all the entries
+        request.label_space.SetInParent()
+        entries = self._entries_tuple_from_response(self._stub.GetEntries(request))
+        if entries is None:
+            entries = []
+        self_len = len(self)
+        if len(entries) != self_len:
+            entries = [self._get_entries_tuple(i)[0] for i in range(self_len)]
+        return entries
+
+    def _entries_tuple_from_response(self, out):
         list_out = []
         for obj in out.entries:
             label_space = {}
@@ -318,8 +343,8 @@ class Collection:
             List of IDs assigned to the input label.
         """
         ids = []
-        for i in range(len(self)):
-            current_scop = self.get_label_space(i)
+        for entry in self._get_all_entries_tuple():
+            current_scop = entry.label_space
             if label in current_scop and current_scop[label] not in ids:
                 ids.append(current_scop[label])
         return ids
@@ -402,7 +427,7 @@ class Collection:
         request.collection.CopyFrom(self._message)
         request.type = base_pb2.Type.Value("TIME_FREQ_SUPPORT")
         message = self._stub.GetSupport(request)
-        return TimeFreqSupport(time_freq_support=message)
+        return TimeFreqSupport(time_freq_support=message, server=self._server)
 
     def _set_time_freq_support(self, time_freq_support):
         """Set the time frequency support of the collection."""
@@ -416,7 +441,7 @@ class Collection:
         if self._type == types.int:
             dtype = np.int32
         else:
-            dtype = np.float
+            dtype = np.float64
 
         if isinstance(input, range):
             input = np.array(list(input), dtype=dtype)
@@ -429,7 +454,16 @@ class Collection:
         request = collection_pb2.UpdateAllDataRequest()
         request.collection.CopyFrom(self._message)
 
-        self._stub.UpdateAllData(scoping._data_chunk_yielder(request, input), metadata=metadata)
+        compression = (
+            transport._policy(self._server).grpc_compression
+            if self._type == types.int
+            else None
+        )
+        self._stub.UpdateAllData(
+            scoping._data_chunk_yielder(request, input),
+            metadata=metadata,
+            compression=compression,
+        )
 
     def _get_integral_entries(self):
         request = collection_pb2.GetAllDataRequest()
@@ -439,7 +473,7 @@ class Collection:
             dtype = np.int32
         else:
             data_type = u"double"
-            dtype = np.float
+            dtype = np.float64
         service = self._stub.GetAllData(request, metadata=[(u"float_or_double", data_type)])
         return scoping._data_get_chunk_(dtype, service)
 
@@ -476,13 +510,61 @@ class Collection:
     def __del__(self):
         """Delete the entry."""
         try:
-            self._stub.Delete(self._message)
+            release_queue._release(self, self._stub.Delete, self._message)
         except:
             pass
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+        for entry in self._get_all_entries_tuple():
+            yield entry.entry
+
+    def iter_with_label_spaces(self, prefetch=0):
+        """Iterate over the label spaces and the entries of the collection.
+
+        All the entries and their label spaces are retrieved with a single
+        request. For collections of fields, the data of the next fields can
+        be retrieved in background threads while the current field is used.
+
+        Parameters
+        ----------
+        prefetch : int, optional
+            Number of fields whose data is retrieved ahead of the iteration.
+            The prefetched data is returned by the next call to ``data`` on
+            these fields. The default is ``0``, in which case no data is
+            prefetched.
+
+        Yields
+        ------
+        label_space : dict[str,int]
+            Label space of the entry. For example, ``{"time": 1, "complex": 0}``.
+        entry : Field, Scoping, MeshedRegion
+            Entry at this label space.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.download_transient_result())
+        >>> fc = model.results.displacement.on_all_time_freqs.eval()
+        >>> for label_space, field in fc.iter_with_label_spaces(prefetch=2):
+        ...     max_disp = field.data.max()
+
+        """
+        entries = self._get_all_entries_tuple()
+        if prefetch <= 0 or self._type != types.field:
+            for entry in entries:
+                yield entry.label_space, entry.entry
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            for entry in entries[:prefetch]:
+                entry.entry._prefetch_data(executor)
+            for i, entry in enumerate(entries):
+                if i + prefetch < len(entries):
+                    entries[i + prefetch].entry._prefetch_data(executor)
+                yield entry.label_space, entry.entry
 
 class _CollectionEntry(NamedTuple):
     label_space: dict
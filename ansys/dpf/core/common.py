@@ -226,3 +226,36 @@ def _common_progress_bar(text, unit, tot_size=None):
 def _common_percentage_progress_bar(text):
     widgets = [progressbar.FormatLabel(f'{text}: %(value)d %%'), progressbar.Bar()]
     return progressbar.ProgressBar(widgets=widgets, max_value=100)
+
+
+def _grpc_future_to_asyncio(grpc_future):
+    """Wrap a future returned by a gRPC call into an asyncio future of the
+    running event loop.
+
+    Cancelling the asyncio future cancels the gRPC call.
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    aio_future = loop.create_future()
+
+    def transfer(done_future):
+        if aio_future.done():
+            return
+        if done_future.cancelled():
+            aio_future.cancel()
+        elif done_future.exception() is not None:
+            aio_future.set_exception(done_future.exception())
+        else:
+            aio_future.set_result(done_future.result())
+
+    def cancel_call(done_future):
+        if done_future.cancelled():
+            grpc_future.cancel()
+
+    # gRPC runs the callbacks in its own threads
+    grpc_future.add_done_callback(
+        lambda done_future: loop.call_soon_threadsafe(transfer, done_future)
+    )
+    aio_future.add_done_callback(cancel_call)
+    return aio_future
@@ -14,9 +14,10 @@ import grpc
 from ansys.grpc.dpf import base_pb2, base_pb2_grpc
 from ansys.dpf.core.errors import protect_grpc
 from ansys.dpf.core import server as serverlib
-from ansys.dpf.core import misc
 from ansys.dpf.core.common import _common_progress_bar
 from ansys.dpf.core.cache import class_handling_cache
+from ansys.dpf.core import specification_cache
+from ansys.dpf.core.file_transfer import FileTransferManager
 
 LOG = logging.getLogger(__name__)
 LOG.setLevel("DEBUG")
@@ -374,6 +375,7 @@ class BaseService:
                 f'Unable to load library "{filename}". File may not exist or'
                 f" is missing dependencies:\n{str(e)}"
             )
+        specification_cache._forget_operator_names(self._server())
 
         # TODO: fix code generation upload posix
         import os
@@ -622,55 +624,9 @@ class BaseService:
         paths : list of str
             new file paths server side
         """
-        server_paths = []
-        for root, subdirectories, files in os.walk(client_folder_path):
-            for subdirectory in subdirectories:
-                subdir = os.path.join(root, subdirectory)
-                for filename in os.listdir(subdir):
-                    f = os.path.join(subdir, filename)
-                    server_paths = self._upload_and_get_server_path(
-                        specific_extension,
-                        f,
-                        filename,
-                        server_paths,
-                        to_server_folder_path,
-                        subdirectory,
-                    )
-            for file in files:
-                f = os.path.join(root, file)
-                server_paths = self._upload_and_get_server_path(
-                    specific_extension, f, file, server_paths, to_server_folder_path
-                )
-            break
-        return server_paths
-
-    def _upload_and_get_server_path(
-            self,
-            specific_extension,
-            f,
-            filename,
-            server_paths,
-            to_server_folder_path,
-            subdirectory=None,
-    ):
-        separator = self._get_separator(to_server_folder_path)
-
-        if subdirectory is not None:
-            to_server_file_path = (
-                    to_server_folder_path + separator + subdirectory + separator + filename
-            )
-        else:
-            to_server_file_path = to_server_folder_path + separator + filename
-        if ((specific_extension is not None) and (f.endswith(specific_extension))) or (
-                specific_extension is None
-        ):
-            server_path = self._stub.UploadFile(
-                self.__file_chunk_yielder(
-                    file_path=f, to_server_file_path=to_server_file_path
-                )
-            ).server_file_path
-            server_paths.append(server_path)
-        return server_paths
+        return self._file_transfer().upload_folder(
+            client_folder_path, to_server_folder_path, specific_extension
+        ).paths
 
     @protect_grpc
     def upload_file(self, file_path, to_server_file_path):
@@ -695,9 +651,9 @@ class BaseService:
         """
         if os.stat(file_path).st_size == 0:
             raise ValueError(file_path + " is empty")
-        return self._stub.UploadFile(
-            self.__file_chunk_yielder(file_path, to_server_file_path)
-        ).server_file_path
+        return self._file_transfer().upload_files(
+            [(file_path, to_server_file_path)]
+        ).paths[0]
 
     @protect_grpc
     def upload_file_in_tmp_folder(self, file_path, new_file_name=None):
@@ -728,46 +684,15 @@ class BaseService:
             file_name = os.path.basename(file_path)
         if os.stat(file_path).st_size == 0:
             raise ValueError(file_path + " is empty")
-        return self._stub.UploadFile(
-            self.__file_chunk_yielder(
-                file_path=file_path, to_server_file_path=file_name, use_tmp_dir=True
-            )
-        ).server_file_path
+        return self._file_transfer().upload_files(
+            [(file_path, file_name)], use_tmp_dir=True
+        ).paths[0]
 
     def _prepare_shutdown(self):
         self._stub.PrepareShutdown(base_pb2.Empty())
 
-    def __file_chunk_yielder(self, file_path, to_server_file_path, use_tmp_dir=False):
-        request = base_pb2.UploadFileRequest()
-        request.server_file_path = to_server_file_path
-        request.use_temp_dir = use_tmp_dir
-
-        tot_size = os.path.getsize(file_path) * 1e-3
-
-        need_progress_bar = tot_size > 10000
-        if need_progress_bar:
-            bar = _common_progress_bar("Uploading...", "KB", tot_size)
-            bar.start()
-        i = 0
-        with open(file_path, "rb") as f:
-            while True:
-                piece = f.read(misc.DEFAULT_FILE_CHUNK_SIZE)
-                if len(piece) == 0:
-                    break
-                request.data.data = piece
-                yield request
-                i += len(piece) * 1e-3
-                if need_progress_bar:
-                    try:
-                        bar.update(min(i, tot_size))
-                    except:
-                        pass
-
-        if need_progress_bar:
-            try:
-                bar.finish()
-            except:
-                pass
+    def _file_transfer(self):
+        return FileTransferManager(self._server())
 
     _to_cache = {
         _get_server_info: None
@@ -5,6 +5,7 @@ Cyclic Support
 
 from ansys import dpf
 from ansys.dpf.core.scoping import Scoping
+from ansys.dpf.core import release_queue
 from ansys.grpc.dpf import cyclic_support_pb2, cyclic_support_pb2_grpc
 
 
@@ -46,6 +47,7 @@ class CyclicSupport:
         self._server = server
         self._stub = self._connect()
         self._message = cyclic_support
+        release_queue._track(self)
 
     def __str__(self):
         """Describe the entity.
@@ -289,6 +291,6 @@ class CyclicSupport:
 
     def __del__(self):
         try:
-            self._stub.Delete(self._message)
+            release_queue._release(self, self._stub.Delete, self._message)
         except:
             pass
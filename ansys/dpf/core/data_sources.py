@@ -9,6 +9,7 @@ import os
 from ansys import dpf
 from ansys.grpc.dpf import data_sources_pb2, data_sources_pb2_grpc, base_pb2
 from ansys.dpf.core.errors import protect_grpc
+from ansys.dpf.core import release_queue
 
 
 class DataSources:
@@ -54,6 +55,7 @@ class DataSources:
             self._message = self._stub.Create(request)
         else:
             self._message = data_sources
+        release_queue._track(self)
 
         if result_path is not None:
             self.set_result_file_path(result_path)
@@ -290,6 +292,6 @@ class DataSources:
 
     def __del__(self):
         try:  # should silently fail
-            self._stub.Delete(self._message)
+            release_queue._release(self, self._stub.Delete, self._message)
         except:
             pass
@@ -0,0 +1,216 @@
+"""
+.. _ref_distributed_executor:
+
+DistributedExecutor
+===================
+Evaluates a workflow on several data sources with a pool of servers and
+merges the results.
+"""
+import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+from ansys import dpf
+from ansys.dpf.core.common import types
+from ansys.dpf.core.data_sources import DataSources
+
+LOG = logging.getLogger(__name__)
+LOG.setLevel("DEBUG")
+
+
+class DistributedExecutor:
+    """Evaluates a template workflow on a list of data sources with a pool of
+    servers.
+
+    The template workflow is copied once per server. The data sources are
+    dispatched to the servers as soon as they are available, so faster
+    servers process more data sources. The data sources whose evaluation
+    failed are evaluated again, preferably on other servers, up to
+    ``retries`` times. The fields containers computed on the servers are
+    finally merged on the local server with the
+    ``merge_fields_containers`` operator.
+
+    Parameters
+    ----------
+    workflow : Workflow
+        Template workflow. Its input pin ``input_name`` receives the data
+        sources and its output pin ``output_name`` gives the result.
+    servers : list[server.DpfServer], ServerPool
+        Servers on which the workflow is evaluated.
+    input_name : str, optional
+        Name of the input pin of the workflow receiving the data sources.
+        The default is ``"data_sources"``.
+    output_name : str, optional
+        Name of the output pin of the workflow. The default is ``None``,
+        in which case the first output pin of the workflow is used.
+    output_type : :class:`ansys.dpf.core.common.types`, optional
+        Type of the output. The default is ``types.fields_container``.
+    retries : int, optional
+        Number of times the evaluation of a data source is attempted again
+        after a failure. The default is ``1``.
+    upload_files : bool, optional
+        Whether the result files are uploaded to the temporary folder of each
+        server before the evaluation. Use it when the servers do not have
+        access to the client's files. The default is ``False``.
+    server : server.DpfServer, optional
+        Server on which the results are merged. The default is ``None``, in
+        which case an attempt is made to use the global server.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> from ansys.dpf.core import operators as ops
+    >>> files = examples.download_distributed_files()
+    >>> stress = ops.result.stress()
+    >>> workflow = dpf.Workflow()
+    >>> workflow.add_operator(stress)
+    >>> workflow.set_input_name("data_sources", stress.inputs.data_sources)
+    >>> workflow.set_output_name("stress", stress.outputs.fields_container)
+    >>> servers = [dpf.start_local_server(as_global=False) for _ in range(2)]
+    >>> executor = dpf.DistributedExecutor(workflow, servers)
+    >>> fc = executor.run([files[0], files[1]])
+
+    """
+
+    def __init__(
+        self,
+        workflow,
+        servers,
+        input_name="data_sources",
+        output_name=None,
+        output_type=types.fields_container,
+        retries=1,
+        upload_files=False,
+        server=None,
+    ):
+        if server is None:
+            server = dpf.core._global_server()
+        self._server = server
+        self._workflow = workflow
+        self._servers = list(servers)
+        if len(self._servers) == 0:
+            raise ValueError("At least one server is required.")
+        self._input_name = input_name
+        if output_name is None:
+            output_name = workflow.output_names[0]
+        self._output_name = output_name
+        self._output_type = output_type
+        self.retries = retries
+        self.upload_files = upload_files
+        self._remote_workflows = {}
+
+    def run(self, data_sources, merge=True):
+        """Evaluate the workflow on each data sources.
+
+        Parameters
+        ----------
+        data_sources : list[DataSources, str]
+            Data sources or result file paths. Data sources are sent to the
+            servers with their file paths.
+        merge : bool, optional
+            Whether the fields containers computed for the data sources are
+            merged. The default is ``True``.
+
+        Returns
+        -------
+        FieldsContainer, list
+            Merged fields container or, when ``merge`` is ``False``, the
+            outputs in the order of ``data_sources``. These outputs are on
+            their evaluation server.
+        """
+        if merge and self._output_type != types.fields_container:
+            raise ValueError("Only fields containers outputs can be merged.")
+        tasks = dict(enumerate(data_sources))
+        results = {}
+        workers = list(range(len(self._servers)))
+        errors = {}
+        for attempt in range(self.retries + 1):
+            round_results, errors, failed_workers = self._run_round(
+                tasks, workers, merge
+            )
+            results.update(round_results)
+            tasks = {index: tasks[index] for index in errors}
+            if not tasks:
+                break
+            LOG.debug(
+                f"Evaluation failed for {len(tasks)} data sources "
+                f"(attempt {attempt + 1})."
+            )
+            # try the next attempts on the servers which did not fail
+            healthy = [w for w in range(len(self._servers)) if w not in failed_workers]
+            workers = healthy if healthy else list(range(len(self._servers)))
+        if errors:
+            index, error = next(iter(errors.items()))
+            raise RuntimeError(
+                f"The evaluation failed for {len(errors)} data sources, "
+                f"the first failure is for data sources {index}: {error}"
+            ) from error
+
+        outputs = [results[index] for index in sorted(results)]
+        if not merge:
+            return outputs
+        merge_op = dpf.core.operators.utility.merge_fields_containers(
+            server=self._server
+        )
+        for pin, output in enumerate(outputs):
+            merge_op.connect(pin, output)
+        return merge_op.get_output(0, types.fields_container)
+
+    def _run_round(self, tasks, workers, merge):
+        pending = queue.Queue()
+        for item in tasks.items():
+            pending.put(item)
+        results = {}
+        errors = {}
+        failed_workers = set()
+
+        def work(worker):
+            while True:
+                try:
+                    index, data_sources = pending.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    results[index] = self._evaluate(worker, data_sources, merge)
+                except Exception as e:
+                    LOG.debug(f"Evaluation failed on server {worker}: {e}")
+                    errors[index] = e
+                    failed_workers.add(worker)
+                    # the workflow is copied again on the next evaluation
+                    self._remote_workflows.pop(worker, None)
+
+        with ThreadPoolExecutor(max_workers=len(workers)) as executor:
+            list(executor.map(work, workers))
+        return results, errors, failed_workers
+
+    def _evaluate(self, worker, data_sources, merge):
+        server = self._servers[worker]
+        workflow = self._remote_workflows.get(worker)
+        if workflow is None:
+            workflow = self._workflow.create_on_other_server(server=server)
+            workflow.progress_bar = False
+            self._remote_workflows[worker] = workflow
+        workflow.connect(self._input_name, self._data_sources_on(data_sources, server))
+        output = workflow.get_output(self._output_name, self._output_type)
+        if merge and server is not self._server:
+            output = output.deep_copy(server=self._server)
+        return output
+
+    def _data_sources_on(self, data_sources, server):
+        if isinstance(data_sources, DataSources):
+            if data_sources._server is server and not self.upload_files:
+                return data_sources
+            info = data_sources._info
+        else:
+            info = {"result_key": "", "paths": {"": [data_sources]}}
+        remote = DataSources(server=server)
+        for key, paths in info["paths"].items():
+            for path in paths:
+                if self.upload_files:
+                    path = dpf.core.upload_file_in_tmp_folder(path, server=server)
+                if key == info["result_key"]:
+                    remote.set_result_file_path(path, key)
+                else:
+                    remote.add_file_path(path, key)
+        return remote
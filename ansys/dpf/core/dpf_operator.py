@@ -12,12 +12,16 @@ import re
 from typing import NamedTuple
 
 from ansys.dpf.core import server as serverlib
+from ansys.dpf.core import result_cache
 from ansys.dpf.core.check_version import version_requires, server_meet_version
+from ansys.dpf.core.common import _grpc_future_to_asyncio
 from ansys.dpf.core.config import Config
 from ansys.dpf.core.errors import protect_grpc
 from ansys.dpf.core.inputs import Inputs
 from ansys.dpf.core.mapping_types import types
 from ansys.dpf.core.outputs import Output, Outputs, _Outputs
+from ansys.dpf.core import release_queue
+from ansys.dpf.core import specification_cache
 from ansys.grpc.dpf import base_pb2, operator_pb2, operator_pb2_grpc
 
 LOG = logging.getLogger(__name__)
@@ -77,6 +81,10 @@ class Operator:
         self._description = None
         self._inputs = None
         self._outputs = None
+        # identification of the connected inputs by pin, recorded for the
+        # result cache, ``None`` once an input is connected while no cache
+        # is active
+        self._connections = {}
 
         self.__send_init_request(config)
 
@@ -90,6 +98,7 @@ class Operator:
 
         self._description = self._spec.description
         self._progress_bar = False
+        release_queue._track(self)
 
     def _add_sub_res_operators(self, sub_results):
         """Dynamically add operators for instantiating subresults.
@@ -168,6 +177,11 @@ class Operator:
         if inpt is self:
             raise ValueError("Cannot connect to itself.")
         self._stub.Update(request)
+        if self._connections is not None:
+            if result_cache._active_cache() is None:
+                self._connections = None
+            else:
+                self._connections[pin] = result_cache._connection_key(inpt, pin_out)
 
     @protect_grpc
     def get_output(self, pin=0, output_type=None):
@@ -194,6 +208,9 @@ class Operator:
         request.pin = pin
 
         if output_type:
+            cache, key, data_sources, cached = self._cached_output(pin, output_type)
+            if cached is not None:
+                return cached
             _write_output_type_to_proto_style(output_type, request)
             if server_meet_version("3.0", self._server) and self._progress_bar:
                 self._server._session.add_operator(self, pin, "workflow")
@@ -204,12 +221,92 @@ class Operator:
                 out = out_future.result()
             else:
                 out = self._stub.Get(request)
-            return _convertOutputMessageToPythonInstance(out, output_type, self._server)
+            output = _convertOutputMessageToPythonInstance(out, output_type, self._server)
+            if key is not None:
+                cache.store(key, output, data_sources)
+            return output
         else:
             request.type = base_pb2.Type.Value("RUN")
             out_future = self._stub.Get.future(request)
             out_future.result()
 
+    @protect_grpc
+    async def get_output_async(self, pin=0, output_type=None):
+        """Retrieve the output of the operator on the pin number without
+        blocking the event loop.
+
+        The progress bar is not printed.
+
+        Parameters
+        ----------
+        pin : int, optional
+            Number of the output pin. The default is ``0``.
+        output_type : :class:`ansys.dpf.core.common.types`, optional
+            Requested type of the output. The default is ``None``.
+
+        Returns
+        -------
+        type
+            Output of the operator.
+
+        Examples
+        --------
+        Evaluate the displacement of several result files concurrently.
+
+        >>> import asyncio
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> async def get_displacements(files):
+        ...     ops = [dpf.Model(f).results.displacement() for f in files]
+        ...     return await asyncio.gather(
+        ...         *[op.get_output_async(0, dpf.types.fields_container) for op in ops]
+        ...     )
+        >>> fcs = asyncio.run(
+        ...     get_displacements([examples.static_rst, examples.multishells_rst])
+        ... )
+
+        """
+        request = operator_pb2.OperatorEvaluationRequest()
+        request.op.CopyFrom(self._message)
+        request.pin = pin
+
+        if output_type:
+            cache, key, data_sources, cached = self._cached_output(pin, output_type)
+            if cached is not None:
+                return cached
+            _write_output_type_to_proto_style(output_type, request)
+            out = await _grpc_future_to_asyncio(self._stub.Get.future(request))
+            output = _convertOutputMessageToPythonInstance(out, output_type, self._server)
+            if key is not None:
+                cache.store(key, output, data_sources)
+            return output
+        else:
+            request.type = base_pb2.Type.Value("RUN")
+            await _grpc_future_to_asyncio(self._stub.Get.future(request))
+
+    def _cached_output(self, pin, output_type):
+        """Look for an output in the result cache.
+
+        Returns
+        -------
+        cache : ResultCache
+            Active result cache or ``None``.
+        key : str
+            Key of the output or ``None`` if it cannot be cached.
+        data_sources : list
+            Description of the data sources which the output is computed
+            from or ``None``.
+        cached : type
+            Output stored in the cache or ``None``.
+        """
+        cache = result_cache._active_cache()
+        key = data_sources = None
+        if cache is not None:
+            key, data_sources = cache._key(self, pin, output_type)
+            if key is not None:
+                return cache, key, data_sources, cache.load(key, output_type, self._server)
+        return cache, key, data_sources, None
+
     @property
     def config(self):
         """Copy of the operator's current configuration.
@@ -321,8 +418,11 @@ class Operator:
         return operator_pb2_grpc.OperatorServiceStub(self._server.channel)
 
     def __del__(self):
+        if "_lazy_inputs" in self.__dict__:
+            # never created on the server
+            return
         try:
-            self._stub.Delete(self._message)
+            release_queue._release(self, self._stub.Delete, self._message)
         except:
             pass
 
@@ -439,15 +539,7 @@ class Operator:
         -------
         add : operators.math.add_fc
         """
-        from ansys.dpf.core import dpf_operator, operators
-
-        if hasattr(operators, "math") and hasattr(operators.math, "add_fc"):
-            op = operators.math.add_fc(self, fields_b, server=self._server)
-        else:
-            op = dpf_operator.Operator("add_fc", server=self._server)
-            op.connect(0, self)
-            op.connect(1, fields_b)
-        return op
+        return _lazy_operator("add_fc", [self, fields_b], self._server)
 
     def __sub__(self, fields_b):
         """Subtract two fields or two fields containers.
@@ -456,28 +548,12 @@ class Operator:
         -------
         minus : operators.math.minus_fc
         """
-        from ansys.dpf.core import dpf_operator, operators
-
-        if hasattr(operators, "math") and hasattr(operators.math, "minus_fc"):
-            op = operators.math.minus_fc(server=self._server)
-        else:
-            op = dpf_operator.Operator("minus_fc", server=self._server)
-        op.connect(0, self)
-        op.connect(1, fields_b)
-        return op
+        return _lazy_operator("minus_fc", [self, fields_b], self._server)
 
     def __pow__(self, value):
         if value != 2:
             raise ValueError('Only the value "2" is supported.')
-        from ansys.dpf.core import dpf_operator, operators
-
-        if hasattr(operators, "math") and hasattr(operators.math, "sqr_fc"):
-            op = operators.math.sqr_fc(server=self._server)
-        else:
-            op = dpf_operator.Operator("sqr_fc", server=self._server)
-        op.connect(0, self)
-        op.connect(1, value)
-        return op
+        return _lazy_operator("sqr_fc", [self, value], self._server)
 
     def __mul__(self, value):
         """Multiply two fields or two fields containers.
@@ -486,50 +562,134 @@ class Operator:
         -------
         mul : operators.math.generalized_inner_product_fc
         """
-        from ansys.dpf.core import dpf_operator, operators
+        return _lazy_operator("generalized_inner_product_fc", [self, value], self._server)
+
+    def __getattr__(self, item):
+        # the operators of the arithmetic expressions are created and
+        # connected on the server the first time they are used
+        if item.startswith("__") or "_lazy_inputs" not in self.__dict__:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{item}'"
+            )
+        self._materialize()
+        return getattr(self, item)
+
+    def _materialize(self, memo=None):
+        """Create this operator of an expression on the server and connect its
+        inputs, creating the operators of the sub-expressions first.
 
-        if hasattr(operators, "math") and hasattr(
-                operators.math, "generalized_inner_product_fc"
-        ):
-            op = operators.math.generalized_inner_product_fc(server=self._server)
+        Identical sub-expressions are only created once, ``memo`` maps their
+        key to the operator used for all of them.
+        """
+        inputs = self.__dict__.pop("_lazy_inputs")
+        if memo is None:
+            memo = {}
+        if type(self) is Operator:
+            Operator.__init__(self, self.name, server=self._server)
         else:
-            op = dpf_operator.Operator(
-                "generalized_inner_product_fc", server=self._server
-            )
-        op.connect(0, self)
-        op.connect(1, value)
-        return op
+            type(self).__init__(self, server=self._server)
+        for pin, inpt in enumerate(inputs):
+            if isinstance(inpt, Operator) and "_expression_key" in inpt.__dict__:
+                inpt = memo.setdefault(inpt._expression_key, inpt)
+                if "_lazy_inputs" in inpt.__dict__:
+                    inpt._materialize(memo)
+            self.connect(pin, inpt)
 
     def __fill_spec(self):
-        """Put the grpc spec message in self._spec"""
+        """Put the spec of the operator in self._spec"""
         if hasattr(self._message, "spec"):
             self._spec = OperatorSpecification._fill_from_message(self.name, self._message.spec)
-        else:
-            out = self._stub.List(self._message)
-            self._spec = OperatorSpecification._fill_from_message(self.name, out.spec)
+            return
+        # generated operators ship their specification
+        self._spec = specification_cache._static_specification(type(self), self.name)
+        if self._spec is None:
+            self._spec = specification_cache._active_cache().get(
+                self._server.version,
+                self.name,
+                lambda: OperatorSpecification._fill_from_message(
+                    self.name, self._stub.List(self._message).spec
+                ),
+            )
 
     @staticmethod
     def operator_specification(op_name, server=None):
-        """Put the grpc spec message in self._spec"""
+        """Specification of an operator.
+
+        The specifications are cached for each server version, see
+        :func:`ansys.dpf.core.settings.enable_operator_specification_cache`.
+
+        Parameters
+        ----------
+        op_name : str
+            Name of the operator.
+        server : server.DPFServer, optional
+            Server with the channel connected to the remote or local instance.
+            The default is ``None``, in which case an attempt is made to use
+            the global server.
+
+        Returns
+        -------
+        OperatorSpecification
+        """
         if server is None:
             server = serverlib._global_server()
-        request = operator_pb2.Operator()
-        request.name = op_name
-        out = operator_pb2_grpc.OperatorServiceStub(server.channel).List(request)
-        return OperatorSpecification._fill_from_message(op_name, out.spec)
+
+        def fetch():
+            request = operator_pb2.Operator()
+            request.name = op_name
+            out = operator_pb2_grpc.OperatorServiceStub(server.channel).List(request)
+            return OperatorSpecification._fill_from_message(op_name, out.spec)
+
+        return specification_cache._active_cache().get(server.version, op_name, fetch)
 
     def __truediv__(self, inpt):
         if isinstance(inpt, Operator):
-            op = Operator("div")
-            op.connect(0, self, 0)
-            op.connect(1, inpt, 0)
+            op = _lazy_operator("div", [self, inpt], self._server)
         elif isinstance(inpt, float):
-            op = Operator("scale")
-            op.connect(0, self, 0)
-            op.connect(1, 1.0 / inpt)
+            op = _lazy_operator("scale", [self, 1.0 / inpt], self._server)
         return op
 
 
+def _expression_key(inpt):
+    """Hashable description of an input of an expression, equal for the
+    inputs giving the same result."""
+    if isinstance(inpt, Operator) and "_expression_key" in inpt.__dict__:
+        return inpt._expression_key
+    elif isinstance(inpt, (str, bool, int, float)):
+        return (type(inpt).__name__, inpt)
+    elif isinstance(inpt, list) and all(isinstance(x, (int, float)) for x in inpt):
+        return ("list", tuple(inpt))
+    return ("object", id(inpt))
+
+
+def _lazy_operator(name, inputs, server=None):
+    """Operator of an arithmetic expression, connected to ``inputs`` on its
+    first pins.
+
+    No request is sent to the server until the operator is used: the
+    expressions combining several operators are then created at once, with
+    the identical sub-expressions created only once, and evaluated by a
+    single request on the last operator.
+    """
+    from ansys.dpf.core import operators
+
+    if server is None:
+        server = serverlib._global_server()
+    op_type = Operator
+    if hasattr(operators, "math") and hasattr(operators.math, name):
+        op_type = getattr(operators.math, name)
+    op = op_type.__new__(op_type)
+    op._server = server
+    op.name = name
+    op._lazy_inputs = list(inputs)
+    op._expression_key = (
+        op_type.__name__,
+        name,
+        tuple(_expression_key(inpt) for inpt in inputs),
+    )
+    return op
+
+
 class PinSpecification(NamedTuple):
     name: str
     type_names: list
@@ -558,7 +718,7 @@ class OperatorSpecification(NamedTuple):
         tmpinputs = {}
         for key, inp in message.map_input_pin_spec.items():
             tmpinputs[key] = PinSpecification(inp.name,
-                                              inp.type_names,
+                                              list(inp.type_names),
                                               inp.optional,
                                               inp.document,
                                               inp.ellipsis)
@@ -566,7 +726,7 @@ class OperatorSpecification(NamedTuple):
         tmpoutputs = {}
         for key, inp in message.map_output_pin_spec.items():
             tmpoutputs[key] = PinSpecification(inp.name,
-                                               inp.type_names,
+                                               list(inp.type_names),
                                                inp.optional,
                                                inp.document,
                                                inp.ellipsis)
@@ -604,12 +764,16 @@ def available_operator_names(server=None):
     """
     if server is None:
         server = serverlib._global_server()
-    service = operator_pb2_grpc.OperatorServiceStub(server.channel).ListAllOperators(
-        operator_pb2.ListAllOperatorsRequest())
-    arr = []
-    for chunk in service:
-        arr.extend(re.split(r'[\x00-\x08]', chunk.array.decode('utf-8')))
-    return arr
+
+    def fetch():
+        service = operator_pb2_grpc.OperatorServiceStub(server.channel).ListAllOperators(
+            operator_pb2.ListAllOperatorsRequest())
+        arr = []
+        for chunk in service:
+            arr.extend(re.split(r'[\x00-\x08]', chunk.array.decode('utf-8')))
+        return arr
+
+    return specification_cache._operator_names(server, fetch)
 
 
 def _write_output_type_to_proto_style(output_type, request):
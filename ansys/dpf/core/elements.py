@@ -4,6 +4,7 @@ Elements
 """
 
 from enum import Enum
+from types import MappingProxyType
 
 import numpy as np
 from ansys.grpc.dpf import meshed_region_pb2
@@ -31,6 +32,9 @@ class Element:
         Fortran-based (1-based) index of the element in the result.
     nodes : list
         List of DPF nodes belonging to the element.
+    data : _ElementsData, optional
+        Arrays of the mesh elements. When set, the element is a view on
+        these arrays and its properties are read without any server call.
 
     Examples
     --------
@@ -49,11 +53,14 @@ class Element:
 
     """
 
-    def __init__(self, mesh, elementid, index, nodes):
+    __slots__ = ("_id", "_index", "_nodes", "_mesh", "_data")
+
+    def __init__(self, mesh, elementid, index, nodes, data=None):
         self._id = elementid
         self._index = index
         self._nodes = nodes
         self._mesh = mesh
+        self._data = data
 
     @property
     def node_ids(self):
@@ -75,6 +82,8 @@ class Element:
         [1, 26, 14, 12, 2, 27, 15, 13, 33, 64, 59, 30, 37, 65, 61, 34, 28, 81, 63, 58]
 
         """
+        if self._data is not None:
+            return self._data.nodes.ids[self._data.connectivity_of(self._index)].tolist()
         return [node.id for node in self._nodes]
 
     @property
@@ -119,6 +128,11 @@ class Element:
         >>> first_node = element.nodes[0]
 
         """
+        if self._nodes is None:
+            nodes_data = self._data.nodes
+            self._nodes = [
+                nodes_data.node(index) for index in self._data.connectivity_of(self._index)
+            ]
         return self._nodes
 
     @property
@@ -131,6 +145,8 @@ class Element:
             Number of nodes.
 
         """
+        if self._data is not None:
+            return self._data.connectivity_of(self._index).size
         return len(self._nodes)
 
     def __str__(self):
@@ -166,6 +182,8 @@ class Element:
 
     def _get_type(self):
         """Retrieve the Ansys element type."""
+        if self._data is not None:
+            return element_types(int(self._data.types[self._index]))
         prop = self._get_single_property(elemental_properties.element_type)
         return element_types(prop)
 
@@ -194,6 +212,9 @@ class Element:
 
     def _get_shape(self):
         """Retrieve the element shape."""
+        if self._data is not None:
+            prop = int(self._data.shapes[self._index])
+            return meshed_region_pb2.ElementShape.Name(prop).lower()
         prop = self._get_single_property(elemental_properties.element_shape)
         return meshed_region_pb2.ElementShape.Name(prop).lower()
 
@@ -224,6 +245,8 @@ class Element:
             Ordered list of node indices.
 
         """
+        if self._data is not None:
+            return self._data.connectivity_of(self._index).tolist()
         list = []
         for node in self._nodes:
             list.append(node.index)
@@ -252,6 +275,7 @@ class Elements:
     def __init__(self, mesh):
         self._mesh = mesh
         self._mapping_id_to_index = None
+        self._ids_indexer = None
 
     def __str__(self):
         return "DPF Elements object with %d elements" % len(self)
@@ -264,8 +288,9 @@ class Elements:
         return self.n_elements
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+        data = _ElementsData(self._mesh)
+        for i in range(len(data)):
+            yield data.element(i)
 
     def element_by_id(self, id) -> Element:
         """Retrieve an element by element ID.
@@ -307,6 +332,41 @@ class Elements:
         """
         return self.__get_element(elementindex=index)
 
+    def elements_by_scoping(self, external_scope):
+        """Retrieve all the elements of a scoping at once.
+
+        The IDs, connectivities and types of the elements are streamed from
+        the server in a few calls instead of one call per element. The
+        returned elements are lightweight views on these arrays.
+
+        Parameters
+        ----------
+        external_scope : :class:`ansys.dpf.core.scoping.Scoping`, list of int
+            Scoping or list of IDs of the elements to retrieve. IDs that are
+            not in the mesh are ignored.
+
+        Returns
+        -------
+        elements : list[Element]
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> elements = model.metadata.meshed_region.elements
+        >>> [element.index for element in elements.elements_by_scoping([1, 2])]
+        [0, 1]
+
+        """
+        if isinstance(external_scope, scoping.Scoping):
+            ids = external_scope._get_ids(np_array=True)
+        else:
+            ids = external_scope
+        indices, _ = self._get_ids_indexer().map_ids(ids)
+        data = _ElementsData(self._mesh)
+        return [data.element(index) for index in indices]
+
     def add_elements(self, num):
         """Add one or more elements in the mesh.
 
@@ -348,6 +408,7 @@ class Elements:
             )
             request.elements.append(element_request)
         self._mesh._stub.Add(request)
+        self._reset_mappings()
 
     def add_solid_element(self, id, connectivity):
         """Add a solid 3D element in the mesh.
@@ -421,6 +482,7 @@ class Elements:
         element_request.shape = meshed_region_pb2.ElementShape.Value(shape.upper())
         request.elements.extend([element_request])
         self._mesh._stub.Add(request)
+        self._reset_mappings()
 
     @protect_grpc
     def __get_element(self, elementindex=None, elementid=None):
@@ -552,7 +614,20 @@ class Elements:
 
     def _build_mapping_id_to_index(self):
         """Retrieve the mapping between the IDs and indices of the entity."""
-        return {eid: i for i, eid in enumerate(self.scoping.ids)}
+        return self._get_ids_indexer().as_dict()
+
+    def _get_ids_indexer(self):
+        """Retrieve the vectorized mapping between IDs and indices of the entity.
+
+        The IDs are requested from the server once and kept with the mesh.
+        """
+        if self._ids_indexer is None:
+            self._ids_indexer = scoping._IdsIndexer(self.scoping._get_ids(np_array=True))
+        return self._ids_indexer
+
+    def _reset_mappings(self):
+        self._mapping_id_to_index = None
+        self._ids_indexer = None
 
     @property
     def mapping_id_to_index(self) -> dict:
@@ -607,10 +682,7 @@ class Elements:
         """
         if external_scope.location in ["Nodal", "NodalElemental"]:
             raise ValueError('Input scope location must be "Nodal"')
-        arr = np.array(list(map(self.mapping_id_to_index.get, external_scope.ids)))
-        mask = arr != None
-        ind = arr[mask].astype(np.int)
-        return ind, mask
+        return self._get_ids_indexer().map_ids(external_scope._get_ids(np_array=True))
 
     @property
     def has_shell_elements(self) -> bool:
@@ -665,6 +737,68 @@ class Elements:
         ).element_shape_info.has_point_elements
 
 
+class _ElementsData:
+    """Array-backed IDs, connectivities, types and shapes of all the elements of a mesh.
+
+    The arrays are retrieved in a few streamed calls when first needed and
+    shared by the :class:`Element` views created from them.
+
+    Parameters
+    ----------
+    mesh : :class:`ansys.dpf.core.meshed_region.MeshedRegion`
+        Mesh containing the elements.
+    """
+
+    def __init__(self, mesh):
+        self._mesh = mesh
+        self.ids = mesh.elements._get_ids_indexer().ids
+        connectivities_field = mesh.elements.connectivities_field
+        self.connectivity = connectivities_field.data
+        offsets = connectivities_field._data_pointer
+        n_elements = self.ids.size
+        if offsets.size != n_elements:
+            n_nodes = self.connectivity.size // n_elements if n_elements else 0
+            offsets = np.arange(n_elements) * n_nodes
+        self.offsets = np.append(offsets, self.connectivity.size)
+        self._types = None
+        self._shapes = None
+        self._nodes = None
+
+    def __len__(self):
+        return self.ids.size
+
+    @property
+    def types(self):
+        """Element type of each element."""
+        if self._types is None:
+            self._types = self._mesh.elements.element_types_field.data
+        return self._types
+
+    @property
+    def shapes(self):
+        """Element shape of each element."""
+        if self._shapes is None:
+            self._shapes = self._mesh.field_of_properties(
+                elemental_properties.element_shape
+            ).data
+        return self._shapes
+
+    @property
+    def nodes(self):
+        """Array-backed data of the nodes of the mesh."""
+        if self._nodes is None:
+            self._nodes = nodes._NodesData(self._mesh)
+        return self._nodes
+
+    def connectivity_of(self, index):
+        """Node indices of the element at a given index."""
+        return self.connectivity[self.offsets[index]: self.offsets[index + 1]]
+
+    def element(self, index):
+        """Element view at a given index."""
+        return Element(self._mesh, int(self.ids[index]), int(index), None, self)
+
+
 class ElementAdder:
     """Provides for adding new elements in a meshed region.
 
@@ -864,6 +998,22 @@ class element_types(Enum):
 
     @staticmethod
     def _descriptors():
+        """Descriptors of all the element types, created on first use and shared."""
+        global _DESCRIPTORS
+        if _DESCRIPTORS is None:
+            _DESCRIPTORS = MappingProxyType(element_types._create_descriptors())
+        return _DESCRIPTORS
+
+    @staticmethod
+    def _table():
+        """Properties of all the element types as arrays indexed by type ID."""
+        global _TABLE
+        if _TABLE is None:
+            _TABLE = _ElementTypesTable(element_types._descriptors())
+        return _TABLE
+
+    @staticmethod
+    def _create_descriptors():
         return {
             element_types.General: ElementDescriptor(
                 element_types.General, "General", "general"
@@ -1197,8 +1347,9 @@ class element_types(Enum):
         type
 
         """
-        if isinstance(element_type, (int, np.int32)):
-            element_type = element_types(element_type)
+        if isinstance(element_type, (int, np.integer)):
+            table = element_types._table()
+            return _SHAPE_NAMES[table.shape[element_types(element_type).value]]
         el_shape = element_types._descriptors().get(element_type, None).shape
         return el_shape
 
@@ -1241,6 +1392,274 @@ class element_types(Enum):
         descriptor = element_types._descriptors().get(element_type, None)
         return descriptor
 
+    @staticmethod
+    def count_by_shape(types):
+        """Count the elements of each shape.
+
+        Parameters
+        ----------
+        types : numpy.ndarray, list of int, PropertyField
+            Element type of each element, for example the
+            ``element_types_field`` of the elements of a mesh.
+
+        Returns
+        -------
+        dict
+            Number of elements for each shape among ``"solid"``, ``"shell"``,
+            ``"beam"``, ``"point"`` and ``"unknown_shape"``.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> elements = model.metadata.meshed_region.elements
+        >>> dpf.element_types.count_by_shape(elements.element_types_field)["solid"]
+        8
+
+        """
+        codes = element_types._table().shape[_as_types_array(types)]
+        counts = np.bincount(codes, minlength=len(_SHAPE_NAMES))
+        return {name: int(count) for name, count in zip(_SHAPE_NAMES, counts)}
+
+    @staticmethod
+    def shape_mask(types, shape):
+        """Find the elements of a given shape.
+
+        Parameters
+        ----------
+        types : numpy.ndarray, list of int, PropertyField
+            Element type of each element, for example the
+            ``element_types_field`` of the elements of a mesh.
+        shape : str
+            Shape of the elements to find. Options are ``"solid"``,
+            ``"shell"``, ``"beam"``, ``"point"`` and ``"unknown_shape"``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean mask of the elements of the given shape.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> import numpy as np
+        >>> types = np.array([dpf.element_types.Hex8.value, dpf.element_types.Quad4.value])
+        >>> dpf.element_types.shape_mask(types, "solid")
+        array([ True, False])
+
+        """
+        if shape not in _SHAPE_NAMES:
+            raise ValueError(
+                f"'shape' must be one of {', '.join(_SHAPE_NAMES)}, not '{shape}'."
+            )
+        codes = element_types._table().shape[_as_types_array(types)]
+        return codes == _SHAPE_NAMES.index(shape)
+
+    @staticmethod
+    def corner_nodes(types, connectivity, data_pointer=None):
+        """Extract the corner nodes from the connectivity of elements.
+
+        The corner nodes are the first nodes of the connectivity of each
+        element. All the nodes are kept for the elements whose number of
+        corner nodes is unknown or variable, such as polygons.
+
+        Parameters
+        ----------
+        types : numpy.ndarray, list of int, PropertyField
+            Element type of each element.
+        connectivity : numpy.ndarray, list of int
+            Node indices of all the elements, one element after the other.
+        data_pointer : numpy.ndarray, list of int, optional
+            Position of the first node of each element in ``connectivity``.
+            The default is ``None``, in which case it is computed from the
+            number of nodes of the element types.
+
+        Returns
+        -------
+        corner_connectivity : numpy.ndarray
+            Corner node indices of all the elements, one element after the other.
+        corner_data_pointer : numpy.ndarray
+            Position of the first corner node of each element in
+            ``corner_connectivity``.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> elements = model.metadata.meshed_region.elements
+        >>> connectivities = elements.connectivities_field
+        >>> corners, pointer = dpf.element_types.corner_nodes(
+        ...     elements.element_types_field, connectivities.data, connectivities._data_pointer
+        ... )
+        >>> corners.size
+        64
+
+        """
+        table = element_types._table()
+        types = _as_types_array(types)
+        connectivity = np.asarray(connectivity).reshape(-1)
+        if data_pointer is None or len(data_pointer) == 0:
+            sizes = table.n_nodes[types]
+            if (sizes < 0).any():
+                raise ValueError(
+                    "'data_pointer' is required for the elements with a variable "
+                    "number of nodes."
+                )
+            starts = np.zeros(types.size, dtype=np.int64)
+            np.cumsum(sizes[:-1], out=starts[1:])
+        else:
+            starts = np.asarray(data_pointer, dtype=np.int64).reshape(-1)
+            sizes = np.diff(np.append(starts, connectivity.size))
+        n_corners = table.n_corner_nodes[types]
+        n_corners = np.where(n_corners > 0, np.minimum(n_corners, sizes), sizes)
+
+        corner_pointer = np.zeros(types.size, dtype=np.int32)
+        np.cumsum(n_corners[:-1], out=corner_pointer[1:])
+        # position in the connectivity of each corner node: start of its
+        # element plus its rank among the corner nodes of the element
+        positions = np.repeat(starts - corner_pointer, n_corners) + np.arange(
+            int(n_corners.sum())
+        )
+        return connectivity[positions], corner_pointer
+
+
+_DESCRIPTORS = None
+_TABLE = None
+
+# codes of the element shapes, matching ``meshed_region_pb2.ElementShape``
+# for the shapes it defines
+_SHAPE_NAMES = ("shell", "solid", "beam", "unknown_shape", "point")
+
+# VTK cell types, see vtkCellType.h
+_VTK_VERTEX = 1
+_VTK_LINE = 3
+_VTK_TRIANGLE = 5
+_VTK_QUAD = 9
+_VTK_TETRA = 10
+_VTK_HEXAHEDRON = 12
+_VTK_WEDGE = 13
+_VTK_PYRAMID = 14
+_VTK_QUADRATIC_EDGE = 21
+_VTK_QUADRATIC_TRIANGLE = 22
+_VTK_QUADRATIC_QUAD = 23
+_VTK_QUADRATIC_TETRA = 24
+_VTK_QUADRATIC_HEXAHEDRON = 25
+_VTK_QUADRATIC_PYRAMID = 27
+
+
+def _as_types_array(types):
+    """Element types as an array of IDs."""
+    if hasattr(types, "data"):
+        types = types.data
+    return np.asarray(types, dtype=np.int64).reshape(-1)
+
+
+class _ElementTypesTable:
+    """Read-only properties of all the element types as arrays indexed by
+    element type ID.
+
+    ``General`` (-2) and ``All`` (-1) are stored in the last two slots so
+    that their negative IDs index them like the other types.
+
+    Parameters
+    ----------
+    descriptors : dict
+        Descriptor of each element type.
+
+    Attributes
+    ----------
+    n_nodes : numpy.ndarray
+        Number of nodes, ``-1`` for a variable number of nodes and ``0``
+        when unknown.
+    n_corner_nodes : numpy.ndarray
+        Number of corner nodes, with the same conventions as ``n_nodes``.
+    shape : numpy.ndarray
+        Code of the shape, whose name is ``_SHAPE_NAMES[code]``.
+    vtk_type : numpy.ndarray
+        VTK cell type, ``0`` (empty cell) when the element has no VTK
+        equivalent.
+    linear_type : numpy.ndarray
+        Type ID of the linear element with the same corner nodes.
+    """
+
+    # number of nodes and corner nodes of the types whose descriptor does not have them
+    _nodes_counts = {
+        element_types.Surface3: (3, 3),
+        element_types.Surface4: (4, 4),
+        element_types.Surface6: (6, 3),
+        element_types.Surface8: (8, 4),
+        element_types.Edge2: (2, 2),
+        element_types.Edge3: (3, 2),
+        element_types.Beam3: (3, 2),
+        element_types.Beam4: (4, 2),
+    }
+
+    _vtk_types = {
+        element_types.Tet10: _VTK_QUADRATIC_TETRA,
+        element_types.Hex20: _VTK_QUADRATIC_HEXAHEDRON,
+        # the quadratic wedge is not supported, its corners are plotted
+        element_types.Wedge15: _VTK_WEDGE,
+        element_types.Pyramid13: _VTK_QUADRATIC_PYRAMID,
+        element_types.Tri6: _VTK_QUADRATIC_TRIANGLE,
+        element_types.TriShell6: _VTK_QUADRATIC_TRIANGLE,
+        element_types.Quad8: _VTK_QUADRATIC_QUAD,
+        element_types.QuadShell8: _VTK_QUADRATIC_QUAD,
+        element_types.Line3: _VTK_QUADRATIC_EDGE,
+        element_types.Point1: _VTK_VERTEX,
+        element_types.Tet4: _VTK_TETRA,
+        element_types.Hex8: _VTK_HEXAHEDRON,
+        element_types.Wedge6: _VTK_WEDGE,
+        element_types.Pyramid5: _VTK_PYRAMID,
+        element_types.Tri3: _VTK_TRIANGLE,
+        element_types.TriShell3: _VTK_TRIANGLE,
+        element_types.Quad4: _VTK_QUAD,
+        element_types.QuadShell4: _VTK_QUAD,
+        element_types.Line2: _VTK_LINE,
+        element_types.Surface3: _VTK_TRIANGLE,
+        element_types.Surface4: _VTK_QUAD,
+        element_types.Surface6: _VTK_QUADRATIC_TRIANGLE,
+        element_types.Surface8: _VTK_QUADRATIC_QUAD,
+    }
+
+    _linear_types = {
+        element_types.Tet10: element_types.Tet4,
+        element_types.Hex20: element_types.Hex8,
+        element_types.Wedge15: element_types.Wedge6,
+        element_types.Pyramid13: element_types.Pyramid5,
+        element_types.Tri6: element_types.Tri3,
+        element_types.TriShell6: element_types.TriShell3,
+        element_types.Quad8: element_types.Quad4,
+        element_types.QuadShell8: element_types.QuadShell4,
+        element_types.Line3: element_types.Line2,
+        element_types.Surface6: element_types.Surface3,
+        element_types.Surface8: element_types.Surface4,
+        element_types.Edge3: element_types.Edge2,
+    }
+
+    def __init__(self, descriptors):
+        size = max(t.value for t in element_types) + 1 + 2
+        self.n_nodes = np.zeros(size, dtype=np.int32)
+        self.n_corner_nodes = np.zeros(size, dtype=np.int32)
+        self.shape = np.zeros(size, dtype=np.int32)
+        self.vtk_type = np.zeros(size, dtype=np.uint8)
+        self.linear_type = np.zeros(size, dtype=np.int32)
+        for element_type, descriptor in descriptors.items():
+            i = element_type.value
+            if descriptor.n_nodes is not None:
+                self.n_nodes[i] = descriptor.n_nodes
+                self.n_corner_nodes[i] = descriptor.n_corner_nodes
+            elif element_type in self._nodes_counts:
+                self.n_nodes[i], self.n_corner_nodes[i] = self._nodes_counts[element_type]
+            self.shape[i] = _SHAPE_NAMES.index(descriptor.shape)
+            self.vtk_type[i] = self._vtk_types.get(element_type, 0)
+            self.linear_type[i] = self._linear_types.get(element_type, element_type).value
+        for array in (
+            self.n_nodes, self.n_corner_nodes, self.shape, self.vtk_type, self.linear_type
+        ):
+            array.flags.writeable = False
+
 
 element_types.__doc__ = __write_enum_doc__(
     element_types, "Types of elements available in a dpf's mesh."
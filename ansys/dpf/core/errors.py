@@ -1,3 +1,4 @@
+import inspect
 from grpc._channel import _InactiveRpcError, _MultiThreadedRendezvous
 from functools import wraps
 
@@ -101,6 +102,23 @@ class InvalidPortError(OSError):
 def protect_grpc(func):
     """Capture gRPC exceptions and return a more succinct error message."""
 
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            """Capture gRPC exceptions."""
+            try:
+                out = await func(*args, **kwargs)
+            except (_InactiveRpcError, _MultiThreadedRendezvous) as error:
+                details = error.details()
+                if "object is null in the dataBase" in details:
+                    raise DPFServerNullObject(details) from None
+                raise DPFServerException(details) from None
+
+            return out
+
+        return async_wrapper
+
     @wraps(func)
     def wrapper(*args, **kwargs):
         """Capture gRPC exceptions."""
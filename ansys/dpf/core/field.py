@@ -5,8 +5,11 @@ Field
 =====
 """
 
+import numpy as np
+
 from ansys import dpf
-from ansys.dpf.core import errors, meshed_region, time_freq_support
+from ansys.dpf.core import errors, meshed_region, time_freq_support, transport
+from ansys.dpf.core.cache import class_handling_cache
 from ansys.dpf.core.common import locations, natures, types
 from ansys.dpf.core.field_base import _FieldBase, _LocalFieldBase
 from ansys.dpf.core.field_definition import FieldDefinition
@@ -14,6 +17,7 @@ from ansys.dpf.core.plotter import Plotter
 from ansys.grpc.dpf import base_pb2, field_pb2
 
 
+@class_handling_cache
 class Field(_FieldBase):
     """Represents the main simulation data container.
 
@@ -286,6 +290,8 @@ class Field(_FieldBase):
         request.size.scoping_size = nentities
         request.size.data_size = datasize
         self._stub.UpdateSize(request)
+        self._data_future = None
+        self._array_cache = None
 
     def _load_field_definition(self):
         """Attempt to load the field definition for this field."""
@@ -365,6 +371,9 @@ class Field(_FieldBase):
     @property
     def name(self):
         """Name of the field."""
+        return self._get_name()
+
+    def _get_name(self):
         request = field_pb2.GetRequest()
         request.field.CopyFrom(self._message)
         out = self._stub.GetFieldDefinition(request)
@@ -382,6 +391,9 @@ class Field(_FieldBase):
         request.field_def.CopyFrom(field_definition._messageDefinition)
         request.field.CopyFrom(self._message)
         self._stub.UpdateFieldDefinition(request)
+        self._array_cache = None
+        if self._field_definition is not None:
+            self._field_definition._cache.clear()
 
     @property
     def field_definition(self):
@@ -482,70 +494,53 @@ class Field(_FieldBase):
     def __add__(self, field_b):
         """Add two fields.
 
+        The operator is only created on the server when it is used.
+
         Returns
         -------
         :class:`ansys.dpf.core.operators.math.add.add`
 
         """
-        from ansys.dpf.core import dpf_operator, operators
+        from ansys.dpf.core import dpf_operator
 
-        if hasattr(operators, "math") and hasattr(operators.math, "add"):
-            op = operators.math.add(server=self._server)
-        else:
-            op = dpf_operator.Operator("add", server=self._server)
-        op.connect(0, self)
-        op.connect(1, field_b)
-        return op
+        return dpf_operator._lazy_operator("add", [self, field_b], self._server)
 
     def __pow__(self, value):
         if value != 2:
             raise ValueError('Only the value "2" is supported.')
-        from ansys.dpf.core import dpf_operator, operators
+        from ansys.dpf.core import dpf_operator
 
-        if hasattr(operators, "math") and hasattr(operators.math, "sqr"):
-            op = operators.math.sqr(self, server=self._server)
-        else:
-            op = dpf_operator.Operator("sqr", server=self._server)
-            op.connect(0, self)
-        return op
+        return dpf_operator._lazy_operator("sqr", [self], self._server)
 
     def __mul__(self, value):
         """Multiplies two fields.
 
+        The operator is only created on the server when it is used.
+
         Returns
         -------
         :class:`ansys.dpf.core.operators.math.generalized_inner_product.generalized_inner_product`
 
         """
-        from ansys.dpf.core import dpf_operator, operators
+        from ansys.dpf.core import dpf_operator
 
-        if hasattr(operators, "math") and hasattr(
-            operators.math, "generalized_inner_product"
-        ):
-            op = operators.math.generalized_inner_product(server=self._server)
-        else:
-            op = dpf_operator.Operator("generalized_inner_product", server=self._server)
-        op.connect(0, self)
-        op.connect(1, value)
-        return op
+        return dpf_operator._lazy_operator(
+            "generalized_inner_product", [self, value], self._server
+        )
 
     def __sub__(self, fields_b):
         """Subtract two fields.
 
+        The operator is only created on the server when it is used.
+
         Returns
         -------
         :class:`ansys.dpf.core.operators.math.minus.minus`
 
         """
-        from ansys.dpf.core import dpf_operator, operators
+        from ansys.dpf.core import dpf_operator
 
-        if hasattr(operators, "math") and hasattr(operators.math, "minus"):
-            op = operators.math.minus(server=self._server)
-        else:
-            op = dpf_operator.Operator("minus", server=self._server)
-        op.connect(0, self)
-        op.connect(1, fields_b)
-        return op
+        return dpf_operator._lazy_operator("minus", [self, fields_b], self._server)
 
     def _min_max(self):
         from ansys.dpf.core import dpf_operator
@@ -611,7 +606,9 @@ class Field(_FieldBase):
             server=server,
         )
         f.scoping = self.scoping.deep_copy(server)
-        f.data = self.data
+        # the copy is not rounded to the precision of the transport
+        with transport.transport_policy(precision="double"):
+            f.data = self._get_data()
         f.unit = self.unit
         f.location = self.location
         f.field_definition = self.field_definition.deep_copy(server)
@@ -630,6 +627,45 @@ class Field(_FieldBase):
 
         return f
 
+    # operator name and kind of the inputs of the ufuncs evaluated on the server
+    _ufunc_operators = {
+        np.sqrt: ("sqrt", ("field",)),
+        np.square: ("sqr", ("field",)),
+        np.cos: ("cos", ("field",)),
+        np.sin: ("sin", ("field",)),
+        np.exp: ("exponential", ("field",)),
+        np.log: ("ln", ("field",)),
+        np.add: ("add", ("field", "field")),
+        np.subtract: ("minus", ("field", "field")),
+        np.multiply: ("scale", ("field", "scalar")),
+        np.power: ("pow", ("field", "scalar")),
+    }
+
+    def _server_function(self, func, args, kwargs):
+        # norm of the entities of a vector field
+        if (
+            func is np.linalg.norm
+            and len(args) == 1
+            and args[0] is self
+            and set(kwargs) <= {"axis"}
+            and kwargs.get("axis") in (-1, 1)
+            and self.component_count > 1
+        ):
+            return self._evaluate_operator("norm", [self])
+        return NotImplemented
+
+    _to_cache = {
+        _FieldBase._get_counts: [
+            _FieldBase._set_data,
+            _FieldBase._set_data_pointer,
+            _FieldBase._set_scoping,
+            _FieldBase.append,
+            resize,
+            _set_field_definition,
+        ],
+        _get_name: [_set_field_definition],
+    }
+
 
 class _LocalField(_LocalFieldBase, Field):
     """Caches the internal data of a field so that it can be modified locally.
@@ -4,6 +4,8 @@ from ansys.dpf.core.common import natures, locations
 from ansys.dpf.core import errors
 from ansys.dpf.core import server as serverlib
 from ansys.dpf.core.cache import _setter
+from ansys.dpf.core import release_queue
+from ansys.dpf.core import transport
 
 import numpy as np
 
@@ -58,6 +60,7 @@ class _FieldBase:
                 self._message = field
             else:
                 raise TypeError(f'Cannot create a field from a "{type(field)}" object')
+        release_queue._track(self)
 
     @property
     def shape(self):
@@ -94,10 +97,7 @@ class _FieldBase:
         int
             Number of components in each elementary data of the field.
         """
-        request = field_pb2.CountRequest()
-        request.entity = base_pb2.NUM_COMPONENT
-        request.field.CopyFrom(self._message)
-        return self._stub.Count(request).count
+        return self._get_counts()[1]
 
     @property
     def elementary_data_count(self):
@@ -109,10 +109,27 @@ class _FieldBase:
             Number of elementary data in the field.
 
         """
-        request = field_pb2.CountRequest()
-        request.entity = base_pb2.NUM_ELEMENTARY_DATA
-        request.field.CopyFrom(self._message)
-        return self._stub.Count(request).count
+        return self._get_counts()[0]
+
+    def _get_counts(self):
+        """Retrieve the number of elementary data and the number of components
+        of the field.
+
+        Both counts are requested at once so that ``shape`` and ``size`` only
+        cost one exchange with the server. Child classes can cache this method.
+
+        Returns
+        -------
+        counts : tuple
+            Number of elementary data and number of components.
+        """
+        futures = []
+        for entity in (base_pb2.NUM_ELEMENTARY_DATA, base_pb2.NUM_COMPONENT):
+            request = field_pb2.CountRequest()
+            request.entity = entity
+            request.field.CopyFrom(self._message)
+            futures.append(self._stub.Count.future(request))
+        return tuple(future.result().count for future in futures)
 
     @property
     def size(self):
@@ -156,12 +173,107 @@ class _FieldBase:
     def __len__(self):
         return self.size
 
+    # ufuncs evaluated by operators on the server, see ``__array_ufunc__``
+    _ufunc_operators = {}
+
+    def __array__(self, dtype=None, copy=None):
+        """Data of the field for NumPy, for example with ``numpy.asarray(field)``.
+
+        The data is transferred once and reused by the next conversions
+        until the field is modified through this object. The returned array
+        is read-only unless a copy is asked.
+        """
+        array = self._cached_array()
+        if dtype is not None and array.dtype != np.dtype(dtype):
+            return array.astype(dtype)
+        if copy:
+            return array.copy()
+        return array
+
+    def _cached_array(self):
+        if self._message.datatype == "int":
+            dtype = np.int32
+        else:
+            dtype = transport._policy(self._server).dtype
+        array = getattr(self, "_array_cache", None)
+        # the data is received again when the precision of the transport changed
+        if array is None or array.dtype != dtype:
+            array = self._get_data()
+            array.flags.writeable = False
+            self._array_cache = array
+        return array
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """Evaluate the ufuncs having an equivalent operator on the server,
+        without transferring the data, and the others on the data of the
+        fields."""
+        if method == "__call__" and not kwargs:
+            result = self._server_ufunc(ufunc, inputs)
+            if result is not NotImplemented:
+                return result
+        if any(isinstance(out, _FieldBase) for out in kwargs.get("out", ())):
+            return NotImplemented
+        inputs = tuple(
+            np.asarray(inpt) if isinstance(inpt, _FieldBase) else inpt
+            for inpt in inputs
+        )
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def __array_function__(self, func, types, args, kwargs):
+        """Evaluate the NumPy functions on the data of the fields."""
+        result = self._server_function(func, args, kwargs)
+        if result is not NotImplemented:
+            return result
+
+        def as_array(arg):
+            if isinstance(arg, _FieldBase):
+                return np.asarray(arg)
+            elif isinstance(arg, (list, tuple)):
+                return type(arg)(as_array(a) for a in arg)
+            return arg
+
+        return func(*as_array(args), **{k: as_array(v) for k, v in kwargs.items()})
+
+    def _server_ufunc(self, ufunc, inputs):
+        """Output of the operator equivalent to a ufunc or ``NotImplemented``."""
+        entry = self._ufunc_operators.get(ufunc)
+        if entry is None:
+            return NotImplemented
+        name, pins = entry
+        if len(inputs) != len(pins) or not isinstance(inputs[0], _FieldBase):
+            return NotImplemented
+        for inpt, kind in zip(inputs[1:], pins[1:]):
+            if kind == "scalar" and not isinstance(inpt, (int, float)):
+                return NotImplemented
+            if kind == "field" and not (
+                isinstance(inpt, (int, float))
+                or (isinstance(inpt, _FieldBase) and inpt._server is self._server)
+            ):
+                return NotImplemented
+        # the scalar pins of the operators expect doubles
+        inputs = tuple(
+            float(inpt) if isinstance(inpt, int) else inpt for inpt in inputs
+        )
+        return self._evaluate_operator(name, inputs)
+
+    def _server_function(self, func, args, kwargs):
+        """Output of the operator equivalent to a NumPy function or
+        ``NotImplemented``."""
+        return NotImplemented
+
+    def _evaluate_operator(self, name, inputs):
+        from ansys.dpf.core import dpf_operator
+        from ansys.dpf.core.common import types
+
+        op = dpf_operator._lazy_operator(name, inputs, self._server)
+        return op.get_output(0, types.field)
+
     def _del_scoping(self, scope):
         scope.__del__()
 
     def __del__(self):
         try:
-            self._stub.Delete(self._message)
+            release_queue._release(self, self._stub.Delete, self._message)
         except:
             pass
 
@@ -181,6 +293,7 @@ class _FieldBase:
         request.scoping.CopyFrom(scoping._message)
         request.field.CopyFrom(self._message)
         self._stub.UpdateScoping(request)
+        self._array_cache = None
 
     def _get_scoping(self):
         """Retrieve the scoping.
@@ -265,12 +378,15 @@ class _FieldBase:
         request = field_pb2.GetElementaryDataRequest()
         request.field.CopyFrom(self._message)
         request.index = index
+        precision = transport._policy(self._server).precision
         list_message = self._stub.GetElementaryData(
-            request, metadata=[(b"float_or_double", b"double")]
+            request, metadata=[(b"float_or_double", precision.encode())]
         )
         data = []
         if list_message.elemdata_containers.data.HasField("datadouble"):
             data = list_message.elemdata_containers.data.datadouble.rep_double
+        elif list_message.elemdata_containers.data.HasField("datafloat"):
+            data = list_message.elemdata_containers.data.datafloat.rep_float
         elif list_message.elemdata_containers.data.HasField("dataint"):
             data = list_message.elemdata_containers.data.dataint.rep_int
 
@@ -358,6 +474,8 @@ class _FieldBase:
 
         request.field.CopyFrom(self._message)
         self._stub.AddData(request)
+        self._data_future = None
+        self._array_cache = None
 
     @property
     def _data_pointer(self):
@@ -404,17 +522,21 @@ class _FieldBase:
         self._set_data_pointer(data)
 
     def _set_data_pointer(self, data):
+        self._array_cache = None
+        # arrays already matching the transfer layout are sent without any copy
         if isinstance(data, (np.ndarray, np.generic)):
-            data = np.array(data.reshape(data.size), dtype=np.int32)
+            data = np.ascontiguousarray(data.reshape(data.size), dtype=np.int32)
         else:
-            data = np.array(data, dtype=np.int32)
+            data = np.asarray(data, dtype=np.int32)
         if data.size == 0:
             return
         metadata = [("size_int", f"{len(data)}")]
         request = field_pb2.UpdateDataRequest()
         request.field.CopyFrom(self._message)
         self._stub.UpdateDataPointer(
-            scoping._data_chunk_yielder(request, data), metadata=metadata
+            scoping._data_chunk_yielder(request, data),
+            metadata=metadata,
+            compression=transport._policy(self._server).grpc_compression,
         )
 
     @property
@@ -430,8 +552,67 @@ class _FieldBase:
         -----
         Print a progress bar.
         """
+        future = getattr(self, "_data_future", None)
+        if future is not None:
+            self._data_future = None
+            return future.result()
         return self._get_data()
 
+    @property
+    def data_async(self):
+        """Awaitable retrieving the data in the field as an array without
+        blocking the event loop.
+
+        The data is streamed in a thread of the default executor of the
+        event loop.
+
+        Returns
+        -------
+        asyncio.Future
+            Future of the data in the field as a ``numpy.ndarray``.
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> from ansys.dpf import core as dpf
+        >>> field = dpf.fields_factory.create_3d_vector_field(2)
+        >>> field.data = [1., 2., 3., 4., 5., 6.]
+        >>> async def get_data():
+        ...     return await field.data_async
+        >>> data = asyncio.run(get_data())
+
+        """
+        import asyncio
+
+        return asyncio.get_running_loop().run_in_executor(None, self._get_data)
+
+    async def set_data_async(self, data):
+        """Set the data in the field without blocking the event loop.
+
+        The data is streamed in a thread of the default executor of the
+        event loop.
+
+        Parameters
+        ----------
+        data : numpy.ndarray, list
+            Data to set in the field.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._set_data, data)
+
+    def _prefetch_data(self, executor):
+        """Start retrieving the data with an executor.
+
+        The next call to ``data`` returns the retrieved data.
+
+        Parameters
+        ----------
+        executor : concurrent.futures.Executor
+        """
+        self._data_future = executor.submit(self._get_data)
+
     @property
     def data_as_list(self):
         """Data in the field as a Python list.
@@ -466,8 +647,10 @@ class _FieldBase:
             data_type = "int"
             dtype = np.int32
         else:
-            data_type = "double"
-            dtype = np.float
+            # the values are received in the precision of the transport
+            policy = transport._policy(self._server)
+            data_type = policy.precision
+            dtype = policy.dtype
         service = self._stub.List(request, metadata=[("float_or_double", data_type)])
         array = scoping._data_get_chunk_(dtype, service, np_array)
 
@@ -482,11 +665,14 @@ class _FieldBase:
         self._set_data(data)
 
     def _set_data(self, data):
+        self._data_future = None
+        self._array_cache = None
         if self._message.datatype == "int":
             if not isinstance(data[0], int) and not isinstance(data[0], np.int32):
                 raise errors.InvalidTypeError("data", "list of int")
-            data = np.array(data, dtype=np.int32)
+            data = np.asarray(data, dtype=np.int32)
             metadata = [("size_int", f"{len(data)}")]
+            compression = transport._policy(self._server).grpc_compression
         else:
             if isinstance(data, (np.ndarray, np.generic)):
                 if (
@@ -500,14 +686,19 @@ class _FieldBase:
                         f"shape {data.shape} was input"
                     )
                 else:
-                    data = np.array(data.reshape(data.size), dtype=float)
+                    # reshape and dtype conversion only copy when required
+                    data = np.ascontiguousarray(data.reshape(data.size), dtype=float)
             else:
-                data = np.array(data, dtype=float)
+                data = np.asarray(data, dtype=float)
             metadata = [("float_or_double", "double"), ("size_double", f"{len(data)}")]
+            # doubles hardly compress, only the integer streams are compressed
+            compression = None
         request = field_pb2.UpdateDataRequest()
         request.field.CopyFrom(self._message)
         self._stub.UpdateData(
-            scoping._data_chunk_yielder(request, data), metadata=metadata
+            scoping._data_chunk_yielder(request, data),
+            metadata=metadata,
+            compression=compression,
         )
 
 
@@ -533,12 +724,36 @@ class _LocalFieldBase(_FieldBase):
 
     def __cache_data__(self):
         self._ncomp = super().component_count
-        self._data_copy = super().data_as_list
+        self._dtype = np.int32 if self._is_property_field else np.float64
+        # the local data is sent back to the server, it is not rounded to the
+        # precision of the transport
+        with transport.transport_policy(precision="double"):
+            data = super()._get_data(np_array=True)
+        self._data_copy = scoping._GrowableArray(data, dtype=self._dtype)
         self._num_entities_reserved = len(self._data_copy)
-        self._data_pointer_copy = super()._data_pointer_as_list
+        self._data_pointer_copy = scoping._GrowableArray(
+            super()._data_pointer, dtype=np.int32
+        )
         self._scoping_copy = super().scoping.as_local_scoping()
         self._has_data_pointer = len(self._data_pointer_copy) > 0
 
+    def _as_flat_data(self, data):
+        """Entity data as a flat array of the type of the field."""
+        if self._is_property_field:
+            array = np.asarray(data)
+            if array.size > 0 and not np.issubdtype(array.dtype, np.integer):
+                raise errors.InvalidTypeError("data", "list of int")
+        return np.asarray(data, dtype=self._dtype).reshape(-1)
+
+    def _build_data_pointer(self):
+        """Create the data pointer of the entities which all have
+        ``component_count`` values."""
+        self._data_pointer_copy = scoping._GrowableArray(
+            np.arange(self._num_entities, dtype=np.int32) * self._ncomp,
+            dtype=np.int32,
+        )
+        self._has_data_pointer = True
+
     @property
     def _num_entities(self):
         return len(self._scoping_copy)
@@ -607,12 +822,7 @@ class _LocalFieldBase(_FieldBase):
         else:
             first_index = self._ncomp * index
             last_index = self._ncomp * (index + 1) - 1
-        if self._is_property_field:
-            array = np.array(
-                self._data_copy[first_index: last_index + 1], dtype=np.int32
-            )
-        else:
-            array = np.array(self._data_copy[first_index: last_index + 1])
+        array = self._data_copy[first_index: last_index + 1].copy()
 
         if self._ncomp > 1:
             return array.reshape((array.size // self._ncomp, self._ncomp))
@@ -684,15 +894,7 @@ class _LocalFieldBase(_FieldBase):
         ...         f.append([[0.1*i,0.2*i, 0.3*i],[0.1*i,0.2*i, 0.3*i]],i)
 
         """
-        if self._is_property_field:
-            if isinstance(data[0], np.int64):
-                data = np.array(data, dtype=np.int32)
-            if not isinstance(data[0], int) and not isinstance(data[0], np.int32):
-                raise errors.InvalidTypeError("data", "list of int")
-        if (len(data) > 0 and isinstance(data, list)) or isinstance(
-                data, (np.ndarray, np.generic)
-        ):
-            data = np.array(data).flatten().tolist()
+        data = self._as_flat_data(data)
 
         data_size = len(self._data_copy)
         self._scoping_copy.append(scopingid)
@@ -700,16 +902,64 @@ class _LocalFieldBase(_FieldBase):
             self._data_pointer_copy.append(data_size)
 
         self._data_copy.extend(data)
-        if self._has_data_pointer == False:
-            if isinstance(data, (np.ndarray, np.generic)):
-                data_size = data.size
-            else:
-                data_size = len(data)
-            if data_size > self._ncomp:
-                self._data_pointer_copy = [
-                    i * self._ncomp for i in range(0, self._num_entities)
-                ]
-                self._has_data_pointer = True
+        if self._has_data_pointer == False and data.size > self._ncomp:
+            self._build_data_pointer()
+
+    @_setter
+    def append_many(self, ids, data):
+        """Add the data of several entities to the existing data.
+
+        Parameters
+        ----------
+        ids : list of int, numpy.ndarray
+            IDs of the scoping of the entities.
+        data : numpy.ndarray, list
+            Data of the entities. Either an array whose size is a multiple of
+            the number of IDs, each entity having the same number of values,
+            or a list with one array or list per entity.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> import numpy as np
+        >>> num_entities = 100
+        >>> field_to_local = dpf.fields_factory.create_3d_vector_field(num_entities)
+        >>> with field_to_local.as_local_field() as f:
+        ...     f.append_many(np.arange(1, num_entities + 1), np.ones((num_entities, 3)))
+
+        """
+        ids = np.asarray(ids, dtype=np.int32).reshape(-1)
+        if ids.size == 0:
+            return
+        try:
+            values = self._as_flat_data(data)
+            sizes = None
+        except ValueError:
+            # one array of a different size per entity
+            if len(data) != ids.size:
+                raise ValueError(
+                    f"{ids.size} entities are expected and {len(data)} were input"
+                )
+            entities = [self._as_flat_data(d) for d in data]
+            sizes = np.array([e.size for e in entities], dtype=np.int32)
+            values = np.concatenate(entities) if entities else values
+        if sizes is None:
+            if values.size % ids.size != 0:
+                raise ValueError(
+                    f"{values.size} values cannot be split between {ids.size} entities"
+                )
+            sizes = np.full(ids.size, values.size // ids.size, dtype=np.int32)
+
+        if not self._has_data_pointer and (sizes != self._ncomp).any():
+            self._build_data_pointer()
+        if len(self._data_pointer_copy) > 0:
+            offsets = np.empty(ids.size, dtype=np.int32)
+            offsets[0] = len(self._data_copy)
+            np.cumsum(sizes[:-1], out=offsets[1:])
+            offsets[1:] += offsets[0]
+            self._data_pointer_copy.extend(offsets)
+        self._scoping_copy.append_many(ids)
+        self._data_copy.extend(values)
 
     def data_as_list(self):
         """Retrieve the data in the field as a Python list.
@@ -732,7 +982,19 @@ class _LocalFieldBase(_FieldBase):
         ...     my_data_list = f.data_as_list
 
         """
-        return self._data_copy
+        return self._data_copy.tolist()
+
+    # the server does not know the local modifications
+    _ufunc_operators = {}
+
+    def _server_function(self, func, args, kwargs):
+        return NotImplemented
+
+    def _cached_array(self):
+        # the data is already local
+        array = self.data
+        array.flags.writeable = False
+        return array
 
     @property
     def data(self):
@@ -763,12 +1025,11 @@ class _LocalFieldBase(_FieldBase):
 
         """
 
+        array = self._data_copy.copy()
         if self._ncomp > 1:
-            return np.array(self._data_copy).reshape(
-                len(self._data_copy) // self._ncomp, self._ncomp
-            )
+            return array.reshape(array.size // self._ncomp, self._ncomp)
         else:
-            return np.array(self._data_copy)
+            return array
 
     @data.setter
     @_setter
@@ -783,12 +1044,32 @@ class _LocalFieldBase(_FieldBase):
                         f"An array of shape {self.shape} is expected and "
                         f"shape {data.shape} was input"
                     )
-        if isinstance(data, (np.ndarray, np.generic)):
-            self._data_copy = data.flatten().tolist()
-        elif len(data) > 0 and isinstance(data, list):
-            self._data_copy = np.array(data).flatten().tolist()
-        else:
-            self._data_copy = data
+        self._data_copy = scoping._GrowableArray(data, dtype=self._dtype)
+
+    @property
+    def data_async(self):
+        """Awaitable returning the local data in the field.
+
+        Returns
+        -------
+        asyncio.Future
+            Future of the data in the field as a ``numpy.ndarray``.
+        """
+        import asyncio
+
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(self.data)
+        return future
+
+    async def set_data_async(self, data):
+        """Set the local data in the field.
+
+        Parameters
+        ----------
+        data : numpy.ndarray, list
+            Data to set in the field.
+        """
+        self.data = data
 
     @property
     def elementary_data_count(self):
@@ -826,7 +1107,7 @@ class _LocalFieldBase(_FieldBase):
         numpy.ndarray
             Array of first indexes of each entity data.
         """
-        return np.array(self._data_pointer_copy)
+        return self._data_pointer_copy.copy()
 
     @property
     def _data_pointer_as_list(self):
@@ -837,15 +1118,12 @@ class _LocalFieldBase(_FieldBase):
         List
             List of first indexes of each entity data.
         """
-        return self._data_pointer_copy
+        return self._data_pointer_copy.tolist()
 
     @_data_pointer.setter
     @_setter
     def _data_pointer(self, data):
-        if isinstance(data, (np.ndarray, np.generic)):
-            self._data_pointer_copy = data.tolist()
-        else:
-            self._data_pointer_copy = data
+        self._data_pointer_copy = scoping._GrowableArray(data, dtype=np.int32)
         if self._has_data_pointer == False and len(data) > 0:
             self._has_data_pointer = True
 
@@ -887,10 +1165,12 @@ class _LocalFieldBase(_FieldBase):
     def release_data(self):
         """Release the data."""
         if hasattr(self, "_is_set") and self._is_set:
-            super()._set_data(self._data_copy)
-            super()._set_data_pointer(self._data_pointer_copy)
+            super()._set_data(self._data_copy.array)
+            super()._set_data_pointer(self._data_pointer_copy.array)
             super()._set_scoping(self._scoping_copy._owner_scoping)
             self._scoping_copy.release_data()
+            if hasattr(self._owner_field, "_cache"):
+                self._owner_field._cache.clear()
 
     def __enter__(self):
         return self
@@ -7,8 +7,11 @@ from ansys import dpf
 from ansys.grpc.dpf import base_pb2, field_definition_pb2, field_definition_pb2_grpc
 from ansys.dpf.core.common import natures, shell_layers
 from ansys.dpf.core.dimensionality import Dimensionality
+from ansys.dpf.core.cache import class_handling_cache
+from ansys.dpf.core import release_queue
 
 
+@class_handling_cache
 class FieldDefinition:
     """Contains the physical and mathematical description of the field.
 
@@ -33,6 +36,7 @@ class FieldDefinition:
         else:
             request = base_pb2.Empty()
             self._messageDefinition = self._stub.Create(request)
+        release_queue._track(self)
 
     @property
     def location(self):
@@ -44,7 +48,7 @@ class FieldDefinition:
             Location string, such as ``"Nodal"``, ``"Elemental"``,
             or ``"TimeFreq_sets"``.
         """
-        out = self._stub.List(self._messageDefinition)
+        out = self._get_list()
         return out.location.location
 
     @property
@@ -56,7 +60,7 @@ class FieldDefinition:
         str
             Units of the field.
         """
-        return self._stub.List(self._messageDefinition).unit.symbol
+        return self._get_list().unit.symbol
 
     @property
     def shell_layers(self):
@@ -67,7 +71,7 @@ class FieldDefinition:
         shell_layers : shell_layers
             ``LayerIndependent`` is returned for fields unrelated to layers.
         """
-        enum_val = self._stub.List(self._messageDefinition).shell_layers
+        enum_val = self._get_list().shell_layers
         return shell_layers(
             enum_val.real - 1
         )  # +1 is added to the proto enum to have notset as 0
@@ -81,9 +85,7 @@ class FieldDefinition:
         dimensionality : Dimensionality
             Nature and size of the elementary data.
         """
-        val = self._stub.List(
-            self._messageDefinition
-        ).dimensionnality  # typo exists on server side
+        val = self._get_list().dimensionnality  # typo exists on server side
         return Dimensionality(val.size, natures(val.nature.real))
 
     @unit.setter
@@ -102,8 +104,12 @@ class FieldDefinition:
     def dimensionality(self, value):
         self._modify_field_def(dimensionality=value)
 
+    def _get_list(self):
+        return self._stub.List(self._messageDefinition)
+
     def _modify_field_def(
-        self, unit=None, location=None, dimensionality=None, shell_layer=None
+        self, unit=None, location=None, dimensionality=None, shell_layer=None,
+        name=None,
     ):
         request = field_definition_pb2.FieldDefinitionUpdateRequest()
         request.field_definition.CopyFrom(self._messageDefinition)
@@ -122,6 +128,8 @@ class FieldDefinition:
                 request.shell_layers = shell_layer.value + 1
             else:
                 request.shell_layers = shell_layer + 1
+        if name != None:
+            request.name.string = name
         self._stub.Update(request)
 
     def deep_copy(self, server=None):
@@ -142,10 +150,12 @@ class FieldDefinition:
 
     def __del__(self):
         try:
-            self._stub.Delete(self._messageDefinition)
+            release_queue._release(self, self._stub.Delete, self._messageDefinition)
         except:
             pass
 
     def _connect(self, channel):
         """Connect to the gRPC service."""
         return field_definition_pb2_grpc.FieldDefinitionServiceStub(channel)
+
+    _to_cache = {_get_list: [_modify_field_def]}
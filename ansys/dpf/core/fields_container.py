@@ -489,71 +489,47 @@ class FieldsContainer(Collection):
     def __add__(self, fields_b):
         """Add two fields or two fields containers.
 
+        The operator is only created on the server when it is used.
+
         Returns
         -------
         add : operators.math.add_fc
         """
         from ansys.dpf.core import dpf_operator
-        from ansys.dpf.core import operators
 
-        if hasattr(operators, "math") and hasattr(operators.math, "add_fc"):
-            op = operators.math.add_fc(self, fields_b, server=self._server)
-        else:
-            op = dpf_operator.Operator("add_fc", server=self._server)
-            op.connect(0, self)
-            op.connect(1, fields_b)
-        return op
+        return dpf_operator._lazy_operator("add_fc", [self, fields_b], self._server)
 
     def __sub__(self, fields_b):
         """Subtract two fields or two fields containers.
 
+        The operator is only created on the server when it is used.
+
         Returns
         -------
         minus : operators.math.minus_fc
         """
         from ansys.dpf.core import dpf_operator
-        from ansys.dpf.core import operators
 
-        if hasattr(operators, "math") and hasattr(operators.math, "minus_fc"):
-            op = operators.math.minus_fc(server=self._server)
-        else:
-            op = dpf_operator.Operator("minus_fc", server=self._server)
-        op.connect(0, self)
-        op.connect(1, fields_b)
-        return op
+        return dpf_operator._lazy_operator("minus_fc", [self, fields_b], self._server)
 
     def __pow__(self, value):
         if value != 2:
             raise ValueError('DPF only the value is "2" supported')
         from ansys.dpf.core import dpf_operator
-        from ansys.dpf.core import operators
 
-        if hasattr(operators, "math") and hasattr(operators.math, "sqr_fc"):
-            op = operators.math.sqr_fc(server=self._server)
-        else:
-            op = dpf_operator.Operator("sqr_fc", server=self._server)
-        op.connect(0, self)
-        op.connect(1, value)
-        return op
+        return dpf_operator._lazy_operator("sqr_fc", [self, value], self._server)
 
     def __mul__(self, value):
         """Multiply two fields or two fields containers.
 
+        The operator is only created on the server when it is used.
+
         Returns
         -------
         mul : operators.math.generalized_inner_product_fc
         """
         from ansys.dpf.core import dpf_operator
-        from ansys.dpf.core import operators
 
-        if hasattr(operators, "math") and hasattr(
-            operators.math, "generalized_inner_product_fc"
-        ):
-            op = operators.math.generalized_inner_product_fc(server=self._server)
-        else:
-            op = dpf_operator.Operator(
-                "generalized_inner_product_fc", server=self._server
-            )
-        op.connect(0, self)
-        op.connect(1, value)
-        return op
+        return dpf_operator._lazy_operator(
+            "generalized_inner_product_fc", [self, value], self._server
+        )
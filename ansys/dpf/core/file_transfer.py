@@ -0,0 +1,435 @@
+"""
+.. _ref_file_transfer:
+
+FileTransferManager
+===================
+Transfers files between the client and the server, several files at a time,
+optionally without sending again the files already uploaded with the same
+content.
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+import weakref
+from concurrent import futures
+
+import grpc
+from ansys.grpc.dpf import base_pb2, base_pb2_grpc
+
+from ansys.dpf.core import misc
+from ansys.dpf.core import server as serverlib
+from ansys.dpf.core.common import _common_progress_bar
+from ansys.dpf.core.errors import protect_grpc
+
+LOG = logging.getLogger(__name__)
+
+# status codes of the interrupted transfers, which are retried
+_RETRIED_CODES = (
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.ABORTED,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+)
+
+# files of more KB than this show a progress bar
+_PROGRESS_BAR_SIZE = 10000
+
+
+class _Upload:
+    """Content of a file uploaded to a server."""
+
+    __slots__ = ("client_path", "size", "mtime", "digest", "server_path")
+
+    def __init__(self, client_path, size, mtime, digest, server_path):
+        self.client_path = client_path
+        self.size = size
+        self.mtime = mtime
+        self.digest = digest
+        self.server_path = server_path
+
+
+class TransferReport:
+    """Summary of the files transferred by a :class:`FileTransferManager`.
+
+    Attributes
+    ----------
+    paths : list[str]
+        Paths of the files on the target side, in the order of the request.
+    transferred : list[str]
+        Paths of the files which were sent.
+    skipped : list[str]
+        Paths of the files which were not sent because the target already
+        held the same content.
+    nbytes : int
+        Number of bytes sent.
+    elapsed : float
+        Duration of the transfer in seconds.
+    """
+
+    def __init__(self):
+        self.paths = []
+        self.transferred = []
+        self.skipped = []
+        self.nbytes = 0
+        self.elapsed = 0.0
+
+    @property
+    def throughput(self):
+        """Throughput of the transfer in MB/s, ``None`` when nothing was
+        sent.
+
+        Returns
+        -------
+        float
+        """
+        if not self.nbytes or not self.elapsed:
+            return None
+        return self.nbytes / self.elapsed / 1e6
+
+    def __repr__(self):
+        throughput = self.throughput
+        throughput = f"{throughput:.1f} MB/s" if throughput else "-"
+        return (
+            f"TransferReport(transferred={len(self.transferred)}, "
+            f"skipped={len(self.skipped)}, nbytes={self.nbytes}, "
+            f"elapsed={self.elapsed:.3f}s, throughput={throughput})"
+        )
+
+
+class FileTransferManager:
+    """Uploads and downloads files, several files at a time.
+
+    The uploaded files are hashed while they are sent. With
+    ``skip_unchanged=True``, a file uploaded again to the same server path
+    with the same content is not sent another time, which saves the upload
+    of unchanged result files to the temporary folder of a remote server. A
+    file is considered unchanged without being hashed again when its path,
+    size and modification time are the ones of the previous upload. The
+    file on the server side is assumed to be untouched since the previous
+    upload, see :func:`FileTransferManager.forget_uploads`.
+
+    The transfers interrupted by the network are retried. The protocol of
+    the server has no offset, so an upload restarts from the first chunk.
+    A download is written in a ``.part`` file which is renamed once the
+    file is complete, and a retried download appends the chunks which were
+    not written yet.
+
+    Parameters
+    ----------
+    server : server.DPFServer, optional
+        Server with channel connected to the remote or local instance. The
+        default is ``None``, in which case an attempt is made to use the
+        global server.
+    max_workers : int, optional
+        Number of files transferred at the same time. The default is ``4``.
+    retries : int, optional
+        Number of times an interrupted transfer is retried. The default is
+        ``3``.
+    skip_unchanged : bool, optional
+        Whether the files already uploaded to the server with the same
+        content are skipped. The default is ``False``, in which case the
+        files are sent every time.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> from ansys.dpf.core.file_transfer import FileTransferManager
+    >>> manager = FileTransferManager(skip_unchanged=True)
+    >>> report = manager.upload_files(
+    ...     [examples.static_rst, examples.simple_bar], use_tmp_dir=True
+    ... )
+    >>> report = manager.upload_files(
+    ...     [examples.static_rst, examples.simple_bar], use_tmp_dir=True
+    ... )
+    >>> len(report.skipped)
+    2
+
+    """
+
+    def __init__(self, server=None, max_workers=4, retries=3, skip_unchanged=False):
+        if server is None:
+            server = serverlib._global_server()
+        self._server = weakref.ref(server)
+        self._stub = base_pb2_grpc.BaseServiceStub(server.channel)
+        self.max_workers = max_workers
+        self.retries = retries
+        self.skip_unchanged = skip_unchanged
+        self._bar = None
+        self._bar_lock = threading.Lock()
+        self._sent = 0
+
+    @protect_grpc
+    def upload_files(self, files, use_tmp_dir=False):
+        """Upload files to the server.
+
+        Parameters
+        ----------
+        files : list[str], list[tuple(str, str)], dict
+            Paths of the files on the client side, pairs of client and
+            server paths, or dictionary of the server paths by client path.
+            When only the client path is given, the file keeps its name on
+            the server side.
+        use_tmp_dir : bool, optional
+            Whether the server paths are relative to the temporary folder of
+            the server. The default is ``False``.
+
+        Returns
+        -------
+        TransferReport
+            ``paths`` holds the paths generated server side.
+        """
+        if isinstance(files, dict):
+            files = list(files.items())
+        files = [
+            (f, os.path.basename(f)) if isinstance(f, (str, os.PathLike)) else tuple(f)
+            for f in files
+        ]
+        for client_path, _ in files:
+            if os.stat(client_path).st_size == 0:
+                raise ValueError(f"{client_path} is empty")
+        return self._run(
+            self._upload,
+            [(str(c), str(s), use_tmp_dir) for c, s in files],
+            sum(os.path.getsize(c) for c, _ in files),
+            "Uploading...",
+        )
+
+    def upload_folder(self, client_folder_path, to_server_folder_path, specific_extension=None):
+        """Upload the files of a client folder and of its direct subfolders
+        to a server folder.
+
+        Parameters
+        ----------
+        client_folder_path : str
+            Folder path where the files to upload are located on the client
+            side.
+        to_server_folder_path : str
+            Folder path where the files are uploaded on the server side.
+        specific_extension : str, optional
+            Uploads only the files with the given extension. The default is
+            ``None``, in which case all the files are uploaded.
+
+        Returns
+        -------
+        TransferReport
+            ``paths`` holds the paths generated server side.
+        """
+        separator = _separator(to_server_folder_path)
+        files = []
+        for root, subdirectories, filenames in os.walk(client_folder_path):
+            for subdirectory in subdirectories:
+                subdir = os.path.join(root, subdirectory)
+                for filename in os.listdir(subdir):
+                    files.append(
+                        (
+                            os.path.join(subdir, filename),
+                            to_server_folder_path + separator + subdirectory
+                            + separator + filename,
+                        )
+                    )
+            for filename in filenames:
+                files.append(
+                    (
+                        os.path.join(root, filename),
+                        to_server_folder_path + separator + filename,
+                    )
+                )
+            break
+        if specific_extension is not None:
+            files = [f for f in files if f[0].endswith(specific_extension)]
+        uploaded = []
+        for client_path, server_path in files:
+            if not os.path.isfile(client_path):
+                continue
+            if os.path.getsize(client_path) == 0:
+                LOG.warning(f"{client_path} is empty and is not uploaded.")
+                continue
+            uploaded.append((client_path, server_path))
+        return self.upload_files(uploaded)
+
+    @protect_grpc
+    def download_files(self, files):
+        """Download files from the server.
+
+        Parameters
+        ----------
+        files : list[tuple(str, str)], dict
+            Pairs of server and client paths, or dictionary of the client
+            paths by server path.
+
+        Returns
+        -------
+        TransferReport
+            ``paths`` holds the paths of the files on the client side.
+        """
+        if isinstance(files, dict):
+            files = list(files.items())
+        return self._run(
+            self._download, [(str(s), str(c)) for s, c in files], None, "Downloading..."
+        )
+
+    def forget_uploads(self):
+        """Forget the files uploaded to the server, so that they are sent
+        again by the next uploads skipping the unchanged files, for example
+        after deleting them on the server side."""
+        self._server()._uploads.clear()
+
+    def _uploads(self):
+        # the records are kept by the server instance: a new server started
+        # on the same address does not hold the files
+        return self._server()._uploads
+
+    def _run(self, transfer, tasks, tot_size, text):
+        report = TransferReport()
+        self._sent = 0
+        self._bar = None
+        if tot_size is not None and tot_size * 1e-3 > _PROGRESS_BAR_SIZE:
+            self._bar = _common_progress_bar(text, "KB", tot_size * 1e-3)
+            self._bar.start()
+        tstart = time.time()
+        if len(tasks) == 1 or self.max_workers <= 1:
+            results = [transfer(*task) for task in tasks]
+        else:
+            with futures.ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(tasks)),
+                thread_name_prefix="dpf-transfer",
+            ) as executor:
+                pending = [executor.submit(transfer, *task) for task in tasks]
+            results = [future.result() for future in pending]
+        report.elapsed = time.time() - tstart
+        if self._bar is not None:
+            try:
+                self._bar.finish()
+            except:
+                pass
+            self._bar = None
+        for path, nbytes in results:
+            report.paths.append(path)
+            if nbytes is None:
+                report.skipped.append(path)
+            else:
+                report.transferred.append(path)
+                report.nbytes += nbytes
+        return report
+
+    def _progress(self, nbytes):
+        with self._bar_lock:
+            self._sent += nbytes
+            if self._bar is not None:
+                try:
+                    self._bar.update(min(self._sent * 1e-3, self._bar.max_value))
+                except:
+                    pass
+
+    def _retry(self, error, attempt, path):
+        if attempt >= self.retries or error.code() not in _RETRIED_CODES:
+            return False
+        LOG.warning(f"Transfer of {path} interrupted ({error.code()}), retrying.")
+        return True
+
+    def _upload(self, client_path, to_server_file_path, use_tmp_dir):
+        """Upload a file, unless the server already holds its content and
+        the unchanged files are skipped. Returns the server path and the
+        number of bytes sent, ``None`` when the file was skipped."""
+        key = (use_tmp_dir, to_server_file_path)
+        stat = os.stat(client_path)
+        previous = self._uploads().get(key) if self.skip_unchanged else None
+        if previous is not None and previous.size == stat.st_size:
+            if previous.client_path == client_path and previous.mtime == stat.st_mtime_ns:
+                digest = previous.digest
+            else:
+                digest = _file_digest(client_path)
+            if digest == previous.digest:
+                self._progress(stat.st_size)
+                return previous.server_path, None
+
+        attempt = 0
+        while True:
+            digest = hashlib.sha256()
+            sent = [0]
+            try:
+                server_path = self._stub.UploadFile(
+                    self._file_chunk_yielder(
+                        client_path, to_server_file_path, use_tmp_dir, digest, sent
+                    )
+                ).server_file_path
+                break
+            except grpc.RpcError as error:
+                # the upload restarts from the first chunk
+                self._progress(-sent[0])
+                if not self._retry(error, attempt, client_path):
+                    raise
+                attempt += 1
+        self._uploads()[key] = _Upload(
+            client_path, stat.st_size, stat.st_mtime_ns, digest.hexdigest(), server_path
+        )
+        return server_path, stat.st_size
+
+    def _file_chunk_yielder(
+        self, file_path, to_server_file_path, use_tmp_dir, digest, sent
+    ):
+        request = base_pb2.UploadFileRequest()
+        request.server_file_path = to_server_file_path
+        request.use_temp_dir = use_tmp_dir
+        with open(file_path, "rb") as f:
+            while True:
+                piece = f.read(misc.DEFAULT_FILE_CHUNK_SIZE)
+                if len(piece) == 0:
+                    break
+                digest.update(piece)
+                request.data.data = piece
+                yield request
+                sent[0] += len(piece)
+                self._progress(len(piece))
+
+    def _download(self, server_file_path, to_client_file_path):
+        """Download a file in a ``.part`` file renamed once complete.
+        Returns the client path and the number of bytes received."""
+        part_path = to_client_file_path + ".part"
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        request = base_pb2.DownloadFileRequest()
+        request.server_file_path = server_file_path
+        attempt = 0
+        while True:
+            # bytes written by the previous attempts
+            written = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            received = 0
+            try:
+                with open(part_path, "ab") as f:
+                    for chunk in self._stub.DownloadFile(request):
+                        data = chunk.data.data
+                        start = received
+                        received += len(data)
+                        if received <= written:
+                            continue
+                        f.write(memoryview(data)[max(written - start, 0):])
+                        self._progress(received - max(written, start))
+                break
+            except grpc.RpcError as error:
+                if not self._retry(error, attempt, server_file_path):
+                    if os.path.exists(part_path):
+                        os.remove(part_path)
+                    raise
+                attempt += 1
+        os.replace(part_path, to_client_file_path)
+        return to_client_file_path, received
+
+
+def _separator(path):
+    """Separator of the folders of a server path."""
+    return "\\" if len(path.split("\\")) > len(path.split("/")) else "/"
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            piece = f.read(misc.DEFAULT_FILE_CHUNK_SIZE)
+            if len(piece) == 0:
+                break
+            digest.update(piece)
+    return digest.hexdigest()
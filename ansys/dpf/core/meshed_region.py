@@ -10,6 +10,7 @@ from ansys.dpf.core.elements import Elements, element_types
 from ansys.dpf.core.nodes import Nodes
 from ansys.dpf.core.plotter import Plotter as _DpfPlotter
 from ansys.dpf.core.cache import class_handling_cache
+from ansys.dpf.core import release_queue
 from ansys.grpc.dpf import meshed_region_pb2, meshed_region_pb2_grpc
 
 @class_handling_cache
@@ -89,6 +90,7 @@ class MeshedRegion:
         self._full_grid = None
         self._elements = None
         self._nodes = None
+        release_queue._track(self)
 
     def _get_scoping(self, loc=locations.nodal):
         """
@@ -200,7 +202,7 @@ class MeshedRegion:
 
     def __del__(self):
         try:
-            self._stub.Delete(self._message)
+            release_queue._release(self, self._stub.Delete, self._message)
         except:
             pass
 
@@ -6,6 +6,12 @@ from pkgutil import iter_modules
 
 
 DEFAULT_FILE_CHUNK_SIZE = 524288
+# number of values per message sent to the servers older than 2.1: 8e6 bytes
+# were divided by the 28 bytes of a boxed numpy scalar
+LEGACY_CHUNK_VALUES = int(8.0e6 // 28)
+# whether the size of the streamed messages is tuned from the throughput
+# measured on the previous transfers, see ``set_chunk_size_auto_tuning``
+CHUNK_SIZE_AUTO_TUNING = False
 DYNAMIC_RESULTS = True
 
 # ANSYS CPython Workbench environment may not have scooby installed.
@@ -7,6 +7,7 @@ import numpy as np
 from ansys.grpc.dpf import meshed_region_pb2
 
 from ansys import dpf
+from ansys.dpf.core import scoping
 from ansys.dpf.core.common import nodal_properties
 from ansys.dpf.core.errors import protect_grpc
 
@@ -45,6 +46,8 @@ class Node:
 
     """
 
+    __slots__ = ("_id", "_index", "_coordinates", "_mesh")
+
     def __init__(self, mesh, nodeid, index, coordinates):
         self._id = nodeid
         self._index = index
@@ -75,6 +78,8 @@ class Node:
         [0.015, 0.045, 0.015]
 
         """
+        if isinstance(self._coordinates, np.ndarray):
+            return self._coordinates.tolist()
         return self._coordinates
 
     @property
@@ -117,6 +122,7 @@ class Nodes:
     def __init__(self, mesh):
         self._mesh = mesh
         self._mapping_id_to_index = None
+        self._ids_indexer = None
 
     def __str__(self):
         return f"DPF Node collection with {len(self)} nodes\n"
@@ -129,8 +135,9 @@ class Nodes:
         return self.n_nodes
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+        data = _NodesData(self._mesh)
+        for i in range(len(data)):
+            yield data.node(i)
 
     def node_by_id(self, id):
         """Array of node coordinates ordered by ID."""
@@ -165,6 +172,40 @@ class Nodes:
         nodeOut = self._mesh._stub.GetNode(request)
         return Node(self._mesh, nodeOut.id, nodeOut.index, nodeOut.coordinates)
 
+    def nodes_by_scoping(self, external_scope):
+        """Retrieve all the nodes of a scoping at once.
+
+        The IDs and coordinates of the nodes are streamed from the server in
+        a few calls instead of one call per node.
+
+        Parameters
+        ----------
+        external_scope : :class:`ansys.dpf.core.scoping.Scoping`, list of int
+            Scoping or list of IDs of the nodes to retrieve. IDs that are not
+            in the mesh are ignored.
+
+        Returns
+        -------
+        nodes : list[Node]
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> nodes = model.metadata.meshed_region.nodes
+        >>> [node.index for node in nodes.nodes_by_scoping([1, 2, 3])]
+        [0, 1, 2]
+
+        """
+        if isinstance(external_scope, scoping.Scoping):
+            ids = external_scope._get_ids(np_array=True)
+        else:
+            ids = external_scope
+        indices, _ = self._get_ids_indexer().map_ids(ids)
+        data = _NodesData(self._mesh)
+        return [data.node(index) for index in indices]
+
     @property
     def scoping(self):
         """Scoping of the nodes.
@@ -252,7 +293,20 @@ class Nodes:
 
     def _build_mapping_id_to_index(self):
         """Retrieve a mapping between IDs and indices of the entity."""
-        return {eid: i for i, eid in enumerate(self.scoping.ids)}
+        return self._get_ids_indexer().as_dict()
+
+    def _get_ids_indexer(self):
+        """Retrieve the vectorized mapping between IDs and indices of the entity.
+
+        The IDs are requested from the server once and kept with the mesh.
+        """
+        if self._ids_indexer is None:
+            self._ids_indexer = scoping._IdsIndexer(self.scoping._get_ids(np_array=True))
+        return self._ids_indexer
+
+    def _reset_mappings(self):
+        self._mapping_id_to_index = None
+        self._ids_indexer = None
 
     @property
     def mapping_id_to_index(self):
@@ -298,10 +352,7 @@ class Nodes:
         """
         if external_scope.location in ["Elemental", "NodalElemental"]:
             raise ValueError('Input scope location must be "Nodal"')
-        arr = np.array(list(map(self.mapping_id_to_index.get, external_scope.ids)))
-        mask = arr != None
-        ind = arr[mask].astype(np.int)
-        return ind, mask
+        return self._get_ids_indexer().map_ids(external_scope._get_ids(np_array=True))
 
     def add_node(self, id, coordinates):
         """Add a node in the mesh.
@@ -319,6 +370,7 @@ class Nodes:
         node_request.coordinates.extend(coordinates)
         request.nodes.append(node_request)
         self._mesh._stub.Add(request)
+        self._reset_mappings()
 
     def add_nodes(self, num):
         """Add a number of nodes in the mesh.
@@ -352,6 +404,32 @@ class Nodes:
             node_request.coordinates.extend(add.coordinates)
             request.nodes.append(node_request)
         self._mesh._stub.Add(request)
+        self._reset_mappings()
+
+
+class _NodesData:
+    """Array-backed IDs and coordinates of all the nodes of a mesh.
+
+    The arrays are retrieved in a few streamed calls and shared by the
+    :class:`Node` instances created from them.
+
+    Parameters
+    ----------
+    mesh : :class:`ansys.dpf.core.meshed_region` class
+        Mesh region that the nodes belong to.
+    """
+
+    def __init__(self, mesh):
+        self._mesh = mesh
+        self.ids = mesh.nodes._get_ids_indexer().ids
+        self.coordinates = mesh.nodes.coordinates_field.data
+
+    def __len__(self):
+        return self.ids.size
+
+    def node(self, index):
+        """Node at a given index, its coordinates are a view on the coordinates array."""
+        return Node(self._mesh, int(self.ids[index]), int(index), self.coordinates[index])
 
 
 class NodeAdder:
@@ -1,14 +1,36 @@
-from . import result
-from . import math
-from . import utility
-from . import min_max
-from . import scoping
-from . import metadata
-from . import logic
-from . import mesh
-from . import filter
-from . import serialization
-from . import geo
-from . import averaging
-from . import invariant
-from . import mapping
+"""Operators generated from the specifications of the server.
+
+The operator subpackages are imported on first access.
+"""
+import importlib
+import sys
+
+_SUBPACKAGES = [
+    "result",
+    "math",
+    "utility",
+    "min_max",
+    "scoping",
+    "metadata",
+    "logic",
+    "mesh",
+    "filter",
+    "serialization",
+    "geo",
+    "averaging",
+    "invariant",
+    "mapping",
+]
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    for _name in _SUBPACKAGES:
+        importlib.import_module("." + _name, __name__)
+else:
+
+    def __getattr__(name):
+        if name in _SUBPACKAGES:
+            return importlib.import_module("." + name, __name__)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted(list(globals()) + _SUBPACKAGES)
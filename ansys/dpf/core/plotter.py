@@ -92,8 +92,12 @@ class _InternalPlotter:
 
     def add_point_labels(self, nodes, meshed_region, labels=None, **kwargs):
         label_actors = []
-        node_indexes = [meshed_region.nodes.mapping_id_to_index.get(node.id) for node in nodes]
-        grid_points = [meshed_region.grid.points[node_index] for node_index in node_indexes]
+        node_ids = [node.id for node in nodes]
+        node_indexes = meshed_region.nodes._get_ids_indexer().indices(node_ids)
+        if np.any(node_indexes < 0):
+            missing = np.asarray(node_ids)[node_indexes < 0].tolist()
+            raise ValueError(f"Nodes {missing} are not in the meshed region.")
+        grid_points = meshed_region.grid.points[node_indexes]
 
         def get_label_at_grid_point(index):
             try:
@@ -0,0 +1,450 @@
+"""
+.. _ref_profiler:
+
+Profiler
+========
+Records the gRPC calls made to the servers: number of calls, latency and
+payload sizes per service method and per calling API of this package.
+"""
+import json
+import os
+import sys
+import threading
+import time
+import warnings
+from contextlib import contextmanager
+
+import grpc
+import numpy as np
+
+# whether the channels of the servers started from now on are intercepted,
+# see ``settings.set_grpc_profiling``
+PROFILING = False
+_ACTIVE_PROFILES = []
+_INTERCEPTED_CHANNELS = 0
+_PACKAGE_PATH = os.path.dirname(os.path.abspath(__file__))
+_THIS_FILE = os.path.abspath(__file__)
+
+
+class RpcCall:
+    """Record of a gRPC call.
+
+    Attributes
+    ----------
+    method : str
+        Full name of the service method, for example
+        ``"/ansys.api.dpf.field.v0.FieldService/List"``.
+    api : str
+        Function or method of this package which made the call, for example
+        ``"Field.data"``.
+    start : float
+        Start time of the call in seconds, from ``time.perf_counter``.
+    duration : float
+        Duration of the call in seconds.
+    sent : int
+        Number of bytes sent.
+    received : int
+        Number of bytes received.
+    thread : int
+        Identifier of the thread which made the call.
+    """
+
+    __slots__ = ("method", "api", "start", "duration", "sent", "received", "thread")
+
+    def __init__(self, method, api, start, duration, sent, received, thread):
+        self.method = method
+        self.api = api
+        self.start = start
+        self.duration = duration
+        self.sent = sent
+        self.received = received
+        self.thread = thread
+
+
+class Profile:
+    """gRPC calls recorded by :func:`profile`.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> dpf.settings.set_grpc_profiling()
+    >>> server = dpf.start_local_server(as_global=False)
+    >>> with dpf.profile() as p:
+    ...     model = dpf.Model(examples.static_rst, server=server)
+    ...     disp = model.results.displacement().outputs.fields_container()
+    >>> table = p.table()
+    >>> p.to_chrome_trace("trace.json")
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = []
+        self._start = time.perf_counter()
+
+    def _record(self, call):
+        with self._lock:
+            self._calls.append(call)
+
+    @property
+    def calls(self):
+        """Recorded calls, in the order of their completion.
+
+        Returns
+        -------
+        list[RpcCall]
+        """
+        with self._lock:
+            return list(self._calls)
+
+    def __len__(self):
+        return len(self._calls)
+
+    def stats(self, by="method"):
+        """Statistics of the calls grouped by service method or by API.
+
+        Parameters
+        ----------
+        by : str, optional
+            ``"method"`` to group the calls by service method, ``"api"`` to
+            group them by calling API of this package. The default is
+            ``"method"``.
+
+        Returns
+        -------
+        dict
+            For each group, a dictionary with the ``"count"``, the
+            ``"total"``, ``"mean"``, ``"p50"``, ``"p95"`` and ``"max"``
+            latencies in seconds, and the ``"sent"`` and ``"received"``
+            number of bytes.
+        """
+        if by not in ("method", "api"):
+            raise ValueError("'by' must be 'method' or 'api'.")
+        groups = {}
+        for call in self.calls:
+            groups.setdefault(getattr(call, by), []).append(call)
+        out = {}
+        for key, calls in groups.items():
+            durations = np.array([c.duration for c in calls])
+            out[key] = {
+                "count": len(calls),
+                "total": float(durations.sum()),
+                "mean": float(durations.mean()),
+                "p50": float(np.percentile(durations, 50)),
+                "p95": float(np.percentile(durations, 95)),
+                "max": float(durations.max()),
+                "sent": sum(c.sent for c in calls),
+                "received": sum(c.received for c in calls),
+            }
+        return out
+
+    def histogram(self, method=None, bins=10):
+        """Histogram of the latencies.
+
+        Parameters
+        ----------
+        method : str, optional
+            Service method whose calls are taken into account. The default
+            is ``None``, in which case all the calls are used.
+        bins : int, list, optional
+            Number of bins or bin edges in seconds, see ``numpy.histogram``.
+            The default is ``10``.
+
+        Returns
+        -------
+        counts : numpy.ndarray
+        bin_edges : numpy.ndarray
+        """
+        durations = [
+            c.duration for c in self.calls if method is None or c.method == method
+        ]
+        return np.histogram(durations, bins=bins)
+
+    def table(self, by="method"):
+        """Statistics of the calls as a text table sorted by total latency.
+
+        Parameters
+        ----------
+        by : str, optional
+            ``"method"`` to group the calls by service method, ``"api"`` to
+            group them by calling API of this package. The default is
+            ``"method"``.
+
+        Returns
+        -------
+        str
+        """
+        stats = self.stats(by)
+        names = {key: _short_method(key) if by == "method" else key for key in stats}
+        width = max([len(by)] + [len(n) for n in names.values()])
+        header = (
+            f"{by:<{width}} {'count':>7} {'total (ms)':>11} {'mean (ms)':>10} "
+            f"{'p95 (ms)':>9} {'sent (B)':>11} {'received (B)':>13}"
+        )
+        lines = [header, "-" * len(header)]
+        for key, stat in sorted(stats.items(), key=lambda kv: -kv[1]["total"]):
+            lines.append(
+                f"{names[key]:<{width}} {stat['count']:>7} {stat['total'] * 1e3:>11.2f} "
+                f"{stat['mean'] * 1e3:>10.3f} {stat['p95'] * 1e3:>9.3f} "
+                f"{stat['sent']:>11} {stat['received']:>13}"
+            )
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.table()
+
+    def to_chrome_trace(self, path=None):
+        """Export the calls in the Chrome trace event format, readable by
+        ``chrome://tracing`` or Perfetto.
+
+        Parameters
+        ----------
+        path : str, optional
+            Path of the JSON file to write. The default is ``None``, in
+            which case the trace is only returned.
+
+        Returns
+        -------
+        dict
+            Trace.
+        """
+        events = []
+        pid = os.getpid()
+        for call in self.calls:
+            events.append(
+                {
+                    "name": _short_method(call.method),
+                    "cat": call.api,
+                    "ph": "X",
+                    "ts": (call.start - self._start) * 1e6,
+                    "dur": call.duration * 1e6,
+                    "pid": pid,
+                    "tid": call.thread,
+                    "args": {
+                        "method": call.method,
+                        "api": call.api,
+                        "sent": call.sent,
+                        "received": call.received,
+                    },
+                }
+            )
+        trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+        if path is not None:
+            with open(path, "w") as f:
+                json.dump(trace, f)
+        return trace
+
+
+@contextmanager
+def profile():
+    """Record the gRPC calls made to all the servers in a ``with`` block.
+
+    Only the calls made to the servers started after enabling the profiling
+    with :func:`ansys.dpf.core.settings.set_grpc_profiling` are recorded.
+
+    Yields
+    ------
+    Profile
+        Recorded calls.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> dpf.settings.set_grpc_profiling()
+    >>> server = dpf.start_local_server(as_global=False)
+    >>> with dpf.profile() as p:
+    ...     model = dpf.Model(examples.static_rst, server=server)
+    ...     n_nodes = model.metadata.meshed_region.nodes.n_nodes
+    >>> print(p.table(by="api"))  # doctest: +SKIP
+
+    """
+    if not PROFILING and not _INTERCEPTED_CHANNELS:
+        warnings.warn(
+            "No server is profiled, call "
+            "'ansys.dpf.core.settings.set_grpc_profiling()' before starting "
+            "the servers to profile."
+        )
+    p = Profile()
+    _ACTIVE_PROFILES.append(p)
+    try:
+        yield p
+    finally:
+        _ACTIVE_PROFILES.remove(p)
+
+
+def _short_method(method):
+    """Service and method names without the package, for example
+    ``"FieldService/List"``."""
+    parts = method.strip("/").split("/")
+    if len(parts) != 2:
+        return method
+    return parts[0].rsplit(".", 1)[-1] + "/" + parts[1]
+
+
+def _calling_api():
+    """Name of the outermost function of this package in the call stack,
+    for example ``"Field.data"``."""
+    frame = sys._getframe(1)
+    api = "<unknown>"
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if filename.startswith(_PACKAGE_PATH) and filename != _THIS_FILE:
+            name = frame.f_code.co_name
+            owner = frame.f_locals.get("self")
+            if owner is not None:
+                name = type(owner).__name__ + "." + name
+            api = name
+        elif api != "<unknown>" and "grpc" not in filename:
+            # reached the caller of the package
+            break
+        frame = frame.f_back
+    return api
+
+
+def _record(method, api, start, sent, received):
+    call = RpcCall(
+        method,
+        api,
+        start,
+        time.perf_counter() - start,
+        sent,
+        received,
+        threading.get_ident(),
+    )
+    for p in list(_ACTIVE_PROFILES):
+        p._record(call)
+
+
+def _byte_size(message):
+    try:
+        return message.ByteSize()
+    except AttributeError:
+        return 0
+
+
+class _CountingRequestIterator:
+    def __init__(self, iterator):
+        self._iterator = iter(iterator)
+        self.size = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        message = next(self._iterator)
+        self.size += _byte_size(message)
+        return message
+
+
+class _CountingResponseIterator:
+    """Streamed responses counting the received bytes and recording the call
+    once all the responses are read."""
+
+    def __init__(self, call, on_done):
+        self._call = call
+        self._on_done = on_done
+        self._size = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            message = next(self._call)
+        except BaseException:
+            on_done, self._on_done = self._on_done, None
+            if on_done is not None:
+                on_done(self._size)
+            raise
+        self._size += _byte_size(message)
+        return message
+
+    def __getattr__(self, name):
+        return getattr(self._call, name)
+
+
+class _ProfilingInterceptor(
+    grpc.UnaryUnaryClientInterceptor,
+    grpc.UnaryStreamClientInterceptor,
+    grpc.StreamUnaryClientInterceptor,
+    grpc.StreamStreamClientInterceptor,
+):
+    """Interceptor installed on the channels of the servers started while
+    the profiling is enabled. It does nothing when no profile is active."""
+
+    @staticmethod
+    def _on_unary_response(method, api, start, sent):
+        def done(call):
+            try:
+                received = _byte_size(call.result())
+            except Exception:
+                received = 0
+            _record(method, api, start, sent(), received)
+
+        return done
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        if not _ACTIVE_PROFILES:
+            return continuation(client_call_details, request)
+        api = _calling_api()
+        start = time.perf_counter()
+        sent = _byte_size(request)
+        call = continuation(client_call_details, request)
+        call.add_done_callback(
+            self._on_unary_response(client_call_details.method, api, start, lambda: sent)
+        )
+        return call
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        if not _ACTIVE_PROFILES:
+            return continuation(client_call_details, request)
+        api = _calling_api()
+        start = time.perf_counter()
+        sent = _byte_size(request)
+        call = continuation(client_call_details, request)
+        return _CountingResponseIterator(
+            call,
+            lambda received: _record(
+                client_call_details.method, api, start, sent, received
+            ),
+        )
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        if not _ACTIVE_PROFILES:
+            return continuation(client_call_details, request_iterator)
+        api = _calling_api()
+        start = time.perf_counter()
+        requests = _CountingRequestIterator(request_iterator)
+        call = continuation(client_call_details, requests)
+        call.add_done_callback(
+            self._on_unary_response(
+                client_call_details.method, api, start, lambda: requests.size
+            )
+        )
+        return call
+
+    def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        if not _ACTIVE_PROFILES:
+            return continuation(client_call_details, request_iterator)
+        api = _calling_api()
+        start = time.perf_counter()
+        requests = _CountingRequestIterator(request_iterator)
+        call = continuation(client_call_details, requests)
+        return _CountingResponseIterator(
+            call,
+            lambda received: _record(
+                client_call_details.method, api, start, requests.size, received
+            ),
+        )
+
+
+_INTERCEPTOR = _ProfilingInterceptor()
+
+
+def _profiled_channel(channel):
+    """Channel whose calls are recorded by the active profiles."""
+    global _INTERCEPTED_CHANNELS
+    _INTERCEPTED_CHANNELS += 1
+    return grpc.intercept_channel(channel, _INTERCEPTOR)
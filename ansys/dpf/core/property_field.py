@@ -5,8 +5,10 @@ PropertyField
 
 from ansys.dpf.core.common import natures, locations
 from ansys.dpf.core.field_base import _FieldBase, _LocalFieldBase
+from ansys.dpf.core.cache import class_handling_cache
 
 
+@class_handling_cache
 class PropertyField(_FieldBase):
     """Describes field properties such as connectivity.
 
@@ -150,6 +152,15 @@ class PropertyField(_FieldBase):
         """
         return _LocalPropertyField(self)
 
+    _to_cache = {
+        _FieldBase._get_counts: [
+            _FieldBase._set_data,
+            _FieldBase._set_data_pointer,
+            _FieldBase._set_scoping,
+            _FieldBase.append,
+        ],
+    }
+
 
 class _LocalPropertyField(_LocalFieldBase, PropertyField):
     """Caches the internal data of a field so that it can be modified locally.
@@ -0,0 +1,237 @@
+"""
+.. _ref_release_queue:
+
+ReleaseQueue
+============
+Releases the server objects of the garbage collected DPF objects in batches,
+on a background thread, instead of sending one blocking request per object
+from ``__del__``.
+"""
+import atexit
+import logging
+import threading
+import weakref
+from collections import Counter
+
+import grpc
+from ansys.grpc.dpf import base_pb2, base_pb2_grpc
+
+LOG = logging.getLogger(__name__)
+
+# whether the server objects are released in batches on a background thread
+DEFERRED_RELEASE = True
+
+_QUEUES = weakref.WeakSet()
+
+# set when the interpreter exits
+_EXITING = False
+
+
+class ReleaseQueue:
+    """Collects the server objects of a server whose client objects are
+    garbage collected and releases them in batches.
+
+    The objects are released by a background thread, started when objects
+    are queued, after ``interval`` seconds or as soon as ``batch_size``
+    objects are queued. A single request releases a whole batch on the
+    servers supporting it, the other servers receive one concurrent request
+    per object. :meth:`flush` releases the queued objects immediately.
+
+    The queue also counts the live client objects of each type, so that
+    objects which are never released can be spotted.
+
+    Parameters
+    ----------
+    server : ansys.dpf.core.server.DpfServer
+        Server owning the objects.
+    batch_size : int, optional
+        Number of queued objects triggering a release. The default is ``1000``.
+    interval : float, optional
+        Maximum time in seconds an object stays queued. The default is ``0.1``.
+    """
+
+    def __init__(self, server, batch_size=1000, interval=0.1):
+        self._server = weakref.ref(server)
+        self.batch_size = batch_size
+        self.interval = interval
+        self._pending = []
+        self._live = Counter()
+        self._released = 0
+        self._condition = threading.Condition()
+        self._release_lock = threading.Lock()
+        self._thread = None
+        self._base_stub = None
+        self._batch_supported = None
+        _QUEUES.add(self)
+
+    def track(self, obj):
+        """Count a new client object."""
+        with self._condition:
+            self._live[type(obj).__name__] += 1
+
+    def untrack(self, obj):
+        """Stop counting a client object."""
+        with self._condition:
+            name = type(obj).__name__
+            if self._live[name] > 0:
+                self._live[name] -= 1
+
+    def release(self, obj, delete, message):
+        """Queue the server object of a garbage collected client object.
+
+        Parameters
+        ----------
+        obj : object
+            Client object, only its type is used.
+        delete : callable
+            ``Delete`` method of the stub of the service of the object.
+        message : protobuf message
+            Message identifying the object on the server.
+        """
+        self.untrack(obj)
+        if _EXITING:
+            # no thread can be started once the interpreter exits
+            delete(message)
+            return
+        with self._condition:
+            self._pending.append((delete, message))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="dpf-release", daemon=True
+                )
+                self._thread.start()
+            elif len(self._pending) >= self.batch_size:
+                self._condition.notify()
+
+    @property
+    def pending(self):
+        """Number of server objects waiting to be released."""
+        return len(self._pending)
+
+    @property
+    def released(self):
+        """Number of server objects released so far."""
+        return self._released
+
+    def live_objects(self):
+        """Number of live client objects of each type.
+
+        Returns
+        -------
+        dict[str, int]
+        """
+        with self._condition:
+            return {name: count for name, count in self._live.items() if count}
+
+    def flush(self):
+        """Release all the queued server objects before returning."""
+        with self._condition:
+            batch, self._pending = self._pending, []
+        with self._release_lock:
+            self._release_batch(batch)
+
+    def discard(self):
+        """Forget the queued server objects, for example when the server is
+        shut down."""
+        with self._condition:
+            self._pending = []
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if len(self._pending) < self.batch_size:
+                    self._condition.wait(self.interval)
+                if not self._pending:
+                    self._thread = None
+                    return
+                batch, self._pending = self._pending, []
+            with self._release_lock:
+                self._release_batch(batch)
+
+    def _release_batch(self, batch):
+        if not batch:
+            return
+        server = self._server()
+        if server is None or not getattr(server, "live", True):
+            return
+        if self._batch_supported is not False:
+            try:
+                self._release_all(server, batch)
+                self._batch_supported = True
+                self._released += len(batch)
+                return
+            except grpc.RpcError as e:
+                if e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                    self._batch_supported = False
+                else:
+                    # for example a transient UNAVAILABLE, the objects are
+                    # released one by one
+                    LOG.warning(
+                        f"Failed to release {len(batch)} server objects at once, "
+                        f"releasing them one by one: {e}"
+                    )
+            except (AttributeError, ValueError):
+                # the messages cannot be gathered in one request
+                pass
+        futures = []
+        for delete, message in batch:
+            try:
+                futures.append(delete.future(message))
+            except Exception:
+                pass
+        failed = len(batch) - len(futures)
+        for future in futures:
+            try:
+                future.result()
+                self._released += 1
+            except Exception:
+                failed += 1
+        if failed:
+            LOG.warning(f"Failed to release {failed} server objects.")
+
+    def _release_all(self, server, batch):
+        if self._base_stub is None:
+            self._base_stub = base_pb2_grpc.BaseServiceStub(server.channel)
+        request = base_pb2.DeleteRequest()
+        for _, message in batch:
+            identifier = request.dpf_type_id.add()
+            if isinstance(message.id, int):
+                identifier.id = message.id
+            else:
+                identifier.CopyFrom(message.id)
+        self._base_stub.Delete(request)
+
+
+def _release_queue(obj):
+    """Release queue of the server of a client object, ``None`` when the
+    server has none."""
+    return getattr(getattr(obj, "_server", None), "_release_queue", None)
+
+
+def _track(obj):
+    """Count a new client object owning a server object."""
+    queue = _release_queue(obj)
+    if queue is not None:
+        queue.track(obj)
+
+
+def _release(obj, delete, message):
+    """Release the server object of a client object from its ``__del__``."""
+    queue = _release_queue(obj)
+    if DEFERRED_RELEASE and queue is not None:
+        queue.release(obj, delete, message)
+    else:
+        if queue is not None:
+            queue.untrack(obj)
+        delete(message)
+
+
+@atexit.register
+def _flush_all():
+    global _EXITING
+    _EXITING = True
+    for queue in list(_QUEUES):
+        try:
+            queue.flush()
+        except Exception:
+            pass
@@ -0,0 +1,521 @@
+"""
+.. _ref_result_cache:
+
+ResultCache
+===========
+Stores the outputs of operators on the local disk so that evaluating the same
+operators on unchanged result files does not require the server to read and
+compute them again.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import weakref
+
+import numpy as np
+
+from ansys.dpf.core import transport
+from ansys.dpf.core.common import natures, types
+from ansys.dpf.core.misc import module_exists
+
+_RESULT_CACHE = None
+
+
+def _active_cache():
+    """Result cache used by the operators or ``None`` when caching is disabled."""
+    return _RESULT_CACHE
+
+
+def _default_cache_path():
+    if module_exists("appdirs"):
+        import appdirs
+
+        return appdirs.user_cache_dir("ansys-dpf-core")
+    return os.path.join(tempfile.gettempdir(), "ansys-dpf-core-cache")
+
+
+class ResultCache:
+    """Content-addressed cache of operator outputs on the local disk.
+
+    An output is identified by the name, the configuration and the connected
+    inputs of the operator and, recursively, of the operators it is connected
+    to. The inputs are identified when they are connected, so only the
+    operators connected while the cache is enabled are cached. Result files
+    connected through data sources are identified by their path, size and
+    modification time, so the cached outputs are not reused after the result
+    files change. Outputs of operators with inputs that cannot be identified
+    (for example fields created on the client) are not cached.
+
+    Fields, fields containers and scopings are stored as ``.npz`` archives,
+    with the time frequency support of the fields containers. The mesh of
+    the fields is not stored: it is the mesh of the data sources which the
+    output is computed from, and it is bound again to the fields when they
+    are loaded. The least recently used entries are removed when the total
+    size of the cache exceeds ``max_size``.
+
+    Parameters
+    ----------
+    path : str, optional
+        Directory where the outputs are stored. The default is ``None``, in
+        which case the user cache directory is used.
+    max_size : int, optional
+        Maximum size of the cache in bytes. The default is ``2**30`` (1 GB).
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> cache = dpf.settings.enable_result_cache()
+    >>> model = dpf.Model(examples.multishells_rst)
+    >>> stress = model.results.stress.on_all_time_freqs.eval()
+    >>> stress = model.results.stress.on_all_time_freqs.eval()  # read from the cache
+    >>> mesh = stress[0].meshed_region
+    >>> dpf.settings.disable_result_cache()
+
+    """
+
+    _supported_types = (types.field, types.fields_container, types.scoping)
+
+    def __init__(self, path=None, max_size=2 ** 30):
+        if path is None:
+            path = _default_cache_path()
+        self.path = path
+        self.max_size = max_size
+        os.makedirs(self.path, exist_ok=True)
+
+    @property
+    def size(self):
+        """Total size of the stored outputs in bytes.
+
+        Returns
+        -------
+        int
+        """
+        return sum(os.path.getsize(f) for f in self._files())
+
+    def clear(self):
+        """Remove all the stored outputs."""
+        for f in self._files():
+            try:
+                os.remove(f)
+            except OSError:
+                pass
+
+    def _files(self):
+        return [
+            os.path.join(self.path, f)
+            for f in os.listdir(self.path)
+            if f.endswith(".npz")
+        ]
+
+    def _file(self, key):
+        return os.path.join(self.path, key + ".npz")
+
+    def _key(self, operator, pin, output_type):
+        """Key of an output of an operator and description of the data
+        sources which the output is computed from, ``None`` if the output
+        cannot be cached or if it is not computed from a single data
+        sources."""
+        if output_type not in self._supported_types:
+            return None, None
+        data_sources = []
+        op_key = _operator_key(operator, {}, data_sources)
+        if op_key is None:
+            return None, None
+        desc = {
+            "server": str(operator._server.version),
+            "precision": transport._policy(operator._server).precision,
+            "operator": op_key,
+            "pin": pin,
+            "type": output_type.name,
+        }
+        desc = json.dumps(desc, sort_keys=True).encode()
+        unique = {json.dumps(ds, sort_keys=True): ds for ds in data_sources}
+        data_sources = next(iter(unique.values())) if len(unique) == 1 else None
+        return hashlib.sha256(desc).hexdigest(), data_sources
+
+    def load(self, key, output_type, server=None):
+        """Load an output from the cache.
+
+        Parameters
+        ----------
+        key : str
+            Key of the output.
+        output_type : :class:`ansys.dpf.core.common.types`
+            Type of the output.
+        server : server.DPFServer, optional
+            Server on which the output is created. The default is ``None``,
+            in which case an attempt is made to use the global server.
+
+        Returns
+        -------
+        Field, FieldsContainer, Scoping
+            Output or ``None`` if it is not stored. The mesh of the data
+            sources which the output was computed from is bound to its
+            fields.
+        """
+        path = self._file(key)
+        try:
+            with np.load(path, allow_pickle=False) as archive:
+                arrays = dict(archive)
+        except (OSError, ValueError):
+            return None
+        # mark the entry as recently used
+        os.utime(path)
+        metadata = json.loads(str(arrays.pop("metadata")))
+        if output_type == types.scoping:
+            return _scoping_from_arrays(metadata["scoping"], arrays, "", server)
+        mesh = None
+        if metadata.get("mesh") is not None:
+            mesh = _data_sources_mesh(metadata["mesh"], server)
+        if output_type == types.field:
+            field = _field_from_arrays(metadata["fields"][0], arrays, "0", server)
+            if mesh is not None:
+                field.meshed_region = mesh
+            return field
+        from ansys.dpf.core.fields_container import FieldsContainer
+
+        fc = FieldsContainer(server=server)
+        fc.labels = metadata["labels"]
+        if metadata.get("time_freq_support") is not None:
+            fc.time_freq_support = _time_freq_support_from_arrays(
+                metadata["time_freq_support"], arrays, server
+            )
+        for i, field_metadata in enumerate(metadata["fields"]):
+            field = _field_from_arrays(field_metadata, arrays, str(i), server)
+            if mesh is not None:
+                field.meshed_region = mesh
+            fc.add_field(field_metadata["label_space"], field)
+        return fc
+
+    def store(self, key, output, data_sources=None):
+        """Store an output in the cache.
+
+        Parameters
+        ----------
+        key : str
+            Key of the output.
+        output : Field, FieldsContainer, Scoping
+            Output to store.
+        data_sources : list, optional
+            Description of the data sources which the output is computed
+            from, returned by the key of the output. When the fields of the
+            output are supported by a mesh, it must be the mesh of these
+            data sources. The default is ``None``, in which case the outputs
+            whose fields are supported by a mesh are not stored.
+        """
+        from ansys.dpf.core.field import Field
+        from ansys.dpf.core.fields_container import FieldsContainer
+        from ansys.dpf.core.scoping import Scoping
+
+        arrays = {}
+        metadata = {}
+        if isinstance(output, Scoping):
+            metadata["scoping"] = _scoping_to_arrays(output, arrays, "")
+        elif isinstance(output, (Field, FieldsContainer)):
+            fields = [output] if isinstance(output, Field) else list(output)
+            mesh = _common_mesh(fields)
+            if mesh is False or (mesh is not None and data_sources is None):
+                return
+            if mesh is not None:
+                # the mesh is bound again to the loaded fields
+                metadata["mesh"] = data_sources
+                output._server._result_meshes.setdefault(
+                    json.dumps(data_sources, sort_keys=True), mesh
+                )
+            if isinstance(output, Field):
+                metadata["fields"] = [_field_to_arrays(output, arrays, "0")]
+            else:
+                metadata["labels"] = output.labels
+                metadata["time_freq_support"] = _time_freq_support_to_arrays(
+                    output, arrays
+                )
+                metadata["fields"] = []
+                for i, (label_space, field) in enumerate(output.iter_with_label_spaces()):
+                    field_metadata = _field_to_arrays(field, arrays, str(i))
+                    field_metadata["label_space"] = label_space
+                    metadata["fields"].append(field_metadata)
+        else:
+            return
+        arrays["metadata"] = np.array(json.dumps(metadata))
+
+        # write in a temporary file first so that concurrent readers never
+        # see a partially written entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, self._file(key))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._evict()
+
+    def _evict(self):
+        files = []
+        for f in self._files():
+            try:
+                stat = os.stat(f)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, f))
+        total = sum(size for _, size, _ in files)
+        for _, size, f in sorted(files):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(f)
+                total -= size
+            except OSError:
+                pass
+
+
+def _operator_key(operator, visited, data_sources):
+    """Description of an operator and its inputs or ``None`` if an input
+    cannot be described. The descriptions of the data sources in the inputs
+    are appended to ``data_sources``."""
+    if id(operator) in visited:
+        return visited[id(operator)]
+    visited[id(operator)] = None
+    connections = operator._connections
+    if connections is None:
+        # connected while the cache was disabled
+        return None
+    inputs = {}
+    for pin, connection in connections.items():
+        key = _resolved_key(connection, visited, data_sources)
+        if key is None:
+            return None
+        inputs[str(pin)] = key
+    desc = {
+        "name": operator.name,
+        "config": operator.config.options,
+        "inputs": inputs,
+    }
+    visited[id(operator)] = desc
+    return desc
+
+
+def _connection_key(inpt, pin_out):
+    """Identification of an input connected to an operator, recorded by
+    ``Operator.connect`` while a cache is active, or ``None`` if the input
+    cannot be identified.
+
+    The operators are referenced weakly and the result files of the data
+    sources are checked for changes when the key of an output is computed,
+    see ``_resolved_key``.
+    """
+    from ansys.dpf.core.data_sources import DataSources
+    from ansys.dpf.core.dpf_operator import Operator
+    from ansys.dpf.core.model import Model
+    from ansys.dpf.core.outputs import Output
+    from ansys.dpf.core.scoping import Scoping
+
+    if isinstance(inpt, (str, bool, int, float)):
+        return [type(inpt).__name__, inpt]
+    elif isinstance(inpt, list) and all(
+        isinstance(x, (int, float)) and not isinstance(x, bool) for x in inpt
+    ):
+        return ["list", inpt]
+    elif isinstance(inpt, Model):
+        return _connection_key(inpt.metadata.data_sources, 0)
+    elif isinstance(inpt, DataSources):
+        info = inpt._info
+        return ["data_sources", info["result_key"], info["paths"]]
+    elif isinstance(inpt, Scoping):
+        ids = np.ascontiguousarray(inpt._get_ids(np_array=True), dtype=np.int32)
+        return ["scoping", inpt.location, hashlib.sha256(ids.tobytes()).hexdigest()]
+    elif isinstance(inpt, Operator):
+        return ["operator", weakref.ref(inpt), pin_out]
+    elif isinstance(inpt, Output):
+        return ["operator", weakref.ref(inpt._operator), inpt._pin]
+    return None
+
+
+def _resolved_key(connection, visited, data_sources):
+    """Description of a connected input from its identification, or ``None``
+    if a result file or a connected operator is not available anymore."""
+    if connection is None:
+        return None
+    elif connection[0] == "data_sources":
+        _, result_key, paths = connection
+        files = {}
+        for key, key_paths in paths.items():
+            files[key] = []
+            for path in key_paths:
+                # files which are not on the local disk cannot be checked
+                # for changes
+                if not os.path.isfile(path):
+                    return None
+                stat = os.stat(path)
+                files[key].append([path, stat.st_size, stat.st_mtime_ns])
+        desc = ["data_sources", result_key, files]
+        data_sources.append(desc)
+        return desc
+    elif connection[0] == "operator":
+        _, operator_ref, pin_out = connection
+        operator = operator_ref()
+        if operator is None:
+            return None
+        op_key = _operator_key(operator, visited, data_sources)
+        return None if op_key is None else ["operator", op_key, pin_out]
+    return connection
+
+
+def _common_mesh(fields):
+    """Mesh supporting the fields, ``None`` if they have no mesh and
+    ``False`` if they may not have the same mesh. Only the first and the
+    last fields are checked."""
+    if not fields:
+        return None
+    meshes = []
+    for field in {id(fields[0]): fields[0], id(fields[-1]): fields[-1]}.values():
+        try:
+            meshes.append(field._get_meshed_region())
+        except RuntimeError:
+            meshes.append(None)
+    if any(mesh is None for mesh in meshes):
+        return None if all(mesh is None for mesh in meshes) else False
+    if len({str(mesh._message.id) for mesh in meshes}) > 1:
+        return False
+    return meshes[0]
+
+
+def _data_sources_mesh(data_sources, server):
+    """Mesh of the data sources described by ``data_sources``, read by a mesh
+    provider unless an output of these data sources was already stored or
+    loaded."""
+    from ansys.dpf.core import server as serverlib
+    from ansys.dpf.core.data_sources import DataSources
+    from ansys.dpf.core.dpf_operator import Operator
+
+    if server is None:
+        server = serverlib._global_server()
+    key = json.dumps(data_sources, sort_keys=True)
+    mesh = server._result_meshes.get(key)
+    if mesh is None:
+        _, result_key, files = data_sources
+        ds = DataSources(server=server)
+        for file_key, key_files in files.items():
+            for path, _, _ in key_files:
+                if file_key == result_key:
+                    ds.set_result_file_path(path, file_key)
+                else:
+                    ds.add_file_path(path, file_key)
+        mesh_provider = Operator("MeshProvider", server=server)
+        mesh_provider.connect(4, ds)
+        mesh = mesh_provider.get_output(0, types.meshed_region)
+        server._result_meshes[key] = mesh
+    return mesh
+
+
+def _time_freq_support_to_arrays(fields_container, arrays):
+    """Store the time frequency support of a fields container, returns its
+    metadata or ``None`` if it has none."""
+    try:
+        support = fields_container._get_time_freq_support()
+        attributes = support._get_attributes_list()
+    except Exception:
+        return None
+    if attributes.get("freq_real") is None:
+        return None
+    metadata = {
+        "time_frequencies": _field_to_arrays(attributes["freq_real"], arrays, "_tf")
+    }
+    for name, attribute in (("complex_frequencies", "freq_complex"), ("rpms", "rpm")):
+        if attributes.get(attribute) is not None:
+            metadata[name] = _field_to_arrays(attributes[attribute], arrays, "_tf_" + name)
+    metadata["harmonic_indices"] = []
+    harmonic_indices = attributes.get("cyc_harmonic_index")
+    while harmonic_indices is not None:
+        stage = len(metadata["harmonic_indices"])
+        metadata["harmonic_indices"].append(
+            _field_to_arrays(
+                harmonic_indices, arrays, "_tf_harmonic_indices" + str(stage)
+            )
+        )
+        try:
+            harmonic_indices = support.get_harmonic_indices(stage + 1)
+        except Exception:
+            break
+    return metadata
+
+
+def _time_freq_support_from_arrays(metadata, arrays, server):
+    from ansys.dpf.core.time_freq_support import TimeFreqSupport
+
+    support = TimeFreqSupport(server=server)
+    support.time_frequencies = _field_from_arrays(
+        metadata["time_frequencies"], arrays, "_tf", server
+    )
+    for name in ("complex_frequencies", "rpms"):
+        if name in metadata:
+            field = _field_from_arrays(metadata[name], arrays, "_tf_" + name, server)
+            setattr(support, name, field)
+    for i, field_metadata in enumerate(metadata["harmonic_indices"]):
+        field = _field_from_arrays(
+            field_metadata, arrays, "_tf_harmonic_indices" + str(i), server
+        )
+        support.set_harmonic_indices(field, i)
+    return support
+
+
+def _scoping_to_arrays(scoping, arrays, suffix):
+    arrays["ids" + suffix] = np.asarray(scoping._get_ids(np_array=True), dtype=np.int32)
+    return {"location": scoping.location}
+
+
+def _scoping_from_arrays(metadata, arrays, suffix, server):
+    from ansys.dpf.core.scoping import Scoping
+
+    scoping = Scoping(location=metadata["location"], server=server)
+    ids = arrays["ids" + suffix]
+    if ids.size > 0:
+        scoping.ids = ids
+    return scoping
+
+
+def _field_to_arrays(field, arrays, suffix):
+    metadata = {"scoping": _scoping_to_arrays(field.scoping, arrays, suffix)}
+    field_definition = field.field_definition
+    dim = field_definition.dimensionality
+    metadata["location"] = field_definition.location
+    metadata["unit"] = field_definition.unit
+    metadata["nature"] = dim.nature.name
+    metadata["dim"] = list(dim.dim)
+    metadata["shell_layers"] = field_definition.shell_layers.value
+    metadata["name"] = field.name
+    # the stored data is not rounded to the precision of the transport
+    with transport.transport_policy(precision="double"):
+        arrays["data" + suffix] = field._get_data()
+    arrays["data_pointer" + suffix] = field._data_pointer
+    return metadata
+
+
+def _field_from_arrays(metadata, arrays, suffix, server):
+    from ansys.dpf.core.dimensionality import Dimensionality
+    from ansys.dpf.core.field import Field
+
+    scoping = _scoping_from_arrays(metadata["scoping"], arrays, suffix, server)
+    nature = natures[metadata["nature"]]
+    field = Field(
+        nentities=len(scoping), nature=nature, location=metadata["location"],
+        server=server,
+    )
+    if metadata["dim"]:
+        field.dimensionality = Dimensionality(metadata["dim"], nature)
+    if metadata["unit"]:
+        field.unit = metadata["unit"]
+    field_definition = field.field_definition
+    field_definition._modify_field_def(
+        shell_layer=metadata["shell_layers"], name=metadata["name"]
+    )
+    field.field_definition = field_definition
+    field.scoping = scoping
+    data = arrays["data" + suffix]
+    if data.size > 0:
+        field.data = data
+        field._data_pointer = arrays["data_pointer" + suffix]
+    return field
@@ -2,8 +2,11 @@
 ResultInfo
 ==========
 """
+import types
 from enum import Enum
 
+import grpc
+
 from ansys import dpf
 from ansys.grpc.dpf import result_info_pb2, result_info_pb2_grpc
 from ansys.dpf.core import available_result
@@ -12,7 +15,23 @@ from ansys.dpf.core.cyclic_support import CyclicSupport
 from ansys.dpf.core.common import __write_enum_doc__
 from ansys.dpf.core.cache import class_handling_cache
 from ansys.dpf.core.check_version import server_meet_version, version_requires
-
+from ansys.dpf.core import release_queue
+
+
+# string properties fetched in one request by the servers 3.0 and later
+_STRING_PROPERTIES = (
+    "analysis_type",
+    "physics_type",
+    "results_count",
+    "unit_system_name",
+    "solver_version",
+    "solver_date",
+    "solver_time",
+    "user_name",
+    "job_name",
+    "product_name",
+    "main_title",
+)
 
 names = [m for m in result_info_pb2.PhysicsType.keys()]
 physics_types = Enum("physics_types", names)
@@ -72,6 +91,7 @@ class ResultInfo:
             self._message = result_info._message
         else:
             self._message = result_info
+        release_queue._track(self)
 
     def __str__(self):
         try:
@@ -92,10 +112,17 @@ class ResultInfo:
 
     @property
     def _names(self):
-        return [item.name for item in self.available_results]
+        return [item.name for item in self._get_results()]
+
+    def _get_names(self):
+        """Index of the first available result of each name."""
+        names = {}
+        for i, item in enumerate(self._get_results()):
+            names.setdefault(item.name, i)
+        return types.MappingProxyType(names)
 
     def __contains__(self, value):
-        return value in self._names
+        return value in self._get_names()
 
     @property
     def analysis_type(self):
@@ -125,11 +152,33 @@ class ResultInfo:
 
     @version_requires("3.0")
     def _get_property(self, property_name):
+        properties = self._get_properties()
+        if property_name in properties:
+            return properties[property_name]
         request = result_info_pb2.GetStringPropertiesRequest()
         request.result_info.CopyFrom(self._message)
         request.property_names.extend([property_name])
         return self._stub.GetStringProperties(request).properties[property_name]
 
+    def _get_properties(self):
+        """String properties of the result info, fetched in one request.
+
+        Returns
+        -------
+        properties : mappingproxy
+            Read-only mapping of the properties by name, empty when the
+            server rejects the request, in which case the properties are
+            requested one by one.
+        """
+        request = result_info_pb2.GetStringPropertiesRequest()
+        request.result_info.CopyFrom(self._message)
+        request.property_names.extend(_STRING_PROPERTIES)
+        try:
+            properties = self._stub.GetStringProperties(request).properties
+        except grpc.RpcError:
+            return types.MappingProxyType({})
+        return types.MappingProxyType(dict(properties))
+
     @property
     def physics_type(self):
         """Type of the physics.
@@ -293,10 +342,21 @@ class ResultInfo:
         -------
         available_result : list[AvailableResult]
         """
-        out = []
-        for i in range(len(self)):
-            out.append(self._get_result(i))
-        return out
+        return list(self._get_results())
+
+    def _get_results(self):
+        """Available results, requested all at once and kept in a tuple.
+
+        The server describes one result per request: the requests are sent
+        without waiting for the previous responses.
+        """
+        calls = []
+        for numres in range(len(self)):
+            request = result_info_pb2.AvailableResultRequest()
+            request.result_info.CopyFrom(self._message)
+            request.numres = numres
+            calls.append(self._stub.ListResult.future(request))
+        return tuple(available_result.AvailableResult(call.result()) for call in calls)
 
     def _get_result(self, numres):
         """
@@ -314,12 +374,7 @@ class ResultInfo:
         elif numres < 0:
             raise IndexError("Result index must be greater than 0")
 
-        request = result_info_pb2.AvailableResultRequest()
-        request.result_info.CopyFrom(self._message)
-        request.numres = numres
-        res = self._stub.ListResult(request)
-
-        return available_result.AvailableResult(res)
+        return self._get_results()[numres]
 
     def __len__(self):
         try:
@@ -335,9 +390,10 @@ class ResultInfo:
         if isinstance(key, int):
             index = key
         elif isinstance(key, str):
-            if key not in self._names:
+            names = self._get_names()
+            if key not in names:
                 raise ValueError('Invalid key "%s"' % key)
-            index = self._names.index(key)
+            index = names[key]
         else:
             raise TypeError('"%s" is an invalid keytype' % type(key))
 
@@ -349,11 +405,17 @@ class ResultInfo:
 
     def __del__(self):
         try:
-            self._stub.Delete(self._message)
+            release_queue._release(self, self._stub.Delete, self._message)
         except:
             pass
 
     def _get_list(self):
         return self._stub.List(self._message)
 
-    _to_cache = {_get_list: None, _get_result: None, _get_property: None}
+    _to_cache = {
+        _get_list: None,
+        _get_property: None,
+        _get_properties: None,
+        _get_results: None,
+        _get_names: None,
+    }
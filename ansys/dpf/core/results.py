@@ -7,9 +7,15 @@ This module contains the Results and Result classes that are created by the mode
 to easily access results in result files."""
 import functools
 
+import grpc
+import numpy as np
 
 from ansys.dpf.core import Operator
-from ansys.dpf.core import errors
+from ansys.dpf.core import errors, scoping
+from ansys.dpf.core.check_version import server_meet_version
+from ansys.dpf.core.dpf_operator import available_operator_names
+from ansys.dpf.core.field import Field
+from ansys.dpf.core.fields_container import FieldsContainer
 from ansys.dpf.core.scoping import Scoping
 from ansys.dpf.core.custom_fields_container import (
     ElShapeFieldsContainer,
@@ -118,14 +124,27 @@ class Results:
             return
         # dynamically add function based on input type
         self._op_map_rev = {}
+        available_operators = self._available_operator_names()
         for result_type in self._result_info:
             try:
-                doc = Operator(
-                    result_type.operator_name, server=self._model._server
-                ).__str__()
+                if available_operators is not None:
+                    # the documentation is read on first access
+                    if result_type.operator_name not in available_operators:
+                        continue
+                    doc = None
+                else:
+                    doc = Operator(
+                        result_type.operator_name, server=self._model._server
+                    ).__str__()
                 bound_method = self.__result__
                 method2 = functools.partial(bound_method, result_type)
-                setattr(self.__class__, result_type.name, property(method2, doc=doc))
+                setattr(
+                    self.__class__,
+                    result_type.name,
+                    _ResultProperty(
+                        method2, result_type.operator_name, self._model._server, doc
+                    ),
+                )
 
                 self._op_map_rev[result_type.name] = result_type.name
             except errors.DPFServerException:
@@ -134,6 +153,16 @@ class Results:
                 print(result_type.name)
                 raise e
 
+    def _available_operator_names(self):
+        """Names of the operators available on the server or ``None`` when
+        the server cannot list them."""
+        if not server_meet_version("3.0", self._model._server):
+            return None
+        try:
+            return set(available_operator_names(self._model._server))
+        except grpc.RpcError:
+            return None
+
     def __str__(self):
         return str(self._result_info)
 
@@ -152,6 +181,28 @@ class Results:
         return len(self._op_map_rev)
 
 
+class _ResultProperty(property):
+    """Property creating a ``Result`` on access. Its documentation is the
+    description of the result operator, retrieved on first read."""
+
+    def __init__(self, fget, operator_name, server, doc=None):
+        super().__init__(fget)
+        self._operator_name = operator_name
+        self._server = server
+        self._doc = doc
+
+    @property
+    def __doc__(self):
+        if self._doc is None:
+            self._doc = Operator(self._operator_name, server=self._server).__str__()
+        return self._doc
+
+    @__doc__.setter
+    def __doc__(self, value):
+        # the documentation given by ``property`` is ignored
+        pass
+
+
 class Result:
     """Helps with using DPF's result providers.
 
@@ -197,35 +248,37 @@ class Result:
         else:
             self._result_info = result_info
         self._specific_fc_type = None
-        from ansys.dpf.core import operators
-
+        self._doc = None
         try:
-            # create the operator to read its documentation
-            # if the operator doesn't exist, the method will not be added
-            doc = Operator(
-                self._result_info.operator_name, server=self._model._server
-            ).__str__()
-            self.__doc__ = doc
-            if hasattr(operators, "result") and hasattr(
-                operators.result, self._result_info.name
-            ):
-                self._operator = getattr(operators.result, self._result_info.name)(
-                    server=self._model._server
-                )
-            else:
-                self._operator = Operator(
-                    self._result_info.operator_name, server=self._model._server
-                )
-            self._operator._add_sub_res_operators(self._result_info.sub_results)
-            self._model.__connect_op__(self._operator)
+            self._operator = self._new_operator()
         except errors.DPFServerException:
             pass
         except Exception as e:
             print(self._result_info.name)
             raise e
 
+    def _new_operator(self):
+        """Result provider connected to the model."""
+        from ansys.dpf.core import operators
+
+        if hasattr(operators, "result") and hasattr(
+            operators.result, self._result_info.name
+        ):
+            op = getattr(operators.result, self._result_info.name)(
+                server=self._model._server
+            )
+        else:
+            op = Operator(self._result_info.operator_name, server=self._model._server)
+        op._add_sub_res_operators(self._result_info.sub_results)
+        self._model.__connect_op__(op)
+        return op
+
     def __call__(self, time_scoping=None, mesh_scoping=None):
-        op = self._operator
+        return self._connect_inputs(self._operator, time_scoping, mesh_scoping)
+
+    def _connect_inputs(self, op, time_scoping=None, mesh_scoping=None):
+        """Connect the scopings and the location chosen for the result to a
+        result provider."""
         if time_scoping:
             op.inputs.time_scoping(time_scoping)
         elif self._time_scoping:
@@ -267,6 +320,112 @@ class Result:
             fc = BodyFieldsContainer(fields_container=fc, server=fc._server)
         return fc
 
+    def reduce(self, func, chunk_time_sets=50):
+        """Reduce the result over its time sets without evaluating all of
+        them at once.
+
+        The result provider is evaluated on chunks of ``chunk_time_sets``
+        time sets and the data of each field is folded into a running
+        accumulator with ``func(accumulator, data)``. The server objects of
+        a chunk are released before the next one is evaluated, so that the
+        memory used is bounded by the size of a chunk instead of by the
+        number of time sets.
+
+        The time sets are the ones chosen with ``on_time_scoping`` or
+        ``on_all_time_freqs``, all the time sets by default.
+
+        When the entities of the fields change over the time sets, the
+        reduced field is scoped on all of them, and the data of an entity is
+        reduced over the time sets where it is defined. Fields with several
+        values per entity (for example elemental nodal fields) can only be
+        reduced over fields with the same entities.
+
+        Parameters
+        ----------
+        func : callable
+            Binary function returning the reduction of two arrays of the
+            shape of the fields data, for example ``numpy.maximum`` or
+            ``numpy.add``. When ``func`` is a ``numpy.ufunc``, the
+            accumulator is updated in place.
+        chunk_time_sets : int, optional
+            Number of time sets evaluated at once. The default is ``50``.
+
+        Returns
+        -------
+        reduced : Field, FieldsContainer
+            Field holding the reduced data, or, when the result has other
+            labels than ``"time"`` (for example ``"complex"`` or ``"mat"``),
+            fields container with one reduced field per label space of
+            these labels.
+
+        Examples
+        --------
+        Compute the envelope of the displacement over all the time sets.
+
+        >>> import numpy as np
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.msup_transient)
+        >>> disp = model.results.displacement
+        >>> max_disp = disp.reduce(np.maximum, chunk_time_sets=5)
+        >>> len(max_disp.scoping)
+        393
+
+        """
+        if chunk_time_sets < 1:
+            raise ValueError("chunk_time_sets must be a positive integer.")
+        from ansys.dpf.core.time_freq_scoping_factory import scoping_by_sets
+
+        time_scoping = self._time_scoping
+        if time_scoping is None:
+            time_scoping = list(
+                range(1, len(self._model.metadata.time_freq_support.time_frequencies) + 1)
+            )
+        elif isinstance(time_scoping, Scoping):
+            time_scoping = time_scoping.ids
+        elif not isinstance(time_scoping, (list, tuple, range, np.ndarray)):
+            time_scoping = [time_scoping]
+        time_scoping = list(time_scoping)
+        by_sets = all(isinstance(t, (int, np.integer)) for t in time_scoping)
+
+        server = self._model._server
+        # the chunks are evaluated by their own provider so that the time
+        # scoping of the result operator is not changed
+        op = self._new_operator()
+        accumulators = {}
+        for start in range(0, len(time_scoping), chunk_time_sets):
+            chunk = time_scoping[start : start + chunk_time_sets]
+            if by_sets:
+                chunk = scoping_by_sets([int(t) for t in chunk], server=server)
+            fc = self._connect_inputs(op, time_scoping=chunk).outputs.fields_container()
+            for i, field in enumerate(fc):
+                label_space = fc.get_label_space(i)
+                label_space.pop("time", None)
+                key = tuple(sorted(label_space.items()))
+                data = field.data
+                ids = field.scoping._get_ids(np_array=True)
+                if key not in accumulators:
+                    accumulators[key] = (field, ids, ids, np.array(data))
+                    continue
+                first, first_ids, acc_ids, accumulator = accumulators[key]
+                accumulator, acc_ids = _fold(func, accumulator, acc_ids, data, ids)
+                accumulators[key] = (first, first_ids, acc_ids, accumulator)
+            fc = field = None
+            server.flush_released_objects()
+        op = None
+
+        reduced = {
+            key: _reduced_field(first, first_ids, ids, accumulator, server)
+            for key, (first, first_ids, ids, accumulator) in accumulators.items()
+        }
+        if len(reduced) == 1 and not next(iter(reduced)):
+            return next(iter(reduced.values()))
+        fc = FieldsContainer(server=server)
+        fc.labels = sorted({label for key in reduced for label, _ in key})
+        for key, field in reduced.items():
+            fc.add_field(dict(key), field)
+        return fc
+
     @property
     def on_all_time_freqs(self):
         """Sets the time scoping to all the time frequencies available in the time frequency support.
@@ -553,6 +712,75 @@ class Result:
         return self
 
 
+def _fold(func, accumulator, acc_ids, data, ids):
+    """Reduce the data of a field into the accumulator of the entities
+    ``acc_ids``. The entities of the field which are not in the accumulator
+    are appended to it with their data. Returns the accumulator and its
+    entities."""
+    if np.array_equal(ids, acc_ids):
+        if data.shape != accumulator.shape:
+            raise ValueError(
+                f"Fields of shape {data.shape} and {accumulator.shape} "
+                f"cannot be reduced together."
+            )
+        if isinstance(func, np.ufunc):
+            func(accumulator, data, out=accumulator)
+            return accumulator, acc_ids
+        return np.asarray(func(accumulator, data)), acc_ids
+    if len(data) != len(ids) or len(accumulator) != len(acc_ids):
+        raise ValueError(
+            "Fields with several values per entity and different entities "
+            "cannot be reduced together."
+        )
+    indices = scoping._IdsIndexer(acc_ids).indices(ids)
+    present = indices >= 0
+    if data.shape[1:] != accumulator.shape[1:]:
+        raise ValueError(
+            f"Fields of shape {data.shape} and {accumulator.shape} "
+            f"cannot be reduced together."
+        )
+    rows = indices[present]
+    accumulator[rows] = func(accumulator[rows], data[present])
+    if not np.all(present):
+        accumulator = np.concatenate([accumulator, data[~present]])
+        acc_ids = np.concatenate([acc_ids, ids[~present]])
+    return accumulator, acc_ids
+
+
+def _reduced_field(first, first_ids, ids, data, server):
+    """Field with the definition of ``first``, scoped on ``ids``, and the
+    data ``data``. ``first_ids`` are the IDs of the scoping of ``first``."""
+    field = Field(nentities=len(data), location=first.location, server=server)
+    field.field_definition = first.field_definition
+    if np.array_equal(ids, first_ids):
+        field.scoping = first.scoping
+    else:
+        reduced_scoping = Scoping(location=first.scoping.location, server=server)
+        reduced_scoping.ids = ids
+        field.scoping = reduced_scoping
+    field.data = data
+    return field
+
+
+class _OperatorDescription:
+    """Documentation of the ``Result`` class, or of a ``Result`` instance in
+    which case it is the description of its operator, retrieved on first
+    read."""
+
+    def __init__(self, class_doc):
+        self._class_doc = class_doc
+
+    def __get__(self, obj, objtype=None):
+        if obj is None or getattr(obj, "_operator", None) is None:
+            return self._class_doc
+        if obj._doc is None:
+            obj._doc = obj._operator.__str__()
+        return obj._doc
+
+
+Result.__doc__ = _OperatorDescription(Result.__doc__)
+
+
 class CommonResults(Results):
     """Default implementation of the class:'Results'.
     Is created by default by the 'Model' with the method:'results'.
@@ -6,7 +6,8 @@ Scoping
 """
 
 import array
-import sys
+import threading
+import time
 
 import numpy as np
 from ansys.dpf.core.check_version import server_meet_version, version_requires
@@ -14,6 +15,8 @@ from ansys.dpf.core.common import _common_progress_bar, locations
 from ansys.dpf.core import misc
 from ansys.grpc.dpf import base_pb2, scoping_pb2, scoping_pb2_grpc
 from ansys.dpf.core.cache import _setter
+from ansys.dpf.core import release_queue
+from ansys.dpf.core import transport
 
 
 class Scoping:
@@ -72,6 +75,7 @@ class Scoping:
             self._message = self._stub.Create(request)
         else:
             self._message = scoping
+        release_queue._track(self)
 
         if ids:
             self.ids = ids
@@ -126,22 +130,32 @@ class Scoping:
         -----
         Print a progress bar.
         """
-        # must convert to a list for gRPC
+        # must convert to a contiguous int32 array for gRPC
         if isinstance(ids, range):
-            ids = np.array(list(ids), dtype=np.int32)
+            ids = np.arange(ids.start, ids.stop, ids.step, dtype=np.int32)
         elif not isinstance(ids, (np.ndarray, np.generic)):
             ids = np.array(ids, dtype=np.int32)
         else:
-            ids = np.array(list(ids), dtype=np.int32)
+            ids = np.ascontiguousarray(ids.reshape(ids.size), dtype=np.int32)
 
         metadata = [("size_int", f"{len(ids)}")]
         request = scoping_pb2.UpdateIdsRequest()
         request.scoping.CopyFrom(self._message)
+        compression = transport._policy(self._server).grpc_compression
         if server_meet_version("2.1", self._server):
-            self._stub.UpdateIds(_data_chunk_yielder(request, ids), metadata=metadata)
+            self._stub.UpdateIds(
+                _data_chunk_yielder(request, ids),
+                metadata=metadata,
+                compression=compression,
+            )
         else:
+            # the servers older than 2.1 keep their previous message size
             self._stub.UpdateIds(
-                _data_chunk_yielder(request, ids, 8.0e6), metadata=metadata
+                _data_chunk_yielder(
+                    request, ids, misc.LEGACY_CHUNK_VALUES * ids.itemsize
+                ),
+                metadata=metadata,
+                compression=compression,
             )
 
     def _get_ids(self, np_array=False):
@@ -296,7 +310,7 @@ class Scoping:
 
     def __del__(self):
         try:
-            self._stub.Delete(self._message)
+            release_queue._release(self, self._stub.Delete, self._message)
         except:
             pass
 
@@ -405,12 +419,21 @@ class _LocalScoping(Scoping):
         self.__cache_data__()
 
     def __cache_data__(self):
-        self._scoping_ids_copy = self._owner_scoping._get_ids(False)
+        self._scoping_ids_copy = _GrowableArray(
+            self._owner_scoping._get_ids(True), dtype=np.int32
+        )
         self._location = self._owner_scoping.location
         self.__init_map__()
 
     def __init_map__(self):
-        self._mapper = dict(zip(self._scoping_ids_copy, np.arange(self._count())))
+        # the map from the IDs to their indices is only built when it is used
+        self._mapper = None
+
+    def _get_mapper(self):
+        if self._mapper is None:
+            ids = self._scoping_ids_copy.tolist()
+            self._mapper = dict(zip(ids, range(len(ids))))
+        return self._mapper
 
     def _count(self):
         """
@@ -455,13 +478,9 @@ class _LocalScoping(Scoping):
         -----
         Print a progress bar.
         """
-        # must convert to a list for gRPC
         if isinstance(ids, range):
-            ids = list(ids)
-        elif isinstance(ids, (np.ndarray, np.generic)):
-            ids = ids.tolist()
-
-        self._scoping_ids_copy = ids
+            ids = np.arange(ids.start, ids.stop, ids.step, dtype=np.int32)
+        self._scoping_ids_copy = _GrowableArray(ids, dtype=np.int32)
         self.__init_map__()
 
     def _get_ids(self, np_array=False):
@@ -476,9 +495,9 @@ class _LocalScoping(Scoping):
         Print a progress bar.
         """
         if np_array:
-            return np.ndarray(self._scoping_ids_copy, dtype=np.int32)
+            return self._scoping_ids_copy.copy()
         else:
-            return self._scoping_ids_copy
+            return self._scoping_ids_copy.tolist()
 
     @_setter
     def set_id(self, index, scopingid):
@@ -491,17 +510,32 @@ class _LocalScoping(Scoping):
         scopingid : int
             ID of the scoping.
         """
-        init_size = self._count()
-        if init_size <= index:
-            for i in range(init_size, index+1):
-                self._scoping_ids_copy.append(-1)
+        if self._count() <= index:
+            self._scoping_ids_copy.resize(index + 1, -1)
         self._scoping_ids_copy[index] = scopingid
-        self._mapper[scopingid] = index
+        if self._mapper is not None:
+            self._mapper[scopingid] = index
 
     @_setter
     def append(self, id):
         self._scoping_ids_copy.append(id)
-        self._mapper[id] = len(self)-1
+        if self._mapper is not None:
+            self._mapper[id] = len(self) - 1
+
+    @_setter
+    def append_many(self, ids):
+        """Add several IDs at the end of the scoping.
+
+        Parameters
+        ----------
+        ids : list of int, numpy.ndarray
+            IDs to add.
+        """
+        start = len(self)
+        self._scoping_ids_copy.extend(ids)
+        if self._mapper is not None:
+            added = self._scoping_ids_copy[start:].tolist()
+            self._mapper.update(zip(added, range(start, start + len(added))))
 
     def _get_id(self, index):
         """Retrieve the index that the scoping ID is located on.
@@ -516,7 +550,7 @@ class _LocalScoping(Scoping):
         id : int
             ID of the scoping's index.
         """
-        return self._scoping_ids_copy[index]
+        return int(self._scoping_ids_copy[index])
 
     def _get_index(self, scopingid):
         """Retrieve an ID corresponding to an ID in the scoping.
@@ -531,12 +565,12 @@ class _LocalScoping(Scoping):
         index : int
             Index of the ID.
         """
-        return self._mapper[scopingid]
+        return self._get_mapper()[scopingid]
 
     def release_data(self):
         """Release the data."""
         if hasattr(self, "_is_set") and self._is_set:
-            super()._set_ids(self._scoping_ids_copy)
+            super()._set_ids(self._scoping_ids_copy.array)
             super()._set_location(self._location)
 
     def __enter__(self):
@@ -556,9 +590,235 @@ class _LocalScoping(Scoping):
         pass
 
 
+class _IdsIndexer:
+    """Maps IDs to their indices in a list of IDs with vectorized lookups.
+
+    When the IDs are compact (their range is not much larger than their
+    number), a dense lookup table indexed by ID is used. Otherwise, the
+    IDs are sorted once and searched with ``numpy.searchsorted``.
+
+    Parameters
+    ----------
+    ids : list of int, numpy.ndarray
+        IDs, the index of each ID is its position in this list.
+    """
+
+    _max_dense_ratio = 2
+
+    def __init__(self, ids):
+        self._ids = np.asarray(ids, dtype=np.int64).reshape(-1)
+        self._lookup = None
+        self._sorter = None
+        self._sorted_ids = None
+        self._min_id = 0
+        n_ids = self._ids.size
+        if n_ids == 0:
+            self._sorter = np.empty(0, dtype=np.int64)
+            self._sorted_ids = self._ids
+            return
+        self._min_id = int(self._ids.min())
+        span = int(self._ids.max()) - self._min_id + 1
+        if span <= self._max_dense_ratio * n_ids:
+            self._lookup = np.full(span, -1, dtype=np.int64)
+            self._lookup[self._ids - self._min_id] = np.arange(n_ids)
+        else:
+            self._sorter = np.argsort(self._ids, kind="stable")
+            self._sorted_ids = self._ids[self._sorter]
+
+    @property
+    def ids(self):
+        """IDs mapped by this object."""
+        return self._ids
+
+    def __len__(self):
+        return self._ids.size
+
+    def indices(self, ids):
+        """Retrieve the indices of several IDs at once.
+
+        Parameters
+        ----------
+        ids : list of int, numpy.ndarray
+            IDs to look for.
+
+        Returns
+        -------
+        indices : numpy.ndarray
+            Index of each ID, ``-1`` for IDs that are not found.
+        """
+        ids = np.asarray(ids, dtype=np.int64).reshape(-1)
+        if self._lookup is not None:
+            out = np.full(ids.size, -1, dtype=np.int64)
+            positions = ids - self._min_id
+            valid = (positions >= 0) & (positions < self._lookup.size)
+            out[valid] = self._lookup[positions[valid]]
+            return out
+        if self._sorted_ids.size == 0:
+            return np.full(ids.size, -1, dtype=np.int64)
+        positions = np.searchsorted(self._sorted_ids, ids)
+        positions[positions == self._sorted_ids.size] = 0
+        found = self._sorted_ids[positions] == ids
+        return np.where(found, self._sorter[positions], -1)
+
+    def map_ids(self, ids):
+        """Retrieve the indices of the IDs which are found and the mask of these IDs.
+
+        Parameters
+        ----------
+        ids : list of int, numpy.ndarray
+            IDs to look for.
+
+        Returns
+        -------
+        indices : numpy.ndarray
+            Indices of the IDs which are found.
+        mask : numpy.ndarray
+            Boolean mask of the IDs which are found.
+        """
+        indices = self.indices(ids)
+        mask = indices >= 0
+        return indices[mask], mask
+
+    def as_dict(self):
+        """Mapping between the IDs and their indices as a dictionary."""
+        return dict(zip(self._ids.tolist(), range(self._ids.size)))
+
+
+class _GrowableArray:
+    """Typed one-dimensional array with amortized constant time appends.
+
+    The values are stored in a NumPy buffer whose capacity is doubled when
+    it is full, so that building an array item by item costs the memory of
+    the raw values instead of one Python object per value.
+
+    Parameters
+    ----------
+    values : list, numpy.ndarray, optional
+        Initial values.
+    dtype : numpy.dtype, optional
+        Type of the values. The default is ``numpy.float64``.
+    """
+
+    _min_capacity = 16
+
+    def __init__(self, values=(), dtype=np.float64):
+        values = np.array(values, dtype=dtype).reshape(-1)
+        self._buffer = values
+        self._size = values.size
+
+    @property
+    def dtype(self):
+        return self._buffer.dtype
+
+    @property
+    def array(self):
+        """View on the values, invalidated by the next ``append`` or ``extend``."""
+        return self._buffer[: self._size]
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, key):
+        return self.array[key]
+
+    def __setitem__(self, key, value):
+        self.array[key] = value
+
+    def reserve(self, capacity):
+        """Make room for ``capacity`` values without reallocating."""
+        if capacity > self._buffer.size:
+            capacity = max(capacity, 2 * self._buffer.size, self._min_capacity)
+            buffer = np.empty(capacity, dtype=self._buffer.dtype)
+            buffer[: self._size] = self._buffer[: self._size]
+            self._buffer = buffer
+
+    def append(self, value):
+        self.reserve(self._size + 1)
+        self._buffer[self._size] = value
+        self._size += 1
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self._buffer.dtype).reshape(-1)
+        self.reserve(self._size + values.size)
+        self._buffer[self._size: self._size + values.size] = values
+        self._size += values.size
+
+    def resize(self, size, fill_value=0):
+        """Truncate the values or pad them with ``fill_value``."""
+        if size > self._size:
+            self.reserve(size)
+            self._buffer[self._size: size] = fill_value
+        self._size = size
+
+    def copy(self):
+        """Copy of the values as a ``numpy.ndarray``."""
+        return self.array.copy()
+
+    def tolist(self):
+        return self.array.tolist()
+
+
+class _ChunkSizeTuner:
+    """Chooses the size of the streamed messages from the throughput
+    measured on the previous transfers.
+
+    The throughput of each tried size is averaged over the transfers. The
+    best size is used once its neighbours (half and twice its size) have
+    been measured, otherwise the missing neighbour is tried.
+    """
+
+    _min_size = 64 * 1024
+    # the default receive limit of gRPC is 4 MB
+    _max_size = 2 * 1024 * 1024
+    # transfers of fewer messages are too short to be measured
+    _min_messages = 4
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._throughputs = {}
+
+    def chunk_size(self):
+        """Size in bytes of the messages of the next transfer."""
+        with self._lock:
+            if not self._throughputs:
+                return min(max(misc.DEFAULT_FILE_CHUNK_SIZE, self._min_size), self._max_size)
+            best = max(self._throughputs, key=self._throughputs.get)
+            for candidate in (best * 2, best // 2):
+                if (
+                    self._min_size <= candidate <= self._max_size
+                    and candidate not in self._throughputs
+                ):
+                    return candidate
+            return best
+
+    def record(self, chunk_size, n_messages, n_bytes, seconds):
+        """Record the duration of a transfer."""
+        if n_messages < self._min_messages or seconds <= 0:
+            return
+        throughput = n_bytes / seconds
+        with self._lock:
+            previous = self._throughputs.get(chunk_size)
+            if previous is not None:
+                throughput = (previous + throughput) / 2
+            self._throughputs[chunk_size] = throughput
+
+    def reset(self):
+        """Forget the measured throughputs."""
+        with self._lock:
+            self._throughputs = {}
+
+
+_CHUNK_SIZE_TUNER = _ChunkSizeTuner()
+
+
 def _data_chunk_yielder(request, data, chunk_size=None):
+    tuner = None
     if not chunk_size:
-        chunk_size = misc.DEFAULT_FILE_CHUNK_SIZE
+        if misc.CHUNK_SIZE_AUTO_TUNING:
+            tuner = _CHUNK_SIZE_TUNER
+            chunk_size = tuner.chunk_size()
+        else:
+            chunk_size = misc.DEFAULT_FILE_CHUNK_SIZE
 
     length = data.size
     need_progress_bar = length > 1e6
@@ -571,9 +831,13 @@ def _data_chunk_yielder(request, data, chunk_size=None):
     if length == 0:
         yield request
         return
-    unitary_size = int(chunk_size // sys.getsizeof(data[0]))
+    # ``chunk_size`` is in bytes, the numpy item size gives the real size
+    # of a value in the sent buffer
+    unitary_size = max(int(chunk_size // data.itemsize), 1)
     if length - sent_length < unitary_size:
         unitary_size = length - sent_length
+    n_messages = 0
+    start = time.perf_counter()
     while sent_length < length:
         currentcopy = data[sent_length: sent_length + unitary_size]
         request.array = currentcopy.tobytes()
@@ -581,11 +845,15 @@ def _data_chunk_yielder(request, data, chunk_size=None):
         if length - sent_length < unitary_size:
             unitary_size = length - sent_length
         yield request
+        n_messages += 1
         try:
             if need_progress_bar:
                 bar.update(sent_length)
         except:
             pass
+    if tuner is not None:
+        # the next message is asked once the previous one is sent
+        tuner.record(chunk_size, n_messages, data.nbytes, time.perf_counter() - start)
     try:
         if need_progress_bar:
             bar.finish()
@@ -624,12 +892,9 @@ def _data_get_chunk_(dtype, service, np_array=True):
 
     else:
         arr = []
-        if dtype == np.float:
-            dtype = "d"
-        else:
-            dtype = "i"
+        typecode = np.dtype(dtype).char
         for chunk in service:
-            arr.extend(array.array(dtype, chunk.array))
+            arr.extend(array.array(typecode, chunk.array))
             try:
                 if need_progress_bar:
                     bar.update(len(arr))
@@ -26,6 +26,9 @@ from ansys.dpf.core._version import (
     server_to_ansys_grpc_dpf_version
 )
 from ansys.dpf.core import session
+from ansys.dpf.core import profiler
+from ansys.dpf.core import release_queue
+from ansys.dpf.core import transport as transportlib
 import ansys.grpc.dpf
 
 MAX_PORT = 65535
@@ -343,6 +346,8 @@ class DpfServer:
             self._server_id = launch_dpf(ansys_path, ip, port, docker_name=docker_name)
 
         self.channel = grpc.insecure_channel("%s:%d" % (ip, port))
+        if profiler.PROFILING:
+            self.channel = profiler._profiled_channel(self.channel)
 
         # assign to global channel when requested
         if as_global:
@@ -358,6 +363,16 @@ class DpfServer:
         self._own_process = launch_server
         self._base_service_instance = None
         self._session_instance = None
+        self._release_queue = release_queue.ReleaseQueue(self)
+        self._transport = None
+        self._version = None
+        # names of the available operators, see ``available_operator_names``
+        self._operator_names = None
+        # files uploaded by target path, see ``FileTransferManager``
+        self._uploads = {}
+        # meshes bound to the outputs loaded from the result cache, by data
+        # sources, see ``ResultCache``
+        self._result_meshes = {}
 
         check_ansys_grpc_dpf_version(self, timeout)
 
@@ -422,7 +437,10 @@ class DpfServer:
         -------
         version : str
         """
-        return self._base_service.server_info["server_version"]
+        # the version cannot change during the connection
+        if self._version is None:
+            self._version = self._base_service.server_info["server_version"]
+        return self._version
 
     @property
     def os(self):
@@ -438,8 +456,69 @@ class DpfServer:
     def __str__(self):
         return f"DPF Server: {self.info}"
 
+    def flush_released_objects(self):
+        """Release now the server objects of the garbage collected DPF objects.
+
+        These objects are otherwise released in batches by a background thread.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> field = dpf.Field()
+        >>> del field
+        >>> dpf.SERVER.flush_released_objects()
+
+        """
+        self._release_queue.flush()
+
+    @property
+    def live_objects(self):
+        """Number of DPF objects of each type alive on the client and
+        holding an object on this server.
+
+        Returns
+        -------
+        dict[str, int]
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> field = dpf.Field()
+        >>> n_fields = dpf.SERVER.live_objects["Field"]
+
+        """
+        return self._release_queue.live_objects()
+
+    @property
+    def transport(self):
+        """Precision and compression of the arrays exchanged with this server.
+
+        Single precision transfers halve the volume of the field data
+        received from remote servers when double precision is not needed,
+        for example for plotting.
+
+        Returns
+        -------
+        :class:`ansys.dpf.core.transport.TransportPolicy`
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> dpf.SERVER.transport = dpf.TransportPolicy(precision="float")
+        >>> dpf.SERVER.transport = None
+
+        """
+        return self._transport or transportlib.DEFAULT_POLICY
+
+    @transport.setter
+    def transport(self, policy):
+        if policy is not None and not isinstance(policy, transportlib.TransportPolicy):
+            raise TypeError("A TransportPolicy or None is expected.")
+        self._transport = policy
+
     def shutdown(self):
         if self._own_process and self.live and self._base_service:
+            self._release_queue.discard()
             self._base_service._prepare_shutdown()
             if hasattr(self, "_server_id") and self._server_id:
                 run_cmd = f"docker stop {self._server_id}"
@@ -453,6 +532,9 @@ class DpfServer:
                 p.kill()
             time.sleep(0.01)
             self.live = False
+            # the uploaded files are not on the server anymore
+            self._uploads.clear()
+            self._result_meshes.clear()
             try:
                 if id(dpf.core.SERVER) == id(self):
                     dpf.core.SERVER = None
@@ -0,0 +1,262 @@
+"""
+.. _ref_server_pool:
+
+ServerPool
+==========
+Keeps a set of DPF servers started and lends them to the tasks which need
+them, so that batch jobs do not pay the start up time of a server per task.
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from ansys.grpc.dpf import base_pb2
+
+from ansys.dpf.core import server as serverlib
+
+LOG = logging.getLogger(__name__)
+LOG.setLevel("DEBUG")
+
+
+class ServerPool:
+    """Pool of warm DPF servers.
+
+    The servers are started when the pool is created and lent with
+    :func:`ServerPool.server` or :func:`ServerPool.acquire`. A server is
+    pinged before being lent and a server whose process crashed is replaced
+    by a new one.
+
+    Several channels can be opened on each server with
+    ``channels_per_server``. The pool then lends one connection per channel,
+    so several tasks can use the same server process concurrently, each on
+    its own channel.
+
+    Parameters
+    ----------
+    n_servers : int, optional
+        Number of servers to start. The default is ``2``.
+    channels_per_server : int, optional
+        Number of connections lent per server. The default is ``1``.
+    servers : list[server.DpfServer], optional
+        Already started servers to use instead of starting new ones, for
+        example servers started by another script and connected with
+        :func:`ansys.dpf.core.server.connect_to_server`. These servers are
+        not replaced when they crash. The default is ``None``.
+    **kwargs
+        Arguments passed to :func:`ansys.dpf.core.server.start_local_server`
+        to start the servers, for example ``ansys_path``.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> with dpf.ServerPool(n_servers=2) as pool:
+    ...     with pool.server() as server:
+    ...         model = dpf.Model(examples.static_rst, server=server)
+    ...         n_nodes = model.metadata.meshed_region.nodes.n_nodes
+
+    """
+
+    def __init__(self, n_servers=2, channels_per_server=1, servers=None, **kwargs):
+        if channels_per_server < 1:
+            raise ValueError("At least one channel per server is required.")
+        self._start_kwargs = kwargs
+        self._start_kwargs["as_global"] = False
+        self._channels_per_server = channels_per_server
+        self._condition = threading.Condition()
+        self._owns_servers = servers is None
+        if servers is None:
+            servers = [self._start_server() for _ in range(n_servers)]
+        self._servers = list(servers)
+        # connections lent by the pool, for each server
+        self._connections = [self._open_connections(s) for s in self._servers]
+        # slots (server index, channel index) available, alternating the
+        # servers so that the load is spread over the processes
+        self._available = [
+            (i_server, i_channel)
+            for i_channel in range(channels_per_server)
+            for i_server in range(len(self._servers))
+        ]
+        self._lent = {}
+        # indices of the servers being restarted
+        self._restarting = set()
+
+    def __len__(self):
+        return len(self._servers)
+
+    def __iter__(self):
+        return iter(self._servers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+
+    @property
+    def servers(self):
+        """Servers of the pool.
+
+        Returns
+        -------
+        list[server.DpfServer]
+        """
+        return list(self._servers)
+
+    def _start_server(self):
+        return serverlib.start_local_server(**self._start_kwargs)
+
+    def _open_connections(self, server):
+        connections = [server]
+        for _ in range(1, self._channels_per_server):
+            connections.append(
+                serverlib.connect_to_server(
+                    server._input_ip, server._input_port, as_global=False
+                )
+            )
+        return connections
+
+    @staticmethod
+    def is_healthy(server, timeout=5):
+        """Check whether a server answers.
+
+        Parameters
+        ----------
+        server : server.DpfServer
+            Server to ping.
+        timeout : float, optional
+            Maximum number of seconds to wait for the answer. The default
+            is ``5``.
+
+        Returns
+        -------
+        bool
+            ``True`` when the server answers.
+        """
+        try:
+            # the server information is cached by the base service, so the
+            # request is sent directly
+            server._base_service._stub.GetServerInfo(
+                base_pb2.ServerInfoRequest(), timeout=timeout
+            )
+            return True
+        except Exception:
+            return False
+
+    def acquire(self, timeout=None):
+        """Take a healthy server out of the pool.
+
+        The server must be given back with :func:`ServerPool.release`.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum number of seconds to wait for a server. The default is
+            ``None``, in which case there is no limit.
+
+        Returns
+        -------
+        server.DpfServer
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self._condition:
+            while not self._available:
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No server available after {timeout} seconds.")
+                self._condition.wait(remaining)
+            slot = self._available.pop(0)
+        i_server, i_channel = slot
+        connection = self._connections[i_server][i_channel]
+        if not self.is_healthy(connection):
+            try:
+                connection = self._recycle(i_server, i_channel)
+            except Exception:
+                with self._condition:
+                    self._available.append(slot)
+                    self._condition.notify()
+                raise
+        with self._condition:
+            self._lent[id(connection)] = slot
+        return connection
+
+    def release(self, server):
+        """Give a server back to the pool.
+
+        Parameters
+        ----------
+        server : server.DpfServer
+            Server returned by :func:`ServerPool.acquire`.
+        """
+        with self._condition:
+            slot = self._lent.pop(id(server), None)
+            if slot is None:
+                raise ValueError("The server was not acquired from this pool.")
+            self._available.append(slot)
+            self._condition.notify()
+
+    @contextmanager
+    def server(self, timeout=None):
+        """Lend a healthy server for the duration of a ``with`` block.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum number of seconds to wait for a server. The default is
+            ``None``, in which case there is no limit.
+
+        Yields
+        ------
+        server.DpfServer
+        """
+        server = self.acquire(timeout)
+        try:
+            yield server
+        finally:
+            self.release(server)
+
+    def _recycle(self, i_server, i_channel):
+        """Replace a crashed server and its connections."""
+        server = self._servers[i_server]
+        if not self._owns_servers:
+            raise RuntimeError(
+                f"The server at {server._input_ip}:{server._input_port} "
+                "does not answer."
+            )
+        with self._condition:
+            # another task may be replacing or have already replaced the server
+            while i_server in self._restarting:
+                self._condition.wait()
+            if self._servers[i_server] is not server:
+                return self._connections[i_server][i_channel]
+            self._restarting.add(i_server)
+        # the server is started without holding the lock so that the other
+        # servers can be lent and released in the meantime
+        connections = None
+        try:
+            if not self.is_healthy(server):
+                LOG.debug(f"Restarting server {i_server} of the pool.")
+                # the process is dead, nothing has to be shut down
+                server.live = False
+                connections = self._open_connections(self._start_server())
+        finally:
+            with self._condition:
+                self._restarting.discard(i_server)
+                if connections is not None:
+                    self._servers[i_server] = connections[0]
+                    self._connections[i_server] = connections
+                self._condition.notify_all()
+        return self._connections[i_server][i_channel]
+
+    def shutdown(self):
+        """Shut down the servers started by the pool."""
+        if self._owns_servers:
+            for server in self._servers:
+                try:
+                    server.shutdown()
+                except Exception:
+                    pass
+        with self._condition:
+            self._available = []
+            self._lent = {}
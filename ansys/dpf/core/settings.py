@@ -7,6 +7,11 @@ Customize the behavior of the module.
 
 from ansys.dpf.core.misc import module_exists
 from ansys.dpf.core import misc
+from ansys.dpf.core import profiler
+from ansys.dpf.core import result_cache
+from ansys.dpf.core import release_queue
+from ansys.dpf.core import specification_cache
+from ansys.dpf.core import transport
 
 def disable_off_screen_rendering() -> None:
     """No pop up windows appears to plot data with ``matplotlib`` or ``pyvista``"""
@@ -50,8 +55,55 @@ def disable_interpreter_properties_evaluation() -> bool:
     return False
 
 def set_upload_chunk_size(num_bytes = misc.DEFAULT_FILE_CHUNK_SIZE) -> None:
+    """Set the size in bytes of the messages streamed to the server when
+    uploading files and when sending field data or scoping ids.
+
+    Larger chunks reduce the number of messages sent for large arrays,
+    which is beneficial on high bandwidth connections to remote servers.
+
+    Parameters
+    ----------
+    num_bytes : int, optional
+        Number of bytes per message. The default is ``524288``.
+
+    Examples
+    --------
+
+    >>> from ansys.dpf import core as dpf
+    >>> dpf.settings.set_upload_chunk_size(2 * 1024 * 1024)
+    >>> dpf.settings.set_upload_chunk_size()
+
+    """
     misc.DEFAULT_FILE_CHUNK_SIZE = num_bytes
 
+def set_chunk_size_auto_tuning(enabled=True) -> None:
+    """Choose the size of the messages streamed to the server when sending
+    field data or scoping ids from the throughput measured on the previous
+    transfers.
+
+    The sizes between 64 KB and 2 MB are tried, starting from the upload
+    chunk size (see :func:`set_upload_chunk_size`), and the fastest one is
+    kept. The measures are shared by all the servers.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Whether the size is tuned. The default is ``True``.
+
+    Examples
+    --------
+
+    >>> from ansys.dpf import core as dpf
+    >>> dpf.settings.set_chunk_size_auto_tuning()
+    >>> dpf.settings.set_chunk_size_auto_tuning(False)
+
+    """
+    from ansys.dpf.core import scoping
+
+    misc.CHUNK_SIZE_AUTO_TUNING = enabled
+    if not enabled:
+        scoping._CHUNK_SIZE_TUNER.reset()
+
 def set_dynamic_available_results_capability(value) -> None:
     """Disables the evaluation of the available results and
     the dynamic creation of the results properties when a ''Model'' is created.
@@ -69,4 +121,147 @@ def set_dynamic_available_results_capability(value) -> None:
     >>> dpf.settings.set_dynamic_available_results_capability(True)
 
     """
-    misc.DYNAMIC_RESULTS = value
\ No newline at end of file
+    misc.DYNAMIC_RESULTS = value
+
+def enable_result_cache(path=None, max_size=2 ** 30):
+    """Store the outputs of the operators on the local disk and reuse them
+    when the same operators are evaluated again on unchanged result files.
+
+    Only the operators whose inputs are connected while the cache is enabled
+    are cached, so the cache must be enabled before creating the models.
+
+    Parameters
+    ----------
+    path : str, optional
+        Directory where the outputs are stored. The default is ``None``, in
+        which case the user cache directory is used.
+    max_size : int, optional
+        Maximum size of the cache in bytes. The least recently used outputs
+        are removed above this size. The default is ``2**30`` (1 GB).
+
+    Returns
+    -------
+    :class:`ansys.dpf.core.result_cache.ResultCache`
+        Cache used by the operators.
+
+    Examples
+    --------
+
+    >>> from ansys.dpf import core as dpf
+    >>> cache = dpf.settings.enable_result_cache()
+    >>> dpf.settings.disable_result_cache()
+
+    """
+    result_cache._RESULT_CACHE = result_cache.ResultCache(path, max_size)
+    return result_cache._RESULT_CACHE
+
+def disable_result_cache() -> None:
+    """Stop storing and reusing the outputs of the operators.
+
+    The outputs already stored on the disk are kept.
+    """
+    result_cache._RESULT_CACHE = None
+
+def enable_operator_specification_cache(path=None):
+    """Store the specifications of the operators on the local disk so that
+    the next sessions connecting to servers of the same version do not
+    request them again.
+
+    The specifications are always cached in memory for the current session.
+
+    Parameters
+    ----------
+    path : str, optional
+        Directory where the specifications are stored. The default is
+        ``None``, in which case the user cache directory is used.
+
+    Returns
+    -------
+    :class:`ansys.dpf.core.specification_cache.SpecificationCache`
+        Cache used by the operators.
+
+    Examples
+    --------
+
+    >>> from ansys.dpf import core as dpf
+    >>> cache = dpf.settings.enable_operator_specification_cache()
+    >>> dpf.settings.disable_operator_specification_cache()
+
+    """
+    if path is None:
+        path = specification_cache._default_cache_path()
+    specification_cache._SPECIFICATION_CACHE = specification_cache.SpecificationCache(path)
+    return specification_cache._SPECIFICATION_CACHE
+
+def disable_operator_specification_cache() -> None:
+    """Stop storing the specifications of the operators on the local disk.
+
+    The specifications already stored on the disk are kept.
+    """
+    specification_cache._SPECIFICATION_CACHE = specification_cache.SpecificationCache()
+
+def set_deferred_release(value=True) -> None:
+    """Release the server objects of the garbage collected DPF objects in
+    batches on a background thread, or one by one when they are collected.
+
+    Parameters
+    ----------
+    value : bool, optional
+        With ``True``, the server objects are released in batches. The
+        default is ``True``.
+
+    Examples
+    --------
+
+    >>> from ansys.dpf import core as dpf
+    >>> dpf.settings.set_deferred_release(False)
+    >>> dpf.settings.set_deferred_release()
+
+    """
+    release_queue.DEFERRED_RELEASE = value
+
+def set_grpc_profiling(enabled=True) -> None:
+    """Record the gRPC calls made to the servers started from now on in the
+    active :func:`ansys.dpf.core.profile` blocks.
+
+    The calls made to the servers started while the profiling is disabled
+    are not intercepted and are never recorded.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Whether the channels of the servers started from now on are
+        profiled. The default is ``True``.
+
+    Examples
+    --------
+
+    >>> from ansys.dpf import core as dpf
+    >>> dpf.settings.set_grpc_profiling()
+    >>> dpf.settings.set_grpc_profiling(False)
+
+    """
+    profiler.PROFILING = enabled
+
+def set_default_transport(precision="double", compression=None) -> None:
+    """Set the precision and compression of the arrays exchanged with the
+    servers which do not define their own transport policy.
+
+    Parameters
+    ----------
+    precision : str, optional
+        Precision of the floating point values received from the servers,
+        ``"double"`` or ``"float"``. The default is ``"double"``.
+    compression : str, optional
+        Compression of the integer streams sent to the servers, ``"gzip"``,
+        ``"deflate"`` or ``None``. The default is ``None``.
+
+    Examples
+    --------
+
+    >>> from ansys.dpf import core as dpf
+    >>> dpf.settings.set_default_transport("float", "gzip")
+    >>> dpf.settings.set_default_transport()
+
+    """
+    transport.DEFAULT_POLICY = transport.TransportPolicy(precision, compression)
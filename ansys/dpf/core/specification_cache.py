@@ -0,0 +1,229 @@
+"""
+.. _ref_specification_cache:
+
+SpecificationCache
+==================
+Keeps the specifications of the operators, so that creating operators does
+not require a request to the server for each instance.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import weakref
+
+from ansys.dpf.core import result_cache
+
+_SPECIFICATION_CACHE = None
+
+# specifications shipped by the classes of ``ansys.dpf.core.operators``
+_STATIC_SPECIFICATIONS = weakref.WeakKeyDictionary()
+
+
+def _default_cache_path():
+    return os.path.join(result_cache._default_cache_path(), "specifications")
+
+
+class SpecificationCache:
+    """Cache of operator specifications keyed by server version and
+    operator name.
+
+    The specifications are kept in memory and, when ``path`` is given, in
+    JSON files on the local disk so that they are reused by the next
+    sessions connecting to servers of the same version. The operators of
+    libraries loaded with :func:`ansys.dpf.core.core.load_library` are
+    cached like the others: clear the cache after changing such a library
+    without changing the server version.
+
+    The cached specifications are shared by all the operators of a name and
+    must not be modified.
+
+    Parameters
+    ----------
+    path : str, optional
+        Directory where the specifications are stored. The default is
+        ``None``, in which case the specifications are only kept in memory.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> cache = dpf.settings.enable_operator_specification_cache()
+    >>> spec = dpf.Operator.operator_specification("min_max")
+    >>> spec = dpf.Operator.operator_specification("min_max")  # read from the cache
+
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+        self._specifications = {}
+        self._lock = threading.Lock()
+
+    def get(self, version, name, fetch):
+        """Specification of an operator.
+
+        Parameters
+        ----------
+        version : str
+            Version of the server.
+        name : str
+            Name of the operator.
+        fetch : callable
+            Function returning the specification from the server when it is
+            not cached.
+
+        Returns
+        -------
+        :class:`ansys.dpf.core.dpf_operator.OperatorSpecification`
+        """
+        key = (version, name)
+        spec = self._specifications.get(key)
+        if spec is None:
+            spec = self._load(version, name)
+            if spec is None:
+                spec = fetch()
+                if spec is None:
+                    return None
+                self._store(version, name, spec)
+            with self._lock:
+                spec = self._specifications.setdefault(key, spec)
+        return spec
+
+    def __len__(self):
+        return len(self._specifications)
+
+    def clear(self):
+        """Remove all the cached specifications, in memory and on disk."""
+        with self._lock:
+            self._specifications.clear()
+        if self.path is None:
+            return
+        for root, _, files in os.walk(self.path):
+            for f in files:
+                if f.endswith(".json"):
+                    try:
+                        os.remove(os.path.join(root, f))
+                    except OSError:
+                        pass
+
+    def _file(self, version, name):
+        digest = hashlib.sha256(name.encode()).hexdigest()
+        return os.path.join(self.path, str(version), digest + ".json")
+
+    def _load(self, version, name):
+        if self.path is None:
+            return None
+        try:
+            with open(self._file(version, name), "r") as f:
+                desc = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if desc.get("operator_name") != name:
+            return None
+        return _specification_from_dict(desc)
+
+    def _store(self, version, name, spec):
+        if self.path is None:
+            return
+        path = self._file(version, name)
+        # write in a temporary file first so that concurrent readers never
+        # see a partially written specification
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(_specification_to_dict(spec), f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def _active_cache():
+    """Specification cache used by the operators."""
+    global _SPECIFICATION_CACHE
+    if _SPECIFICATION_CACHE is None:
+        _SPECIFICATION_CACHE = SpecificationCache()
+    return _SPECIFICATION_CACHE
+
+
+def _pin_to_list(pin):
+    return [pin.name, list(pin.type_names), pin.optional, pin.document, pin.ellipsis]
+
+
+def _specification_to_dict(spec):
+    return {
+        "operator_name": spec.operator_name,
+        "description": spec.description,
+        "properties": dict(spec.properties),
+        "inputs": {str(pin): _pin_to_list(p) for pin, p in spec.inputs.items()},
+        "outputs": {str(pin): _pin_to_list(p) for pin, p in spec.outputs.items()},
+    }
+
+
+def _specification_from_dict(desc):
+    from ansys.dpf.core.dpf_operator import OperatorSpecification, PinSpecification
+
+    def pins(values):
+        return {int(pin): PinSpecification(*p) for pin, p in values.items()}
+
+    return OperatorSpecification(
+        desc["operator_name"],
+        desc["description"],
+        desc["properties"],
+        pins(desc["inputs"]),
+        pins(desc["outputs"]),
+    )
+
+
+def _static_specification(operator_type, name):
+    """Specification shipped by a generated operator class, ``None`` for
+    the other classes."""
+    if "_spec" not in vars(operator_type):
+        return None
+    spec = _STATIC_SPECIFICATIONS.get(operator_type)
+    if spec is None:
+        from ansys.dpf.core.dpf_operator import OperatorSpecification, PinSpecification
+
+        def pins(values):
+            return {
+                pin: PinSpecification(
+                    p.name,
+                    list(p.type_names or []),
+                    bool(p.optional),
+                    p.document or "",
+                    bool(p.ellipsis),
+                )
+                for pin, p in (values or {}).items()
+            }
+
+        static = operator_type._spec()
+        spec = OperatorSpecification(
+            name, static.description, {}, pins(static.inputs), pins(static.outputs)
+        )
+        _STATIC_SPECIFICATIONS[operator_type] = spec
+    return spec
+
+
+def _operator_names(server, fetch):
+    """Names of the operators available on a server.
+
+    The names are kept by the server instance, so that a new server started
+    on the same address does not reuse them.
+    """
+    names = server._operator_names
+    if names is None:
+        names = fetch()
+        server._operator_names = names
+    return list(names)
+
+
+def _forget_operator_names(server):
+    """Forget the operator names of a server, for example after loading a
+    library."""
+    server._operator_names = None
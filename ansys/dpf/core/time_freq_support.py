@@ -6,6 +6,7 @@ from ansys import dpf
 from ansys.dpf import core
 from ansys.dpf.core import errors as dpf_errors
 from ansys.dpf.core.errors import protect_grpc
+from ansys.dpf.core import release_queue
 from ansys.grpc.dpf import (
     base_pb2,
     support_pb2,
@@ -60,6 +61,7 @@ class TimeFreqSupport:
         else:
             request = base_pb2.Empty()
             self._message = self._stub.Create(request)
+        release_queue._track(self)
 
     def __str__(self):
         """Describe the entity.
@@ -579,6 +581,6 @@ class TimeFreqSupport:
 
     def __del__(self):
         try:
-            self._stub.Delete(self._message)
+            release_queue._release(self, self._stub.Delete, self._message)
         except:
             pass
@@ -0,0 +1,185 @@
+"""
+.. _ref_transport:
+
+Transport
+=========
+Precision and compression of the arrays exchanged with the server.
+"""
+import contextlib
+import threading
+
+import grpc
+import numpy as np
+
+_PRECISIONS = {"double": np.float64, "float": np.float32}
+
+_COMPRESSIONS = {
+    None: grpc.Compression.NoCompression,
+    "gzip": grpc.Compression.Gzip,
+    "deflate": grpc.Compression.Deflate,
+}
+
+
+class TransportPolicy:
+    """Describes how the arrays are exchanged with a server.
+
+    Parameters
+    ----------
+    precision : str, optional
+        Precision of the floating point values received from the server,
+        either ``"double"`` or ``"float"``. With ``"float"``, the server
+        sends single precision values, halving the volume of the transfer,
+        and the data of the fields is returned as ``numpy.float32`` arrays.
+        The default is ``"double"``.
+    compression : str, optional
+        Compression of the integer streams sent to the server (scoping ids,
+        connectivities and data pointers), either ``"gzip"``, ``"deflate"``
+        or ``None``. The default is ``None``.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> policy = dpf.TransportPolicy(precision="float", compression="gzip")
+    >>> policy.dtype
+    <class 'numpy.float32'>
+
+    """
+
+    def __init__(self, precision="double", compression=None):
+        if precision not in _PRECISIONS:
+            raise ValueError(
+                f"precision must be one of {list(_PRECISIONS)}, not {precision!r}"
+            )
+        if compression not in _COMPRESSIONS:
+            raise ValueError(
+                f"compression must be one of {list(_COMPRESSIONS)}, not {compression!r}"
+            )
+        self._precision = precision
+        self._compression = compression
+
+    @property
+    def precision(self):
+        """Precision of the floating point values received from the server.
+
+        Returns
+        -------
+        str
+        """
+        return self._precision
+
+    @property
+    def compression(self):
+        """Compression of the integer streams sent to the server.
+
+        Returns
+        -------
+        str
+        """
+        return self._compression
+
+    @property
+    def dtype(self):
+        """Type of the floating point values received from the server."""
+        return _PRECISIONS[self._precision]
+
+    @property
+    def grpc_compression(self):
+        """``grpc.Compression`` of the integer streams."""
+        return _COMPRESSIONS[self._compression]
+
+    def replace(self, precision=None, compression=None):
+        """Copy of this policy with the given options changed.
+
+        Parameters
+        ----------
+        precision : str, optional
+            New precision. The default is ``None``, in which case the
+            precision is kept.
+        compression : str, optional
+            New compression. The default is ``None``, in which case the
+            compression is kept.
+
+        Returns
+        -------
+        TransportPolicy
+        """
+        return TransportPolicy(
+            self._precision if precision is None else precision,
+            self._compression if compression is None else compression,
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, TransportPolicy):
+            return NotImplemented
+        return (self._precision, self._compression) == (
+            other._precision,
+            other._compression,
+        )
+
+    def __hash__(self):
+        return hash((self._precision, self._compression))
+
+    def __repr__(self):
+        return (
+            f"TransportPolicy(precision={self._precision!r}, "
+            f"compression={self._compression!r})"
+        )
+
+
+# policy of the servers which do not define their own
+DEFAULT_POLICY = TransportPolicy()
+
+_OVERRIDES = threading.local()
+
+
+@contextlib.contextmanager
+def transport_policy(precision=None, compression=None):
+    """Override the transport policy of all the servers for the calls
+    made by the current thread in a ``with`` block.
+
+    Parameters
+    ----------
+    precision : str, optional
+        Precision of the floating point values received from the server,
+        ``"double"`` or ``"float"``. The default is ``None``, in which case
+        the precision of the server policy is used.
+    compression : str, optional
+        Compression of the integer streams sent to the server, ``"gzip"``
+        or ``"deflate"``. The default is ``None``, in which case the
+        compression of the server policy is used.
+
+    Examples
+    --------
+    Get the data of a field in single precision.
+
+    >>> from ansys.dpf import core as dpf
+    >>> field = dpf.fields_factory.create_scalar_field(2)
+    >>> field.data = [1.0, 2.0]
+    >>> with dpf.transport_policy(precision="float"):
+    ...     data = field.data
+    >>> data.dtype
+    dtype('float32')
+
+    """
+    # validate the options before entering the block
+    TransportPolicy().replace(precision, compression)
+    previous = getattr(_OVERRIDES, "options", None)
+    options = dict(previous or {})
+    if precision is not None:
+        options["precision"] = precision
+    if compression is not None:
+        options["compression"] = compression
+    _OVERRIDES.options = options
+    try:
+        yield
+    finally:
+        _OVERRIDES.options = previous
+
+
+def _policy(server):
+    """Transport policy of the calls made to a server by the current thread."""
+    policy = getattr(server, "transport", None) or DEFAULT_POLICY
+    options = getattr(_OVERRIDES, "options", None)
+    if options:
+        policy = policy.replace(**options)
+    return policy
@@ -9,6 +9,8 @@ from ansys import dpf
 from ansys.dpf.core import dpf_operator, inputs, outputs
 from ansys.dpf.core.errors import protect_grpc
 from ansys.dpf.core.check_version import server_meet_version, version_requires
+from ansys.dpf.core.common import _grpc_future_to_asyncio
+from ansys.dpf.core import release_queue
 from ansys.grpc.dpf import base_pb2, workflow_pb2, workflow_pb2_grpc
 
 LOG = logging.getLogger(__name__)
@@ -68,6 +70,18 @@ class Workflow:
             self.__create_from_stream(workflow)
         elif workflow is None or remote_copy_needed:
             self.__send_init_request(workflow)
+        self._progress_bar = True
+        release_queue._track(self)
+
+    @property
+    def progress_bar(self) -> bool:
+        """With this property, the user can choose to print a progress bar when
+        the workflow's output is requested, default is True"""
+        return self._progress_bar
+
+    @progress_bar.setter
+    def progress_bar(self, value: bool) -> None:
+        self._progress_bar = value
 
     @protect_grpc
     def connect(self, pin_name, inpt, pin_out=0):
@@ -117,7 +131,8 @@ class Workflow:
     @protect_grpc
     def get_output(self, pin_name, output_type):
         """Retrieve the output of the operator on the pin number.
-        A progress bar following the workflow state is printed.
+        A progress bar following the workflow state is printed, unless
+        ``progress_bar`` is set to ``False``.
 
         Parameters
         ----------
@@ -134,7 +149,7 @@ class Workflow:
 
         if output_type is not None:
             dpf_operator._write_output_type_to_proto_style(output_type, request)
-            if server_meet_version("3.0", self._server):
+            if server_meet_version("3.0", self._server) and self._progress_bar:
                 # handle progress bar
                 self._server._session.add_workflow(self, "workflow")
                 out_future = self._stub.Get.future(request)
@@ -153,6 +168,36 @@ class Workflow:
                 "please specify an output type to get the workflow's output"
             )
 
+    @protect_grpc
+    async def get_output_async(self, pin_name, output_type):
+        """Retrieve the output of the workflow on the pin name without
+        blocking the event loop.
+
+        The progress bar is not printed.
+
+        Parameters
+        ----------
+        pin_name : str
+            Name of the pin to retrieve. This name should be
+            exposed before with wf.set_output_name
+        output_type : core.type enum
+            Type of the requested output.
+        """
+        if output_type is None:
+            raise ValueError(
+                "please specify an output type to get the workflow's output"
+            )
+        request = workflow_pb2.WorkflowEvaluationRequest()
+        request.wf.CopyFrom(self._message)
+        request.pin_name = pin_name
+        dpf_operator._write_output_type_to_proto_style(output_type, request)
+        out = await _grpc_future_to_asyncio(self._stub.Get.future(request))
+        return dpf_operator._convertOutputMessageToPythonInstance(
+            out,
+            output_type,
+            self._server
+        )
+
     def set_input_name(self, name, *args):
         """Set the name of the input pin of the workflow to expose it for future connection.
 
@@ -531,7 +576,7 @@ class Workflow:
 
     def __del__(self):
         try:
-            self._stub.Delete(self._message)
+            release_queue._release(self, self._stub.Delete, self._message)
         except:
             pass
 
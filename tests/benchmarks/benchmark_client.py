@@ -0,0 +1,345 @@
+"""Benchmarks of the client side overhead of ``ansys.dpf.core``.
+
+The benchmarks run against the fake server of ``fake_server.py`` so that they
+only need the Python packages of the client:
+
+    python tests/benchmarks/benchmark_client.py --size 100000 --json out.json
+
+Each benchmark is run ``--repeat`` times, with as many calls per run as
+needed to last about 0.2 s. The best and median durations of a call are
+reported with, for the benchmarks moving arrays, the throughput in MB/s.
+Comparing the JSON outputs of two commits shows throughput regressions.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+from ansys.grpc.dpf import scoping_pb2
+
+from ansys.dpf import core as dpf
+from ansys.dpf.core import scoping as scopinglib
+from ansys.dpf.core.file_transfer import FileTransferManager
+from ansys.dpf.core.misc import module_exists
+from fake_server import FakeDpfServer, FakeDpfServerProcess
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Register a benchmark.
+
+    The decorated function receives the server and the size of the
+    benchmark and returns the function to time and the number of bytes it
+    moves, or ``None``.
+    """
+
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+
+    return decorator
+
+
+def _vector_field(server, n):
+    field = dpf.fields_factory.create_3d_vector_field(n, server=server)
+    field.data = np.random.rand(n, 3)
+    field.scoping.ids = np.arange(1, n + 1)
+    return field
+
+
+def _scoping(server, ids, location=dpf.locations.nodal):
+    scoping = dpf.Scoping(location=location, server=server)
+    scoping.ids = ids
+    return scoping
+
+
+def _hexa_grid(n):
+    """Nodes coordinates and connectivity of a grid of about ``n`` hexahedra."""
+    k = max(int(round(n ** (1.0 / 3.0))), 1)
+    x = np.arange(k + 1, dtype=float)
+    coordinates = np.stack(np.meshgrid(x, x, x, indexing="ij"), -1).reshape(-1, 3)
+    index = np.arange((k + 1) ** 3).reshape(k + 1, k + 1, k + 1)
+    corners = [
+        index[:-1, :-1, :-1], index[1:, :-1, :-1], index[1:, 1:, :-1], index[:-1, 1:, :-1],
+        index[:-1, :-1, 1:], index[1:, :-1, 1:], index[1:, 1:, 1:], index[:-1, 1:, 1:],
+    ]
+    connectivity = np.stack([c.reshape(-1) for c in corners], -1)
+    return coordinates, connectivity
+
+
+def _mesh(server, n):
+    coordinates, connectivity = _hexa_grid(n)
+    mesh = dpf.MeshedRegion(len(coordinates), len(connectivity), server=server)
+    for i, node in enumerate(mesh.nodes.add_nodes(len(coordinates))):
+        node.id = i + 1
+        node.coordinates = coordinates[i].tolist()
+    for i, element in enumerate(mesh.elements.add_elements(len(connectivity))):
+        element.id = i + 1
+        element.connectivity = connectivity[i].tolist()
+        element.is_solid = True
+    return mesh
+
+
+@benchmark("field_data_get")
+def _field_data_get(server, n):
+    field = _vector_field(server, n)
+    return lambda: field.data, field.size * 8
+
+
+@benchmark("field_data_get_float")
+def _field_data_get_float(server, n):
+    field = _vector_field(server, n)
+
+    def get_data():
+        with dpf.transport_policy(precision="float"):
+            return field.data
+
+    return get_data, field.size * 4
+
+
+@benchmark("field_data_set")
+def _field_data_set(server, n):
+    field = _vector_field(server, n)
+    data = np.random.rand(n, 3)
+
+    def set_data():
+        field.data = data
+
+    return set_data, data.nbytes
+
+
+@benchmark("scoping_ids_get")
+def _scoping_ids_get(server, n):
+    scoping = _scoping(server, np.arange(1, n + 1))
+    return lambda: scoping.ids, n * 4
+
+
+@benchmark("scoping_ids_set")
+def _scoping_ids_set(server, n):
+    scoping = dpf.Scoping(server=server)
+    ids = np.arange(1, n + 1)
+
+    def set_ids():
+        scoping.ids = ids
+
+    return set_ids, n * 4
+
+
+@benchmark("data_chunk_yielder")
+def _data_chunk_yielder(server, n):
+    data = np.random.rand(n * 3)
+    request = scoping_pb2.UpdateIdsRequest()
+
+    def serialize():
+        for chunk in scopinglib._data_chunk_yielder(request, data):
+            chunk.SerializeToString()
+
+    return serialize, data.nbytes
+
+
+@benchmark("fields_container_iteration")
+def _fields_container_iteration(server, n):
+    n_fields = 100
+    field = _vector_field(server, max(n // n_fields, 1))
+    fc = dpf.fields_container_factory.over_time_freq_fields_container(
+        [field] * n_fields, server=server
+    )
+    return lambda: list(fc), None
+
+
+@benchmark("nodes_map_scoping")
+def _nodes_map_scoping(server, n):
+    mesh = _mesh(server, n // 10)
+    n_nodes = mesh.nodes.n_nodes
+    ids = np.random.permutation(np.arange(1, n_nodes + 1))[: n_nodes // 2]
+    scoping = _scoping(server, ids)
+    return lambda: mesh.nodes.map_scoping(scoping), None
+
+
+@benchmark("dpf_mesh_to_vtk")
+def _dpf_mesh_to_vtk(server, n):
+    if not module_exists("pyvista"):
+        return None, None
+    from ansys.dpf.core.vtk_helper import dpf_mesh_to_vtk
+
+    coordinates, connectivity = _hexa_grid(n)
+    etypes = np.full(len(connectivity), dpf.element_types.Hex8.value)
+    connectivity = connectivity.reshape(-1)
+    return (
+        lambda: dpf_mesh_to_vtk(coordinates, etypes, connectivity.copy()),
+        coordinates.nbytes + connectivity.nbytes,
+    )
+
+
+@benchmark("field_deep_copy")
+def _field_deep_copy(server, n):
+    field = _vector_field(server, n)
+    return lambda: field.deep_copy(server=server), field.size * 8
+
+
+@benchmark("fields_container_deep_copy")
+def _fields_container_deep_copy(server, n):
+    n_fields = 10
+    fields = [_vector_field(server, max(n // n_fields, 1)) for _ in range(n_fields)]
+    fc = dpf.fields_container_factory.over_time_freq_fields_container(fields, server=server)
+    return lambda: fc.deep_copy(server=server), sum(f.size * 8 for f in fields)
+
+
+@benchmark("meshed_region_deep_copy")
+def _meshed_region_deep_copy(server, n):
+    mesh = _mesh(server, n // 10)
+    return lambda: mesh.deep_copy(server=server), None
+
+
+@benchmark("fields_release")
+def _fields_release(server, n):
+    n_fields = max(n // 1000, 1)
+
+    def create_and_release():
+        fields = [dpf.Field(nentities=1, server=server) for _ in range(n_fields)]
+        del fields
+        server.flush_released_objects()
+
+    return create_and_release, None
+
+
+@benchmark("files_upload")
+def _files_upload(server, n):
+    n_files = 8
+    folder = tempfile.mkdtemp()
+    for i in range(n_files):
+        with open(os.path.join(folder, f"file{i}.rst"), "wb") as f:
+            f.write(os.urandom(max(n * 8 // n_files, 1)))
+    manager = FileTransferManager(server)
+
+    def upload():
+        manager.upload_folder(folder, "/benchmark")
+
+    return upload, max(n * 8 // n_files, 1) * n_files
+
+
+@benchmark("package_import")
+def _package_import(server, n):
+    # the package is imported by a new interpreter, run from the folder
+    # holding the ``ansys`` package which is benchmarked
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(dpf.__file__))))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+    command = [sys.executable, "-c", "import ansys.dpf.core"]
+
+    def import_package():
+        subprocess.run(command, env=env, check=True)
+
+    return import_package, None
+
+
+def run(server, size, repeat=5, names=None):
+    """Run the benchmarks.
+
+    Parameters
+    ----------
+    server : ansys.dpf.core.server.DpfServer
+        Server to run the benchmarks against.
+    size : int
+        Number of entities of the fields, scopings and meshes.
+    repeat : int, optional
+        Number of runs of each benchmark. The default is ``5``.
+    names : list[str], optional
+        Benchmarks to run. The default is ``None``, in which case all the
+        benchmarks are run.
+
+    Returns
+    -------
+    dict
+        For each benchmark, the ``"number"`` of calls per run, the ``"best"``
+        and ``"median"`` durations of a call in seconds and the
+        ``"throughput"`` in MB/s, or ``None`` when the benchmark was skipped.
+    """
+    results = {}
+    for name, func in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        call, nbytes = func(server, size)
+        if call is None:
+            results[name] = None
+            continue
+        timer = timeit.Timer(call)
+        number, _ = timer.autorange()
+        times = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+        best = min(times)
+        results[name] = {
+            "number": number,
+            "best": best,
+            "median": statistics.median(times),
+            "throughput": nbytes / best / 1e6 if nbytes else None,
+        }
+    return results
+
+
+def table(results):
+    """Format the results of :func:`run` as a text table."""
+    width = max(len(name) for name in results)
+    header = (
+        f"{'benchmark':<{width}} {'calls':>7} {'best (ms)':>10} "
+        f"{'median (ms)':>12} {'MB/s':>9}"
+    )
+    lines = [header, "-" * len(header)]
+    for name, result in results.items():
+        if result is None:
+            lines.append(f"{name:<{width}} {'skipped':>7}")
+            continue
+        throughput = result["throughput"]
+        throughput = f"{throughput:>9.1f}" if throughput else f"{'':>9}"
+        lines.append(
+            f"{name:<{width}} {result['number']:>7} {result['best'] * 1e3:>10.3f} "
+            f"{result['median'] * 1e3:>12.3f} {throughput}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--size", type=int, default=100000,
+        help="number of entities of the fields, scopings and meshes",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="number of runs")
+    parser.add_argument(
+        "--benchmark", action="append", choices=list(BENCHMARKS),
+        help="benchmark to run, all of them by default",
+    )
+    parser.add_argument("--json", help="path of a JSON file receiving the results")
+    parser.add_argument(
+        "--in-process", action="store_true",
+        help="serve the requests in this process instead of a child process",
+    )
+    args = parser.parse_args(argv)
+
+    fake_type = FakeDpfServer if args.in_process else FakeDpfServerProcess
+    with fake_type() as fake:
+        server = fake.connect(as_global=False)
+        results = run(server, args.size, args.repeat, args.benchmark)
+    print(table(results))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "size": args.size,
+                    "python": sys.version.split()[0],
+                    "platform": platform.platform(),
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
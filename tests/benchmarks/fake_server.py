@@ -0,0 +1,1274 @@
+"""Pure Python stand-in for a DPF server.
+
+Implements the Base, Scoping, Field, FieldDefinition, Collection,
+MeshedRegion, ResultInfo and Operator gRPC services of ``ansys.grpc.dpf`` in
+memory so that the client side of ``ansys.dpf.core`` can be exercised and
+benchmarked without an Ansys installation. Operators can be created and
+connected but not evaluated. Workflows, data sources and result files are
+not available: the result infos describe synthetic analyses.
+
+>>> from ansys.dpf import core as dpf
+>>> from fake_server import FakeDpfServerProcess
+>>> with FakeDpfServerProcess() as fake:
+...     server = fake.connect()
+...     field = dpf.fields_factory.create_3d_vector_field(10, server=server)
+"""
+import argparse
+import collections
+import itertools
+import os
+import subprocess
+import sys
+import threading
+from concurrent import futures
+
+import grpc
+import numpy as np
+from ansys.grpc.dpf import (
+    available_result_pb2,
+    base_pb2,
+    base_pb2_grpc,
+    collection_pb2,
+    collection_pb2_grpc,
+    field_definition_pb2,
+    field_definition_pb2_grpc,
+    field_pb2,
+    field_pb2_grpc,
+    meshed_region_pb2,
+    meshed_region_pb2_grpc,
+    operator_pb2,
+    operator_pb2_grpc,
+    result_info_pb2,
+    result_info_pb2_grpc,
+    scoping_pb2,
+    scoping_pb2_grpc,
+    support_pb2,
+)
+
+from ansys.dpf import core as dpf
+from ansys.dpf.core.misc import DEFAULT_FILE_CHUNK_SIZE
+
+_NATURE_SIZES = {
+    base_pb2.SCALAR: [1],
+    base_pb2.VECTOR: [3],
+    base_pb2.MATRIX: [3, 3],
+    base_pb2.SYMMATRIX: [3, 3],
+}
+
+# element type (``dpf.element_types``) from the shape and the number of nodes
+_ELEMENT_TYPES = {
+    meshed_region_pb2.SOLID: {4: 10, 5: 13, 6: 12, 8: 11, 10: 0, 13: 3, 15: 2, 20: 1},
+    meshed_region_pb2.SHELL: {3: 14, 4: 16, 6: 4, 8: 6},
+    meshed_region_pb2.BEAM: {2: 18, 3: 8},
+    meshed_region_pb2.UNKNOWN_SHAPE: {1: 9},
+}
+_UNKNOWN_ELEMENT_TYPE = 20
+
+
+def _dtype(datatype):
+    return np.int32 if datatype == "int" else np.float64
+
+
+def _message(message_type, entity_id, **kwargs):
+    message = message_type(**kwargs)
+    message.id.id = entity_id
+    return message
+
+
+def _label_space(message):
+    return {key: message.label_space[key] for key in message.label_space}
+
+
+class _Entity:
+    """Object stored by the server, counting the references held by the
+    client and by the other entities."""
+
+    def __init__(self):
+        self.refs = 0
+
+    def children(self):
+        """Identifiers of the entities referenced by this entity."""
+        return []
+
+    def describe(self):
+        return f"DPF {type(self).__name__.strip('_')}"
+
+
+class _Scoping(_Entity):
+    def __init__(self, location="", ids=None):
+        super().__init__()
+        self.location = location
+        self.ids = np.zeros(0, np.int32) if ids is None else np.asarray(ids, np.int32)
+
+    def describe(self):
+        return f"DPF Scoping:\n  with {self.location} location and {self.ids.size} entities"
+
+
+class _FieldDefinition(_Entity):
+    def __init__(self, location="", nature=base_pb2.SCALAR, size=None):
+        super().__init__()
+        self.unit = ""
+        self.location = location
+        self.nature = nature
+        self.size = list(_NATURE_SIZES[nature] if size is None else size)
+        self.shell_layers = field_definition_pb2.LAYERINDEPENDENT
+        self.name = ""
+
+    @property
+    def component_count(self):
+        if self.nature == base_pb2.SYMMATRIX:
+            return 6
+        return int(np.prod(self.size))
+
+    def copy_from(self, other):
+        self.unit = other.unit
+        self.location = other.location
+        self.nature = other.nature
+        self.size = list(other.size)
+        self.shell_layers = other.shell_layers
+        self.name = other.name
+
+
+class _Field(_Entity):
+    def __init__(self, datatype, scoping_id, definition_id):
+        super().__init__()
+        self.datatype = datatype
+        self.data = np.zeros(0, _dtype(datatype))
+        self.data_pointer = np.zeros(0, np.int32)
+        self.scoping_id = scoping_id
+        self.definition_id = definition_id
+        self.supports = {}
+
+    def children(self):
+        return [self.scoping_id, self.definition_id] + list(self.supports.values())
+
+    def describe(self):
+        return f"DPF Field\n  {self.data.size} values of type {self.datatype}"
+
+
+class _Collection(_Entity):
+    def __init__(self, entries_type):
+        super().__init__()
+        self.type = entries_type
+        self.labels = []
+        # entries as (label space, packed message, id of the entity)
+        self.entries = []
+        self.supports = {}
+        self.data = None
+
+    def children(self):
+        return [entity_id for _, _, entity_id in self.entries] + list(
+            self.supports.values()
+        )
+
+    def describe(self):
+        return (
+            f"DPF Collection with {len(self.entries)} entries\n"
+            f"  with labels {self.labels}"
+        )
+
+
+class _MeshedRegion(_Entity):
+    def __init__(self):
+        super().__init__()
+        self.unit = ""
+        self.node_ids = []
+        self.coordinates = []
+        self.element_ids = []
+        self.connectivities = []
+        self.shapes = []
+        self.named_selections = {}
+        self.properties = {}
+
+    def children(self):
+        return list(self.named_selections.values()) + list(self.properties.values())
+
+    def element_types(self):
+        return [
+            _ELEMENT_TYPES[shape].get(len(connectivity), _UNKNOWN_ELEMENT_TYPE)
+            for shape, connectivity in zip(self.shapes, self.connectivities)
+        ]
+
+    def describe(self):
+        return (
+            f"DPF Mesh: \n  {len(self.node_ids)} nodes \n"
+            f"  {len(self.element_ids)} elements \n  Unit: {self.unit} "
+        )
+
+
+class _ResultInfo(_Entity):
+    """Metadata of a static structural analysis with the given results."""
+
+    def __init__(self, results):
+        super().__init__()
+        self.results = results
+        self.properties = {
+            "analysis_type": "static",
+            "physics_type": "mecanic",
+            "results_count": str(len(results)),
+            "unit_system_name": "MKS: m, kg, N, s, V, A, degC",
+            "solver_version": "21.2",
+            "solver_date": "20210101",
+            "solver_time": "120000",
+            "user_name": "user",
+            "job_name": "file",
+            "product_name": "FULL",
+            "main_title": "fake analysis",
+        }
+
+
+class _Operator(_Entity):
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+        # entities connected to the operator, by pin
+        self.inputs = {}
+
+    def children(self):
+        return list(self.inputs.values())
+
+
+class _Store:
+    """Entities of the server with reference counting.
+
+    Each message with an entity identifier sent to the client holds a
+    reference, released by the ``Delete`` request of the client.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self._entities = {}
+        self._ids = itertools.count(1)
+
+    def __len__(self):
+        return len(self._entities)
+
+    def add(self, entity):
+        with self.lock:
+            entity_id = next(self._ids)
+            self._entities[entity_id] = entity
+            return entity_id
+
+    def get(self, entity_id, context, entity_type=_Entity):
+        entity = self._entities.get(entity_id)
+        if not isinstance(entity, entity_type):
+            context.abort(
+                grpc.StatusCode.NOT_FOUND,
+                f"no {entity_type.__name__.strip('_')} with id {entity_id}",
+            )
+        return entity
+
+    def find(self, entity_id):
+        return self._entities.get(entity_id)
+
+    def ref(self, entity_id):
+        with self.lock:
+            self._entities[entity_id].refs += 1
+        return entity_id
+
+    def unref(self, entity_id):
+        with self.lock:
+            entity = self._entities.get(entity_id)
+            if entity is None:
+                return
+            entity.refs -= 1
+            if entity.refs <= 0:
+                del self._entities[entity_id]
+                for child in entity.children():
+                    self.unref(child)
+
+    def new_scoping(self, location="", ids=None):
+        return self.add(_Scoping(location, ids))
+
+    def new_field(self, datatype="double", location="", nature=base_pb2.SCALAR, size=None):
+        scoping_id = self.ref(self.new_scoping(location))
+        definition_id = self.ref(self.add(_FieldDefinition(location, nature, size)))
+        return self.add(_Field(datatype, scoping_id, definition_id))
+
+
+def _read_array(request_iterator, dtype):
+    """First request of a stream and the array sent in its chunks."""
+    first = None
+    chunks = []
+    for request in request_iterator:
+        if first is None:
+            first = request
+        chunks.append(request.array)
+    return first, np.frombuffer(b"".join(chunks), dtype=dtype)
+
+
+def _wire_array(context, field):
+    """Data of a field in the precision asked by the ``float_or_double``
+    metadata of the request."""
+    if field.datatype != "int":
+        for key, value in context.invocation_metadata():
+            if key == "float_or_double" and value == "float":
+                return field.data.astype(np.float32)
+    return field.data
+
+
+def _stream_array(context, array, response_type):
+    """Stream an array in chunks as the server does, giving its size in
+    bytes in the ``size_tot`` initial metadata."""
+    data = np.ascontiguousarray(array).tobytes()
+    context.send_initial_metadata((("size_tot", str(len(data))),))
+    for start in range(0, len(data), DEFAULT_FILE_CHUNK_SIZE):
+        yield response_type(array=data[start : start + DEFAULT_FILE_CHUNK_SIZE])
+
+
+class _BaseServicer(base_pb2_grpc.BaseServiceServicer):
+    def __init__(self, fake):
+        self._fake = fake
+        self._store = fake._store
+
+    def Initialize(self, request, context):
+        return base_pb2.InitializationResponse()
+
+    def GetServerInfo(self, request, context):
+        major, minor = self._fake.version.split(".")
+        response = base_pb2.ServerInfoResponse(
+            majorVersion=int(major),
+            minorVersion=int(minor),
+            processId=os.getpid(),
+            ip=self._fake.ip,
+            port=self._fake.port,
+        )
+        response.properties["os"] = "posix" if os.name == "posix" else "nt"
+        return response
+
+    def Describe(self, request, context):
+        entity = self._store.get(request.dpf_type_id, context)
+        return base_pb2.DescribeResponse(description=entity.describe())
+
+    def Delete(self, request, context):
+        for identifier in request.dpf_type_id:
+            self._store.unref(identifier.id)
+        return base_pb2.Empty()
+
+    def UploadFile(self, request_iterator, context):
+        path = None
+        pieces = []
+        for request in request_iterator:
+            if path is None:
+                path = request.server_file_path
+                if request.use_temp_dir:
+                    path = self._fake.tmp_dir + "/" + path
+            pieces.append(request.data.data)
+        # interrupted once all the chunks are sent, so that the retried upload
+        # sends all of them again
+        if self._fake.interrupted_transfers:
+            self._fake.interrupted_transfers -= 1
+            context.abort(grpc.StatusCode.UNAVAILABLE, "transfer interrupted")
+        self._fake.files[path] = b"".join(pieces)
+        self._fake.uploaded_bytes += len(self._fake.files[path])
+        return base_pb2.UploadFileResponse(server_file_path=path)
+
+    def DownloadFile(self, request, context):
+        data = self._fake.files.get(request.server_file_path)
+        if data is None:
+            context.abort(grpc.StatusCode.NOT_FOUND, "file not found")
+        context.send_initial_metadata((("size_tot", str(len(data))),))
+        for start in range(0, len(data), DEFAULT_FILE_CHUNK_SIZE):
+            if start and self._fake.interrupted_transfers:
+                self._fake.interrupted_transfers -= 1
+                context.abort(grpc.StatusCode.UNAVAILABLE, "transfer interrupted")
+            response = base_pb2.DownloadFileResponse()
+            response.data.data = data[start : start + DEFAULT_FILE_CHUNK_SIZE]
+            response.data.server_file_path = request.server_file_path
+            yield response
+
+    def PrepareShutdown(self, request, context):
+        return base_pb2.Empty()
+
+    def ReleaseServer(self, request, context):
+        return base_pb2.Empty()
+
+
+class _ScopingServicer(scoping_pb2_grpc.ScopingServiceServicer):
+    def __init__(self, fake):
+        self._store = fake._store
+
+    def _get(self, message, context):
+        return self._store.get(message.id.id, context, _Scoping)
+
+    def Create(self, request, context):
+        return _message(scoping_pb2.Scoping, self._store.ref(self._store.new_scoping()))
+
+    def Update(self, request, context):
+        scoping = self._get(request.scoping, context)
+        if request.WhichOneof("update_request") == "location":
+            scoping.location = request.location.location
+        else:
+            index = request.index_id.index
+            with self._store.lock:
+                if index >= scoping.ids.size:
+                    ids = np.zeros(index + 1, np.int32)
+                    ids[: scoping.ids.size] = scoping.ids
+                    scoping.ids = ids
+                else:
+                    scoping.ids = scoping.ids.copy()
+                scoping.ids[index] = request.index_id.id
+        return base_pb2.Empty()
+
+    def UpdateIds(self, request_iterator, context):
+        first, ids = _read_array(request_iterator, np.int32)
+        self._get(first.scoping, context).ids = ids
+        return base_pb2.Empty()
+
+    def List(self, request, context):
+        ids = self._get(request, context).ids
+        return _stream_array(context, ids, scoping_pb2.ListResponse)
+
+    def Count(self, request, context):
+        return base_pb2.CountResponse(count=self._get(request.scoping, context).ids.size)
+
+    def GetLocation(self, request, context):
+        response = scoping_pb2.GetLocationResponse()
+        response.loc.location = self._get(request, context).location
+        return response
+
+    def Get(self, request, context):
+        ids = self._get(request.scoping, context).ids
+        if request.WhichOneof("type_request") == "index":
+            if not 0 <= request.index < ids.size:
+                context.abort(grpc.StatusCode.OUT_OF_RANGE, "index out of range")
+            return scoping_pb2.GetResponse(id=ids[request.index], index=request.index)
+        found = np.flatnonzero(ids == request.id)
+        index = int(found[0]) if found.size else -1
+        return scoping_pb2.GetResponse(id=request.id, index=index)
+
+    def Delete(self, request, context):
+        self._store.unref(request.id.id)
+        return base_pb2.Empty()
+
+
+class _FieldDefinitionServicer(field_definition_pb2_grpc.FieldDefinitionServiceServicer):
+    def __init__(self, fake):
+        self._store = fake._store
+
+    def _get(self, message, context):
+        return self._store.get(message.id.id, context, _FieldDefinition)
+
+    def Create(self, request, context):
+        return _message(
+            field_definition_pb2.FieldDefinition,
+            self._store.ref(self._store.add(_FieldDefinition())),
+        )
+
+    def Update(self, request, context):
+        definition = self._get(request.field_definition, context)
+        unit_type = request.WhichOneof("unit_definition_type")
+        if unit_type is not None:
+            definition.unit = getattr(request, unit_type).symbol
+        if request.HasField("location"):
+            definition.location = request.location.location
+        if request.HasField("dimensionnality"):
+            definition.nature = request.dimensionnality.nature
+            definition.size = list(request.dimensionnality.size)
+        if request.shell_layers:
+            definition.shell_layers = request.shell_layers
+        if request.HasField("name"):
+            definition.name = request.name.string
+        return base_pb2.Empty()
+
+    def List(self, request, context):
+        definition = self._get(request, context)
+        response = field_definition_pb2.FieldDefinitionData()
+        response.unit.symbol = definition.unit
+        response.location.location = definition.location
+        response.dimensionnality.nature = definition.nature
+        response.dimensionnality.size.extend(definition.size)
+        response.shell_layers = definition.shell_layers
+        response.name.string = definition.name
+        return response
+
+    def Delete(self, request, context):
+        self._store.unref(request.id.id)
+        return base_pb2.Empty()
+
+
+class _FieldServicer(field_pb2_grpc.FieldServiceServicer):
+    def __init__(self, fake):
+        self._store = fake._store
+
+    def _get(self, message, context):
+        return self._store.get(message.id.id, context, _Field)
+
+    def _message(self, field_id):
+        field = self._store.find(field_id)
+        return _message(field_pb2.Field, self._store.ref(field_id), datatype=field.datatype)
+
+    def Create(self, request, context):
+        size = None
+        if len(request.dimensionality.size) > 0:
+            size = list(request.dimensionality.size)
+        field_id = self._store.new_field(
+            request.datatype or "double",
+            request.location.location,
+            request.nature,
+            size,
+        )
+        return self._message(field_id)
+
+    def _component_count(self, field):
+        return self._store.find(field.definition_id).component_count
+
+    def _entity_count(self, field):
+        if field.data_pointer.size:
+            return field.data_pointer.size
+        return field.data.size // max(self._component_count(field), 1)
+
+    def AddData(self, request, context):
+        field = self._get(request.field, context)
+        containers = request.elemdata_containers
+        if field.datatype == "int":
+            values = np.array(containers.data.dataint.rep_int, np.int32)
+        else:
+            values = np.array(containers.data.datadouble.rep_double, np.float64)
+        ncomp = self._component_count(field)
+        with self._store.lock:
+            n_entities = self._entity_count(field)
+            if field.data_pointer.size or values.size != ncomp:
+                pointer = field.data_pointer
+                if not pointer.size:
+                    pointer = np.arange(n_entities, dtype=np.int32) * ncomp
+                field.data_pointer = np.append(pointer, np.int32(field.data.size))
+            field.data = np.concatenate([field.data, values])
+            scoping = self._store.find(field.scoping_id)
+            scoping.ids = np.append(scoping.ids, np.int32(containers.scoping_id))
+        return base_pb2.Empty()
+
+    def UpdateData(self, request_iterator, context):
+        request_iterator = iter(request_iterator)
+        first = next(request_iterator)
+        field = self._get(first.field, context)
+        _, data = _read_array(
+            itertools.chain([first], request_iterator), _dtype(field.datatype)
+        )
+        field.data = data
+        return base_pb2.Empty()
+
+    def UpdateDataPointer(self, request_iterator, context):
+        first, pointer = _read_array(request_iterator, np.int32)
+        self._get(first.field, context).data_pointer = pointer
+        return base_pb2.Empty()
+
+    def UpdateScoping(self, request, context):
+        field = self._get(request.field, context)
+        scoping_id = request.scoping.id.id
+        self._store.get(scoping_id, context, _Scoping)
+        with self._store.lock:
+            self._store.ref(scoping_id)
+            self._store.unref(field.scoping_id)
+            field.scoping_id = scoping_id
+        return base_pb2.Empty()
+
+    def UpdateSize(self, request, context):
+        # memory is allocated when the data is set
+        self._get(request.field, context)
+        return base_pb2.Empty()
+
+    def UpdateFieldDefinition(self, request, context):
+        field = self._get(request.field, context)
+        other = self._store.get(request.field_def.id.id, context, _FieldDefinition)
+        self._store.find(field.definition_id).copy_from(other)
+        return base_pb2.Empty()
+
+    def List(self, request, context):
+        field = self._get(request.field, context)
+        return _stream_array(context, _wire_array(context, field), field_pb2.ListResponse)
+
+    def ListDataPointer(self, request, context):
+        field = self._get(request.field, context)
+        return _stream_array(context, field.data_pointer, field_pb2.ListResponse)
+
+    def GetScoping(self, request, context):
+        field = self._get(request.field, context)
+        response = field_pb2.GetScopingResponse()
+        response.scoping.id.id = self._store.ref(field.scoping_id)
+        return response
+
+    def GetSupport(self, request, context):
+        field = self._get(request.field, context)
+        support_id = field.supports.get(request.type)
+        if support_id is None:
+            context.abort(grpc.StatusCode.NOT_FOUND, "the field has no such support")
+        return _message(support_pb2.Support, self._store.ref(support_id), type=request.type)
+
+    def SetSupport(self, request, context):
+        field = self._get(request.field, context)
+        support_id = request.support.id.id
+        self._store.get(support_id, context)
+        with self._store.lock:
+            self._store.ref(support_id)
+            previous = field.supports.get(request.support.type)
+            field.supports[request.support.type] = support_id
+            if previous is not None:
+                self._store.unref(previous)
+        return base_pb2.Empty()
+
+    def GetFieldDefinition(self, request, context):
+        field = self._get(request.field, context)
+        definition = self._store.find(field.definition_id)
+        response = field_pb2.GetFieldDefinitionResponse(name=definition.name)
+        response.field_definition.id.id = self._store.ref(field.definition_id)
+        return response
+
+    def GetElementaryData(self, request, context):
+        field = self._get(request.field, context)
+        ids = self._store.find(field.scoping_id).ids
+        if request.WhichOneof("index_id") == "index":
+            index = request.index
+        else:
+            found = np.flatnonzero(ids == request.id)
+            index = int(found[0]) if found.size else -1
+        if not 0 <= index < self._entity_count(field):
+            context.abort(grpc.StatusCode.OUT_OF_RANGE, "entity not found")
+        if field.data_pointer.size:
+            start = field.data_pointer[index]
+            end = (
+                field.data_pointer[index + 1]
+                if index + 1 < field.data_pointer.size
+                else field.data.size
+            )
+        else:
+            ncomp = self._component_count(field)
+            start, end = index * ncomp, (index + 1) * ncomp
+        response = field_pb2.GetElementaryDataResponse()
+        containers = response.elemdata_containers
+        containers.scoping_index = index
+        if index < ids.size:
+            containers.scoping_id = ids[index]
+        if field.datatype == "int":
+            containers.data.dataint.rep_int.extend(field.data[start:end].tolist())
+        else:
+            data = _wire_array(context, field)[start:end]
+            if data.dtype == np.float32:
+                containers.data.datafloat.rep_float.extend(data.tolist())
+            else:
+                containers.data.datadouble.rep_double.extend(data.tolist())
+        return response
+
+    def Count(self, request, context):
+        field = self._get(request.field, context)
+        if request.entity == base_pb2.NUM_COMPONENT:
+            count = self._component_count(field)
+        elif request.entity == base_pb2.NUM_DATA:
+            count = field.data.size
+        else:
+            # elementary data are counted in values, not in entities
+            count = field.data.size // max(self._component_count(field), 1)
+        return base_pb2.CountResponse(count=count)
+
+    def Delete(self, request, context):
+        self._store.unref(request.id.id)
+        return base_pb2.Empty()
+
+
+_PACKED_TYPES = {
+    message_type.DESCRIPTOR.full_name: message_type
+    for message_type in (
+        field_pb2.Field,
+        scoping_pb2.Scoping,
+        meshed_region_pb2.MeshedRegion,
+        collection_pb2.Collection,
+    )
+}
+
+
+class _CollectionServicer(collection_pb2_grpc.CollectionServiceServicer):
+    def __init__(self, fake):
+        self._store = fake._store
+
+    def _get(self, message, context):
+        return self._store.get(message.id.id, context, _Collection)
+
+    def Create(self, request, context):
+        collection_id = self._store.ref(self._store.add(_Collection(request.type)))
+        return _message(collection_pb2.Collection, collection_id, type=request.type)
+
+    def UpdateLabels(self, request, context):
+        collection = self._get(request.collection, context)
+        with self._store.lock:
+            if request.override_others:
+                collection.labels = []
+            for label in request.labels:
+                if label.label not in collection.labels:
+                    collection.labels.append(label.label)
+                    for label_space, _, _ in collection.entries:
+                        label_space[label.label] = label.default_value.default_value
+        return base_pb2.Empty()
+
+    def UpdateEntry(self, request, context):
+        collection = self._get(request.collection, context)
+        type_name = request.entry.dpf_type.TypeName()
+        if type_name not in _PACKED_TYPES:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, f"unsupported entry {type_name}")
+        unpacked = _PACKED_TYPES[type_name]()
+        request.entry.dpf_type.Unpack(unpacked)
+        entity_id = unpacked.id.id
+        self._store.get(entity_id, context)
+        with self._store.lock:
+            self._store.ref(entity_id)
+            if request.WhichOneof("location") == "index":
+                if not 0 <= request.index < len(collection.entries):
+                    context.abort(grpc.StatusCode.OUT_OF_RANGE, "index out of range")
+                label_space, _, previous = collection.entries[request.index]
+                collection.entries[request.index] = (
+                    label_space,
+                    request.entry.dpf_type,
+                    entity_id,
+                )
+                self._store.unref(previous)
+                return base_pb2.Empty()
+            label_space = _label_space(request.label_space)
+            for label in label_space:
+                if label not in collection.labels:
+                    collection.labels.append(label)
+            for i, (other, _, previous) in enumerate(collection.entries):
+                if other == label_space:
+                    collection.entries[i] = (label_space, request.entry.dpf_type, entity_id)
+                    self._store.unref(previous)
+                    break
+            else:
+                collection.entries.append((label_space, request.entry.dpf_type, entity_id))
+        return base_pb2.Empty()
+
+    def List(self, request, context):
+        collection = self._get(request, context)
+        response = collection_pb2.ListResponse(count_entries=len(collection.entries))
+        response.labels.labels.extend(collection.labels)
+        return response
+
+    def GetEntries(self, request, context):
+        collection = self._get(request.collection, context)
+        if request.WhichOneof("location") == "index":
+            if not 0 <= request.index < len(collection.entries):
+                context.abort(grpc.StatusCode.OUT_OF_RANGE, "index out of range")
+            entries = [collection.entries[request.index]]
+        else:
+            requested = _label_space(request.label_space).items()
+            entries = [
+                entry for entry in collection.entries if requested <= entry[0].items()
+            ]
+        response = collection_pb2.GetEntriesResponse()
+        for label_space, packed, entity_id in entries:
+            self._store.ref(entity_id)
+            entry = response.entries.add()
+            entry.dpf_type.CopyFrom(packed)
+            for key, value in label_space.items():
+                entry.label_space.label_space[key] = value
+        return response
+
+    def GetLabelScoping(self, request, context):
+        collection = self._get(request.collection, context)
+        values = []
+        for label_space, _, _ in collection.entries:
+            value = label_space.get(request.label)
+            if value is not None and value not in values:
+                values.append(value)
+        scoping_id = self._store.new_scoping(request.label, values)
+        response = collection_pb2.LabelScopingResponse()
+        response.label_scoping.id.id = self._store.ref(scoping_id)
+        return response
+
+    def GetSupport(self, request, context):
+        collection = self._get(request.collection, context)
+        support_id = collection.supports.get(request.type)
+        if support_id is None:
+            context.abort(grpc.StatusCode.NOT_FOUND, "the collection has no such support")
+        return _message(support_pb2.Support, self._store.ref(support_id), type=request.type)
+
+    def UpdateSupport(self, request, context):
+        collection = self._get(request.collection, context)
+        if request.WhichOneof("support_type") == "time_freq_support":
+            support_type = base_pb2.TIME_FREQ_SUPPORT
+            support_id = request.time_freq_support.id.id
+        else:
+            support_type = request.support.type
+            support_id = request.support.id.id
+        self._store.get(support_id, context)
+        with self._store.lock:
+            self._store.ref(support_id)
+            previous = collection.supports.get(support_type)
+            collection.supports[support_type] = support_id
+            if previous is not None:
+                self._store.unref(previous)
+        return base_pb2.Empty()
+
+    def GetAllData(self, request, context):
+        collection = self._get(request.collection, context)
+        data = collection.data
+        if data is None:
+            data = np.zeros(0, np.int32 if collection.type == base_pb2.INT else np.float64)
+        return _stream_array(context, data, base_pb2.Array)
+
+    def UpdateAllData(self, request_iterator, context):
+        request_iterator = iter(request_iterator)
+        first = next(request_iterator)
+        collection = self._get(first.collection, context)
+        dtype = np.int32 if collection.type == base_pb2.INT else np.float64
+        _, collection.data = _read_array(itertools.chain([first], request_iterator), dtype)
+        return base_pb2.Empty()
+
+    def Describe(self, request, context):
+        collection = self._store.get(request.dpf_type_id, context, _Collection)
+        return base_pb2.DescribeResponse(description=collection.describe())
+
+    def Delete(self, request, context):
+        self._store.unref(request.id.id)
+        return base_pb2.Empty()
+
+
+class _MeshedRegionServicer(meshed_region_pb2_grpc.MeshedRegionServiceServicer):
+    def __init__(self, fake):
+        self._store = fake._store
+
+    def _get(self, message, context):
+        return self._store.get(message.id.id, context, _MeshedRegion)
+
+    def Create(self, request, context):
+        mesh_id = self._store.ref(self._store.add(_MeshedRegion()))
+        return _message(meshed_region_pb2.MeshedRegion, mesh_id)
+
+    def Add(self, request, context):
+        mesh = self._get(request.mesh, context)
+        with self._store.lock:
+            for node in request.nodes:
+                mesh.node_ids.append(node.id)
+                mesh.coordinates.append(list(node.coordinates))
+            for element in request.elements:
+                mesh.element_ids.append(element.id)
+                mesh.connectivities.append(list(element.connectivity))
+                mesh.shapes.append(element.shape)
+        return base_pb2.Empty()
+
+    def GetScoping(self, request, context):
+        mesh = self._get(request.mesh, context)
+        if request.WhichOneof("scoping_type") == "named_selection":
+            scoping_id = mesh.named_selections.get(request.named_selection)
+            if scoping_id is None:
+                context.abort(grpc.StatusCode.NOT_FOUND, "unknown named selection")
+        elif request.loc.location == dpf.locations.elemental:
+            scoping_id = self._store.new_scoping(dpf.locations.elemental, mesh.element_ids)
+        else:
+            scoping_id = self._store.new_scoping(dpf.locations.nodal, mesh.node_ids)
+        return _message(scoping_pb2.Scoping, self._store.ref(scoping_id))
+
+    def SetNamedSelection(self, request, context):
+        mesh = self._get(request.mesh, context)
+        scoping_id = request.scoping.id.id
+        self._store.get(scoping_id, context, _Scoping)
+        with self._store.lock:
+            self._store.ref(scoping_id)
+            previous = mesh.named_selections.get(request.named_selection)
+            mesh.named_selections[request.named_selection] = scoping_id
+            if previous is not None:
+                self._store.unref(previous)
+        return base_pb2.Empty()
+
+    def SetField(self, request, context):
+        mesh = self._get(request.mesh, context)
+        field_id = request.field.id.id
+        self._store.get(field_id, context, _Field)
+        name = request.property_type.property_name.property_name
+        with self._store.lock:
+            self._store.ref(field_id)
+            previous = mesh.properties.get(name)
+            mesh.properties[name] = field_id
+            if previous is not None:
+                self._store.unref(previous)
+        return base_pb2.Empty()
+
+    def _element_property(self, mesh, name):
+        if name == dpf.common.elemental_properties.element_type:
+            return mesh.element_types()
+        elif name == dpf.common.elemental_properties.element_shape:
+            return mesh.shapes
+        return None
+
+    def GetElementalProperty(self, request, context):
+        mesh = self._get(request.mesh, context)
+        index = request.index
+        if request.WhichOneof("index_id") == "id":
+            index = mesh.element_ids.index(request.id) if request.id in mesh.element_ids else -1
+        values = self._element_property(mesh, request.property_name.property_name)
+        if values is None or not 0 <= index < len(values):
+            context.abort(grpc.StatusCode.NOT_FOUND, "property not found")
+        return meshed_region_pb2.ElementalPropertyResponse(prop=values[index])
+
+    def UpdateRequest(self, request, context):
+        self._get(request.meshed_region, context).unit = request.unit
+        return base_pb2.Empty()
+
+    def ListProperty(self, request, context):
+        mesh = self._get(request.mesh, context)
+        name = request.property_type.property_name.property_name
+        store = self._store
+        with store.lock:
+            if name in mesh.properties:
+                field_id = mesh.properties[name]
+            elif name == dpf.common.nodal_properties.coordinates:
+                field_id = store.new_field("double", dpf.locations.nodal, base_pb2.VECTOR)
+                field = store.find(field_id)
+                field.data = np.array(mesh.coordinates, np.float64).reshape(-1)
+                store.find(field.scoping_id).ids = np.array(mesh.node_ids, np.int32)
+                store.find(field.definition_id).unit = mesh.unit
+            else:
+                if name == dpf.common.elemental_properties.connectivity:
+                    lengths = [len(c) for c in mesh.connectivities]
+                    pointer = np.zeros(len(lengths), np.int32)
+                    np.cumsum(lengths[:-1], out=pointer[1:])
+                    data = list(itertools.chain.from_iterable(mesh.connectivities))
+                else:
+                    data = self._element_property(mesh, name)
+                    pointer = np.zeros(0, np.int32)
+                if data is None:
+                    context.abort(grpc.StatusCode.NOT_FOUND, f"no property {name}")
+                field_id = store.new_field("int", dpf.locations.elemental)
+                field = store.find(field_id)
+                field.data = np.array(data, np.int32)
+                field.data_pointer = pointer
+                store.find(field.scoping_id).ids = np.array(mesh.element_ids, np.int32)
+            field = store.find(field_id)
+            return _message(field_pb2.Field, store.ref(field_id), datatype=field.datatype)
+
+    def List(self, request, context):
+        mesh = self._get(request, context)
+        response = meshed_region_pb2.ListResponse(
+            unit=mesh.unit,
+            num_nodes=len(mesh.node_ids),
+            num_element=len(mesh.element_ids),
+        )
+        response.available_prop.extend(
+            [
+                dpf.common.nodal_properties.coordinates,
+                dpf.common.elemental_properties.connectivity,
+                dpf.common.elemental_properties.element_type,
+                dpf.common.elemental_properties.element_shape,
+            ]
+            + list(mesh.properties)
+        )
+        info = response.element_shape_info
+        info.has_solid_elements = meshed_region_pb2.SOLID in mesh.shapes
+        info.has_shell_elements = meshed_region_pb2.SHELL in mesh.shapes
+        info.has_beam_elements = meshed_region_pb2.BEAM in mesh.shapes
+        info.has_point_elements = meshed_region_pb2.UNKNOWN_SHAPE in mesh.shapes
+        return response
+
+    def ListNamedSelections(self, request, context):
+        mesh = self._get(request.mesh, context)
+        response = meshed_region_pb2.ListNamedSelectionsResponse()
+        response.named_selections.extend(mesh.named_selections)
+        return response
+
+    @staticmethod
+    def _index(request, ids, context):
+        index = request.index
+        if request.WhichOneof("index_id") == "id":
+            index = ids.index(request.id) if request.id in ids else -1
+        if not 0 <= index < len(ids):
+            context.abort(grpc.StatusCode.NOT_FOUND, "entity not found")
+        return index
+
+    def _node(self, mesh, index):
+        return meshed_region_pb2.Node(
+            id=mesh.node_ids[index], index=index, coordinates=mesh.coordinates[index]
+        )
+
+    def GetNode(self, request, context):
+        mesh = self._get(request.mesh, context)
+        return self._node(mesh, self._index(request, mesh.node_ids, context))
+
+    def GetElement(self, request, context):
+        mesh = self._get(request.mesh, context)
+        index = self._index(request, mesh.element_ids, context)
+        response = meshed_region_pb2.Element(id=mesh.element_ids[index], index=index)
+        for node_index in mesh.connectivities[index]:
+            response.nodes.append(self._node(mesh, node_index))
+        return response
+
+    def Delete(self, request, context):
+        self._store.unref(request.id.id)
+        return base_pb2.Empty()
+
+
+class _ResultInfoServicer(result_info_pb2_grpc.ResultInfoServiceServicer):
+    def __init__(self, fake):
+        self._fake = fake
+        self._store = fake._store
+
+    def _get(self, message, context, method):
+        self._fake.result_info_requests[method] += 1
+        return self._store.get(message.id.id, context, _ResultInfo)
+
+    def List(self, request, context):
+        info = self._get(request, context, "List")
+        return result_info_pb2.ResultInfoResponse(
+            analysis_type=result_info_pb2.STATIC,
+            physics_type=result_info_pb2.MECANIC,
+            nresult=len(info.results),
+            unit_system_name=info.properties["unit_system_name"],
+            job_name=info.properties["job_name"],
+        )
+
+    def GetStringProperties(self, request, context):
+        info = self._get(request.result_info, context, "GetStringProperties")
+        response = result_info_pb2.GetStringPropertiesResponse()
+        for name in request.property_names:
+            if name not in info.properties:
+                context.abort(grpc.StatusCode.INVALID_ARGUMENT, f"unknown property {name}")
+            response.properties[name] = info.properties[name]
+        return response
+
+    def ListResult(self, request, context):
+        info = self._get(request.result_info, context, "ListResult")
+        operator_name, physics_name, ncomp = info.results[request.numres]
+        return available_result_pb2.AvailableResultResponse(
+            name=operator_name, physicsname=physics_name, ncomp=ncomp
+        )
+
+    def Delete(self, request, context):
+        self._store.unref(request.id.id)
+        return base_pb2.Empty()
+
+
+class _OperatorServicer(operator_pb2_grpc.OperatorServiceServicer):
+    """Creates and connects the operators, evaluating them is not
+    implemented."""
+
+    # inputs of the ``UpdateRequest`` which are entities of the server
+    _entity_inputs = ("field", "collection", "scoping", "mesh")
+
+    def __init__(self, fake):
+        self._fake = fake
+        self._store = fake._store
+
+    def Create(self, request, context):
+        self._fake.operator_requests["Create"] += 1
+        entity_id = self._store.ref(self._store.add(_Operator(request.name)))
+        return _message(operator_pb2.Operator, entity_id, name=request.name)
+
+    def Update(self, request, context):
+        self._fake.operator_requests["Update"] += 1
+        op = self._store.get(request.op.id.id, context, _Operator)
+        if request.HasField("inputop"):
+            input_id = request.inputop.inputop.id.id
+        else:
+            input_id = None
+            for name in self._entity_inputs:
+                if request.HasField(name):
+                    input_id = getattr(request, name).id.id
+        with self._store.lock:
+            previous = op.inputs.pop(request.pin, None)
+            if input_id is not None:
+                self._store.get(input_id, context)
+                op.inputs[request.pin] = self._store.ref(input_id)
+            if previous is not None:
+                self._store.unref(previous)
+        return base_pb2.Empty()
+
+    def Delete(self, request, context):
+        self._store.unref(request.id.id)
+        return base_pb2.Empty()
+
+
+class FakeDpfServer:
+    """gRPC server implementing in memory the services of DPF which do not
+    need result files or operator evaluations.
+
+    The server runs in threads of this process. The objects of
+    ``ansys.dpf.core`` delete their server side entity when they are garbage
+    collected, which can then happen in a thread of the server and block it:
+    use :class:`FakeDpfServerProcess` for long sessions.
+
+    Parameters
+    ----------
+    ip : str, optional
+        IP address to listen on. The default is ``"127.0.0.1"``.
+    port : int, optional
+        Port to listen on. The default is ``0``, in which case a free port is
+        chosen.
+    version : str, optional
+        Version of DPF reported to the clients. The default is ``"4.0"``.
+    max_workers : int, optional
+        Number of threads serving the requests. The default is ``10``.
+    """
+
+    def __init__(self, ip="127.0.0.1", port=0, version="4.0", max_workers=10):
+        self.ip = ip
+        self.port = port
+        self.version = version
+        self._max_workers = max_workers
+        self._store = _Store()
+        self._server = None
+        # content of the uploaded files by server path
+        self.files = {}
+        self.tmp_dir = "/fake_dpf_tmp"
+        self.uploaded_bytes = 0
+        # number of the next file transfers aborted after their first chunk
+        self.interrupted_transfers = 0
+        # number of requests received by the result info service, by method
+        self.result_info_requests = collections.Counter()
+        # number of requests received by the operator service, by method
+        self.operator_requests = collections.Counter()
+
+    def new_result_info(self, results=(("U", "displacement", 3), ("S", "stress", 6))):
+        """Create the metadata of an analysis.
+
+        Parameters
+        ----------
+        results : tuple, optional
+            Operator name, physics name and number of components of each
+            result.
+
+        Returns
+        -------
+        ansys.grpc.dpf.result_info_pb2.ResultInfo
+            Message of the result info, to give to
+            :class:`ansys.dpf.core.ResultInfo`.
+        """
+        entity_id = self._store.ref(self._store.add(_ResultInfo(list(results))))
+        return _message(result_info_pb2.ResultInfo, entity_id)
+
+    @property
+    def n_entities(self):
+        """Number of entities held by the server."""
+        return len(self._store)
+
+    def start(self):
+        """Start serving the requests.
+
+        Returns
+        -------
+        int
+            Port listened on.
+        """
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=self._max_workers))
+        base_pb2_grpc.add_BaseServiceServicer_to_server(_BaseServicer(self), server)
+        scoping_pb2_grpc.add_ScopingServiceServicer_to_server(_ScopingServicer(self), server)
+        field_pb2_grpc.add_FieldServiceServicer_to_server(_FieldServicer(self), server)
+        field_definition_pb2_grpc.add_FieldDefinitionServiceServicer_to_server(
+            _FieldDefinitionServicer(self), server
+        )
+        collection_pb2_grpc.add_CollectionServiceServicer_to_server(
+            _CollectionServicer(self), server
+        )
+        meshed_region_pb2_grpc.add_MeshedRegionServiceServicer_to_server(
+            _MeshedRegionServicer(self), server
+        )
+        result_info_pb2_grpc.add_ResultInfoServiceServicer_to_server(
+            _ResultInfoServicer(self), server
+        )
+        operator_pb2_grpc.add_OperatorServiceServicer_to_server(
+            _OperatorServicer(self), server
+        )
+        self.port = server.add_insecure_port(f"{self.ip}:{self.port}")
+        server.start()
+        self._server = server
+        return self.port
+
+    def stop(self):
+        """Stop serving the requests."""
+        if self._server is not None:
+            self._server.stop(None)
+            self._server = None
+
+    def connect(self, as_global=False):
+        """Connect a client to this server.
+
+        Parameters
+        ----------
+        as_global : bool, optional
+            Whether the connection becomes the global server of
+            ``ansys.dpf.core``. The default is ``False``.
+
+        Returns
+        -------
+        ansys.dpf.core.server.DpfServer
+        """
+        return dpf.connect_to_server(self.ip, self.port, as_global=as_global)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+class FakeDpfServerProcess(FakeDpfServer):
+    """:class:`FakeDpfServer` running in a child Python process.
+
+    The requests are then not served by the interpreter of the client, as
+    with a real server.
+
+    Parameters
+    ----------
+    ip : str, optional
+        IP address to listen on. The default is ``"127.0.0.1"``.
+    port : int, optional
+        Port to listen on. The default is ``0``, in which case a free port is
+        chosen.
+    version : str, optional
+        Version of DPF reported to the clients. The default is ``"4.0"``.
+    """
+
+    def __init__(self, ip="127.0.0.1", port=0, version="4.0"):
+        super().__init__(ip, port, version)
+        self._process = None
+
+    @property
+    def n_entities(self):
+        raise NotImplementedError("The entities are held by the child process.")
+
+    def start(self):
+        """Start the child process serving the requests.
+
+        Returns
+        -------
+        int
+            Port listened on.
+        """
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        self._process = subprocess.Popen(
+            [
+                sys.executable,
+                os.path.abspath(__file__),
+                "--ip", self.ip,
+                "--port", str(self.port),
+                "--version", self.version,
+            ],
+            stdout=subprocess.PIPE,
+            env=env,
+            universal_newlines=True,
+        )
+        line = self._process.stdout.readline()
+        if not line:
+            self._process.wait()
+            raise RuntimeError("The fake DPF server process failed to start.")
+        self.port = int(line)
+        return self.port
+
+    def stop(self):
+        """Stop the child process."""
+        if self._process is not None:
+            self._process.terminate()
+            self._process.wait()
+            self._process.stdout.close()
+            self._process = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--ip", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--version", default="4.0")
+    args = parser.parse_args(argv)
+    fake = FakeDpfServer(args.ip, args.port, args.version)
+    print(fake.start(), flush=True)
+    fake._server.wait_for_termination()
+
+
+if __name__ == "__main__":
+    main()
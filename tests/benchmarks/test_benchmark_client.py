@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from ansys.dpf import core as dpf
+import benchmark_client
+from fake_server import FakeDpfServerProcess
+
+
+@pytest.fixture(scope="module")
+def fake_server():
+    with FakeDpfServerProcess() as fake:
+        yield fake.connect(as_global=False)
+
+
+def test_fake_server_field(fake_server):
+    field = dpf.fields_factory.create_3d_vector_field(4, server=fake_server)
+    field.data = np.arange(12.0)
+    field.scoping.ids = [1, 2, 3, 4]
+    field.unit = "m"
+    assert field.shape == (4, 3)
+    assert np.allclose(field.data[1], [3.0, 4.0, 5.0])
+    assert field.unit == "m"
+    copy = field.deep_copy(server=fake_server)
+    assert np.allclose(copy.get_entity_data_by_id(3), [[6.0, 7.0, 8.0]])
+
+
+def test_fake_server_fields_container(fake_server):
+    fields = []
+    for i in range(3):
+        field = dpf.fields_factory.create_scalar_field(2, server=fake_server)
+        field.data = [float(i), float(i)]
+        fields.append(field)
+    fc = dpf.fields_container_factory.over_time_freq_fields_container(
+        fields, server=fake_server
+    )
+    assert len(fc) == 3
+    assert fc.get_available_ids_for_label("time") == [1, 2, 3]
+    assert [f.data[0] for f in fc] == [0.0, 1.0, 2.0]
+
+
+def test_fake_server_meshed_region(fake_server):
+    mesh = dpf.MeshedRegion(num_nodes=4, num_elements=1, server=fake_server)
+    for i, node in enumerate(mesh.nodes.add_nodes(4)):
+        node.id = i + 1
+        node.coordinates = [float(i), 0.0, 0.0]
+    for element in mesh.elements.add_elements(1):
+        element.id = 1
+        element.connectivity = [0, 1, 2, 3]
+        element.is_shell = True
+    assert mesh.nodes.n_nodes == 4
+    assert mesh.elements.element_types_field.data[0] == dpf.element_types.Quad4.value
+    scoping = dpf.Scoping(location=dpf.locations.nodal, server=fake_server)
+    scoping.ids = [3, 1]
+    indices, mask = mesh.nodes.map_scoping(scoping)
+    assert np.allclose(indices, [2, 0])
+
+
+def test_benchmarks_run(fake_server):
+    results = benchmark_client.run(fake_server, size=100, repeat=1)
+    assert set(results) == set(benchmark_client.BENCHMARKS)
+    for result in results.values():
+        assert result is None or result["best"] > 0
+    assert benchmark_client.table(results)
@@ -160,6 +160,17 @@ def engineering_data_sources():
     return ds
 
 
+@pytest.fixture()
+def fake_dpf_server():
+    """Fake DPF server of ``benchmarks/fake_server.py`` answering the requests
+    in this process, so that the tests can read the requests it received.
+    Connect to it with ``fake_dpf_server.connect(as_global=False)``."""
+    from benchmarks.fake_server import FakeDpfServer
+
+    with FakeDpfServer() as fake:
+        yield fake
+
+
 class LocalServers:
     def __init__(self):
         self._local_servers = []
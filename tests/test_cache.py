@@ -1,3 +1,5 @@
+import numpy as np
+
 from ansys.dpf import core as dpf
 from ansys.dpf.core.check_version import server_meet_version
 
@@ -45,7 +47,12 @@ def test_available_results_cache(simple_bar):
     res_info = model.metadata.result_info
     for res in res_info:
         pass
-    assert len(res_info._cache.cached) == len(res_info) + 1
+    n_cached = len(res_info._cache.cached)
+    identifier = dpf.cache.MethodIdentifier("_get_results", (), {})
+    assert identifier in res_info._cache.cached
+    for res in res_info:
+        pass
+    assert len(res_info._cache.cached) == n_cached
 
 
 def test_physics_type_cache(simple_bar):
@@ -54,12 +61,16 @@ def test_physics_type_cache(simple_bar):
     res_info = provider.outputs.result_info()
     assert len(res_info._cache.cached) == 0
     res_info.unit_system
-    assert len(res_info._cache.cached) == 1
-    res_info.physics_type
     if server_meet_version("3.0", ds._server):
+        # the property and all the string properties requested at once
         assert len(res_info._cache.cached) == 2
     else:
         assert len(res_info._cache.cached) == 1
+    res_info.physics_type
+    if server_meet_version("3.0", ds._server):
+        assert len(res_info._cache.cached) == 3
+    else:
+        assert len(res_info._cache.cached) == 1
 
 
 def test_server_info_cache():
@@ -68,3 +79,98 @@ def test_server_info_cache():
     dpf.SERVER.info
     identifier = dpf.cache.MethodIdentifier("_get_server_info", (), {})
     assert identifier in dpf.SERVER._base_service._cache.cached
+
+
+def test_field_counts_cache():
+    field = dpf.fields_factory.create_3d_vector_field(2)
+    field.data = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    assert len(field._cache.cached) == 0
+    assert field.shape == (2, 3)
+    assert len(field._cache.cached) == 1
+    assert field.size == 6
+    assert len(field._cache.cached) == 1
+    field.append([7.0, 8.0, 9.0], 3)
+    assert len(field._cache.cached) == 0
+    assert field.shape == (3, 3)
+
+
+def test_field_definition_cache():
+    field = dpf.fields_factory.create_3d_vector_field(2)
+    field.unit = "m"
+    assert field.unit == "m"
+    assert len(field.field_definition._cache.cached) == 1
+    field.location
+    assert len(field.field_definition._cache.cached) == 1
+    field.unit = "mm"
+    assert field.unit == "mm"
+
+
+def test_field_counts_cache_dimensionality():
+    field = dpf.fields_factory.create_3d_vector_field(2)
+    assert field.component_count == 3
+    field.dimensionality = dpf.Dimensionality.scalar_dim()
+    assert field.component_count == 1
+
+
+@dpf.cache.class_handling_cache
+class _Squares:
+    def __init__(self):
+        self.calls = 0
+
+    def _get(self, value):
+        self.calls += 1
+        return np.asarray(value) ** 2
+
+    def _set(self):
+        pass
+
+    _to_cache = {_get: [_set]}
+
+
+def test_unhashable_args_cache():
+    squares = _Squares()
+    assert np.allclose(squares._get([1, 2]), [1, 4])
+    assert np.allclose(squares._get([1, 2]), [1, 4])
+    assert np.allclose(squares._get(np.array([1, 2])), [1, 4])
+    assert squares.calls == 2
+    identifier = dpf.cache.MethodIdentifier("_get", ([1, 2],), {})
+    assert identifier in squares._cache.cached
+    squares._set()
+    assert len(squares._cache.cached) == 0
+
+
+def test_lru_eviction_cache():
+    squares = _Squares()
+    squares._cache.max_entries = 2
+    squares._get(1)
+    squares._get(2)
+    squares._get(1)
+    squares._get(3)
+    assert squares._cache.stats.evictions == 1
+    assert dpf.cache.MethodIdentifier("_get", (1,), {}) in squares._cache.cached
+    assert dpf.cache.MethodIdentifier("_get", (2,), {}) not in squares._cache.cached
+    stats = squares._cache.stats
+    assert (stats.entries, stats.hits, stats.misses) == (2, 1, 3)
+
+    squares._cache.max_entries = None
+    squares._cache.max_bytes = 0
+    squares._get(np.arange(1000))
+    assert len(squares._cache.cached) == 1
+    assert squares._cache.stats.bytes >= 8000
+
+
+def test_global_limits_cache():
+    first, second = _Squares(), _Squares()
+    first._get(np.arange(1000))
+    second._get(np.arange(1000))
+    stats = dpf.cache.cache_stats()
+    assert stats["_Squares"].entries >= 2
+    assert stats["total"].bytes >= stats["_Squares"].bytes
+    try:
+        dpf.cache.set_cache_limits(max_total_bytes=0)
+        assert len(first._cache.cached) == 0
+        assert len(second._cache.cached) == 0
+    finally:
+        dpf.cache.set_cache_limits()
+    dpf.cache.clear_caches()
+    assert dpf.cache.cache_stats()["total"].entries == 0
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from ansys.dpf import core as dpf
@@ -806,3 +807,54 @@ def test_polyhedron():
         False,
         None,
     )
+
+
+def test_element_types_table():
+    table = element_types._table()
+    for element_type in element_types:
+        descriptor = dpf.element_types.descriptor(element_type)
+        assert dpf.element_types.shape(element_type.value) == descriptor.shape
+        if descriptor.n_nodes is not None:
+            assert table.n_nodes[element_type.value] == descriptor.n_nodes
+            assert table.n_corner_nodes[element_type.value] == descriptor.n_corner_nodes
+    assert element_types._descriptors() is element_types._descriptors()
+    assert table.linear_type[element_types.Hex20.value] == element_types.Hex8.value
+    assert table.linear_type[element_types.Quad4.value] == element_types.Quad4.value
+    assert table.n_nodes[element_types.General.value] == 0
+    with pytest.raises(ValueError):
+        table.n_nodes[0] = 1
+
+
+def test_element_types_vectorized_queries():
+    types = np.array(
+        [
+            element_types.Hex20.value,
+            element_types.Quad4.value,
+            element_types.Line2.value,
+            element_types.Hex8.value,
+            element_types.Polygon.value,
+        ]
+    )
+    counts = dpf.element_types.count_by_shape(types)
+    assert counts["solid"] == 2
+    assert counts["shell"] == 2
+    assert counts["beam"] == 1
+    assert counts["point"] == 0
+    assert np.array_equal(
+        dpf.element_types.shape_mask(types, "solid"), [True, False, False, True, False]
+    )
+    with pytest.raises(ValueError):
+        dpf.element_types.shape_mask(types, "cube")
+
+    # the polygon has 5 nodes, all of them are corners
+    connectivity = np.arange(20 + 4 + 2 + 8 + 5)
+    corners, pointer = dpf.element_types.corner_nodes(types[:-1], connectivity[:-5])
+    assert np.array_equal(pointer, [0, 8, 12, 14])
+    assert np.array_equal(corners[8:], range(20, 34))
+    with pytest.raises(ValueError):
+        dpf.element_types.corner_nodes(types, connectivity)
+    pointer = [0, 20, 24, 26, 34]
+    corners, corner_pointer = dpf.element_types.corner_nodes(types, connectivity, pointer)
+    assert np.array_equal(corner_pointer, [0, 8, 12, 14, 22])
+    assert np.array_equal(corners[:8], range(8))
+    assert np.array_equal(corners[8:], list(range(20, 34)) + list(range(34, 39)))
@@ -577,6 +577,31 @@ def test_local_elemental_nodal_array_field_append():
     assert len(field_to_local._data_pointer) == num_entities
 
 
+def test_local_field_append_many():
+    num_entities = 400
+    data = np.random.random((num_entities, 3))
+    field_to_local = dpf.core.fields_factory.create_3d_vector_field(num_entities)
+    with field_to_local.as_local_field() as f:
+        f.append_many(np.arange(1, num_entities + 1), data)
+        assert f._is_set is True
+    assert np.allclose(field_to_local.data, data)
+    assert np.allclose(field_to_local.scoping.ids, range(1, num_entities + 1))
+    assert len(field_to_local._data_pointer) == 0
+
+    # one entity data of a different size per entity
+    field_to_local = dpf.core.fields_factory.create_3d_vector_field(
+        3, location=dpf.core.locations.elemental_nodal
+    )
+    with field_to_local.as_local_field() as f:
+        f.append([0.1, 0.2, 0.3], 1)
+        f.append_many([2, 3], [np.ones((2, 3)), np.zeros((3, 3))])
+        assert np.allclose(f.get_entity_data_by_id(2), np.ones((2, 3)))
+        assert np.allclose(f.get_entity_data(2), np.zeros((3, 3)))
+    assert np.allclose(field_to_local._data_pointer, [0, 3, 9])
+    assert field_to_local.scoping.ids == [1, 2, 3]
+    assert np.allclose(field_to_local.get_entity_data(0), [0.1, 0.2, 0.3])
+
+
 def test_local_get_entity_data():
     num_entities = 100
     field_to_local = dpf.core.fields_factory.create_3d_vector_field(
@@ -1004,5 +1029,74 @@ def test_dot_operator_field():
     assert np.allclose(out.data, -field.data)
 
 
+def test_set_get_data_multiple_chunks():
+    dpf.core.settings.set_upload_chunk_size(1024)
+    try:
+        data = np.random.random((1000, 3))
+        field = dpf.core.field_from_array(data)
+        field.scoping.ids = np.arange(1, 1001)
+        assert np.allclose(field.data, data)
+        assert np.allclose(field.scoping.ids, np.arange(1, 1001))
+    finally:
+        dpf.core.settings.set_upload_chunk_size()
+
+
+def test_field_array_protocol():
+    field = dpf.core.fields_factory.create_3d_vector_field(2)
+    field.data = [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+    array = np.asarray(field)
+    assert not array.flags.writeable
+    assert np.asarray(field) is array
+    assert np.allclose(np.add(field, np.ones((2, 3))), array + 1.0)
+    assert np.allclose(np.mean(field, axis=0), [1.5, 2.5, 3.5])
+    assert np.allclose(np.concatenate([field, field]), np.vstack([array, array]))
+    field.data = [1.0, 1.0, 1.0, 2.0, 2.0, 2.0]
+    assert np.allclose(np.asarray(field), [[1.0, 1.0, 1.0], [2.0, 2.0, 2.0]])
+    assert np.array(field).flags.writeable
+    with dpf.core.transport_policy(precision="float"):
+        assert np.asarray(field).dtype == np.float32
+    assert np.asarray(field).dtype == np.float64
+    field.dimensionality = dpf.core.Dimensionality.scalar_dim()
+    assert np.asarray(field).shape == (6,)
+
+
+def test_property_field_array_protocol():
+    field = dpf.core.PropertyField(2, nature=dpf.core.natures.scalar)
+    field.data = [1, 2]
+    assert np.sum(field) == 3
+    assert np.asarray(field).dtype == np.int32
+    assert np.allclose(np.sqrt(field), np.sqrt([1.0, 2.0]))
+
+
+def test_field_ufunc_server_operators():
+    field = dpf.core.fields_factory.create_3d_vector_field(2)
+    field.data = [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+    field.scoping.ids = [1, 2]
+    out = np.sqrt(field)
+    assert isinstance(out, dpf.core.Field)
+    assert np.allclose(out.data, np.sqrt(field.data))
+    out = np.multiply(field, 2.0)
+    assert isinstance(out, dpf.core.Field)
+    assert np.allclose(out.data, field.data * 2.0)
+    out = np.multiply(field, 2)
+    assert np.allclose(out.data, field.data * 2.0)
+    norm = np.linalg.norm(field, axis=1)
+    assert isinstance(norm, dpf.core.Field)
+    assert np.allclose(norm.data, np.linalg.norm(field.data, axis=1))
+
+
+def test_lazy_arithmetic_fake_server(fake_dpf_server):
+    server = fake_dpf_server.connect(as_global=False)
+    field = core.fields_factory.create_scalar_field(2, server=server)
+    # nothing is sent to the server until the expression is used
+    expr = field ** 2 + field ** 2 - field
+    assert type(expr) is ops.math.minus_fc
+    assert fake_dpf_server.operator_requests == {}
+    assert expr.inputs is not None
+    # the identical sub-expressions are only created once
+    assert fake_dpf_server.operator_requests == {"Create": 3, "Update": 5}
+    del expr, field, server
+
+
 if __name__ == "__main__":
     test_get_set_data_local_field()
@@ -470,5 +470,24 @@ def test_dot_operator_fields_container():
     assert np.allclose(out[0].data, -field.data)
 
 
+def test_iter_with_label_spaces_fields_container():
+    fc = FieldsContainer()
+    fc.labels = ["time", "complex"]
+    for i in range(0, 6):
+        mscop = {"time": i + 1, "complex": 0}
+        field = Field(nentities=4)
+        field.scoping.ids = range(1, 5)
+        field.data = np.full((4, 3), float(i))
+        fc.add_field(mscop, field)
+    assert len(list(fc)) == 6
+    assert fc.get_available_ids_for_label("time") == list(range(1, 7))
+    for prefetch in [0, 2]:
+        for i, (label_space, field) in enumerate(
+            fc.iter_with_label_spaces(prefetch=prefetch)
+        ):
+            assert label_space == {"time": i + 1, "complex": 0}
+            assert np.allclose(field.data, float(i))
+
+
 if __name__ == "__main__":
     test_add_field_by_time_id()
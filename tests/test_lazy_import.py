@@ -0,0 +1,26 @@
+import subprocess
+import sys
+
+
+def test_result_operators_not_imported_with_package():
+    code = (
+        "import sys\n"
+        "import ansys.dpf.core\n"
+        "assert 'ansys.dpf.core.operators.result' not in sys.modules\n"
+    )
+    subprocess.check_call([sys.executable, "-c", code])
+
+
+def test_operators_imported_on_first_access():
+    code = (
+        "import sys\n"
+        "from ansys.dpf import core as dpf\n"
+        "assert 'ansys.dpf.core.operators' not in sys.modules\n"
+        "assert dpf.operators.math.add is not None\n"
+        "assert 'ansys.dpf.core.operators.math' in sys.modules\n"
+        "assert 'ansys.dpf.core.operators.result' not in sys.modules\n"
+        "from ansys.dpf.core.operators import result\n"
+        "assert result.stress is not None\n"
+    )
+    subprocess.check_call([sys.executable, "-c", code])
+
@@ -75,6 +75,38 @@ def test_get_element_meshedregion(simple_bar_model):
     assert node.coordinates == [0.1, 1.6, 0.1]
 
 
+def test_iterate_nodes_elements_meshedregion(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    for i, node in enumerate(mesh.nodes):
+        if i in [0, 1, 500]:
+            ref_node = mesh.nodes.node_by_index(i)
+            assert node.id == ref_node.id
+            assert node.index == i
+            assert np.allclose(node.coordinates, ref_node.coordinates)
+    for i, el in enumerate(mesh.elements):
+        if i in [0, 1, 500]:
+            ref_el = mesh.elements.element_by_index(i)
+            assert el.id == ref_el.id
+            assert el.index == i
+            assert el.node_ids == ref_el.node_ids
+            assert el.connectivity == ref_el.connectivity
+            assert el.type == ref_el.type
+            assert el.shape == ref_el.shape
+            assert np.allclose(el.nodes[0].coordinates, ref_el.nodes[0].coordinates)
+
+
+def test_elements_nodes_by_scoping_meshedregion(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    ids = mesh.elements.scoping.ids[2:5]
+    elements = mesh.elements.elements_by_scoping(dpf.core.Scoping(ids=ids))
+    assert [el.id for el in elements] == ids
+    assert [el.index for el in elements] == [2, 3, 4]
+    ids = mesh.nodes.scoping.ids[2:5]
+    nodes = mesh.nodes.nodes_by_scoping(ids)
+    assert [node.id for node in nodes] == ids
+    assert [node.index for node in nodes] == [2, 3, 4]
+
+
 def test_get_coordinates_field_meshedregion(simple_bar_model):
     mesh = simple_bar_model.metadata.meshed_region
     nodescoping = mesh.nodes.scoping
@@ -217,6 +249,19 @@ def test_id_indeces_mapping_on_elements_2(allkindofcomplexity):
     assert mapping[4520] == 2011
 
 
+def test_map_scoping_on_nodes_and_elements(allkindofcomplexity):
+    model = dpf.core.Model(allkindofcomplexity)
+    mesh = model.metadata.meshed_region
+    scop = dpf.core.Scoping(ids=[9008, 20, 10 ** 8, 12346], location="Nodal")
+    ind, mask = mesh.nodes.map_scoping(scop)
+    assert np.allclose(ind, [9007, 19, 12345])
+    assert np.allclose(mask, [True, True, False, True])
+    scop = dpf.core.Scoping(ids=[4520, 23], location="Elemental")
+    ind, mask = mesh.elements.map_scoping(scop)
+    assert np.allclose(ind, [2011, 24])
+    assert np.all(mask)
+
+
 def test_named_selection_mesh(allkindofcomplexity):
     model = dpf.core.Model(allkindofcomplexity)
     mesh = model.metadata.meshed_region
@@ -109,6 +109,16 @@ def test_iterate_results_model(allkindofcomplexity):
         key()
 
 
+def test_results_doc_model(allkindofcomplexity):
+    model = dpf.core.Model(allkindofcomplexity)
+    res = model.results
+    doc = type(res).displacement.__doc__
+    assert "displacement" in doc.lower()
+    disp = res.displacement
+    assert disp.__doc__ == str(disp._operator)
+    assert "result provider" in dpf.core.results.Result.__doc__.lower()
+
+
 def test_result_not_overrided(plate_msup):
     model1 = dpf.core.Model(examples.electric_therm)
     size = len(model1.results)
@@ -185,6 +195,43 @@ def test_result_time_scoping(plate_msup):
     )
 
 
+def test_result_reduce(plate_msup):
+    model = dpf.core.Model(plate_msup)
+    disp = model.results.displacement
+    fc = disp.on_all_time_freqs.eval()
+    expected = np.max([field.data for field in fc], axis=0)
+    max_disp = disp.reduce(np.maximum, chunk_time_sets=3)
+    assert isinstance(max_disp, dpf.core.Field)
+    assert np.allclose(max_disp.data, expected)
+    assert max_disp.scoping.ids == fc[0].scoping.ids
+    assert max_disp.unit == fc[0].unit
+    # the time scoping of the result is not changed by the chunks
+    assert len(disp.eval()) == len(fc)
+    stress = model.results.stress
+    stress.reduce(np.maximum, chunk_time_sets=3)
+    assert len(stress.eval()) == len(model.results.stress.eval())
+    sum_disp = disp.on_time_scoping([1, 2, 3]).reduce(lambda a, b: a + b, 2)
+    assert np.allclose(sum_disp.data, fc[0].data + fc[1].data + fc[2].data)
+
+
+def test_result_reduce_changing_entities():
+    from ansys.dpf.core.results import _fold
+
+    accumulator = np.array([[1.0, 1.0], [2.0, 2.0]])
+    ids = np.array([10, 20])
+    accumulator, ids = _fold(
+        np.maximum, accumulator, ids, np.array([[5.0, 0.0], [3.0, 3.0]]), np.array([30, 10])
+    )
+    assert list(ids) == [10, 20, 30]
+    assert np.allclose(accumulator, [[3.0, 3.0], [2.0, 2.0], [5.0, 0.0]])
+    accumulator, ids = _fold(
+        lambda a, b: a + b, accumulator, ids, np.array([[1.0, 1.0]]), np.array([20])
+    )
+    assert np.allclose(accumulator, [[3.0, 3.0], [3.0, 3.0], [5.0, 0.0]])
+    with pytest.raises(ValueError):
+        _fold(np.maximum, accumulator, ids, np.ones((4, 2)), np.array([10, 40]))
+
+
 def test_result_splitted_subset(allkindofcomplexity):
     model = dpf.core.Model(allkindofcomplexity)
     vol = model.results.elemental_volume
@@ -201,3 +201,34 @@ def test_model_stress_multi_server(transient_models):
         fc.deep_copy(fc2._server), fc2, server=fc2._server
     )
     assert idenfc.outputs.boolean()
+
+
+def test_distributed_executor_multi_server(local_server):
+    stress = dpf.operators.result.stress()
+    workflow = dpf.Workflow()
+    workflow.add_operator(stress)
+    workflow.set_input_name("data_sources", stress.inputs.data_sources)
+    workflow.set_output_name("stress", stress.outputs.fields_container)
+    servers = [dpf._global_server(), local_server]
+    executor = dpf.DistributedExecutor(workflow, servers, upload_files=True)
+    outputs = executor.run([examples.static_rst, examples.static_rst], merge=False)
+    assert len(outputs) == 2
+    check_fc(outputs[0], outputs[1])
+    fc = executor.run([examples.static_rst, examples.static_rst])
+    assert fc._server == dpf._global_server()
+    assert len(fc) == len(outputs[0])
+
+
+def test_server_pool_multi_server():
+    with dpf.ServerPool(n_servers=2, channels_per_server=2) as pool:
+        assert len(pool) == 2
+        with pool.server() as server1, pool.server() as server2:
+            assert server1 is not server2
+            assert pool.is_healthy(server1)
+            model = dpf.Model(examples.static_rst, server=server1)
+            assert model.metadata.meshed_region.nodes.n_nodes > 0
+        servers = [pool.acquire() for _ in range(4)]
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.1)
+        for server in servers:
+            pool.release(server)
@@ -1,3 +1,4 @@
+import asyncio
 import gc
 import os
 import shutil
@@ -22,6 +23,31 @@ def test_create_operator():
     assert op._message.id
 
 
+def test_get_output_async_operator():
+    op = dpf.core.Operator("min_max")
+    inpt = dpf.core.Field(nentities=3)
+    inpt.scoping.ids = [1, 2, 3]
+
+    async def evaluate():
+        await inpt.set_data_async([1, 2, 3, 4, 5, 6, 7, 8, 9])
+        op.connect(0, inpt)
+        f_min, f_max = await asyncio.gather(
+            op.get_output_async(0, dpf.core.types.field),
+            op.get_output_async(1, dpf.core.types.field),
+        )
+        return await f_min.data_async, await f_max.data_async
+
+    data_min, data_max = asyncio.run(evaluate())
+    assert np.allclose(data_min, [1.0, 2.0, 3.0])
+    assert np.allclose(data_max, [7.0, 8.0, 9.0])
+
+    op = dpf.core.Operator("min_max")
+    with pytest.raises(errors.DPFServerException):
+        asyncio.run(
+            op.get_output_async(0, dpf.core.types.field)
+        )
+
+
 def test_invalid_operator_name():
     with pytest.raises(errors.DPFServerException):
         dpf.core.Operator("not-an-operator")
@@ -1107,3 +1133,106 @@ def test_delete_auto_operator():
     del op
     gc.collect()
     assert op_ref() is None
+
+
+def test_result_cache_operator(allkindofcomplexity, tmpdir, monkeypatch):
+    cache = dpf.core.settings.enable_result_cache(str(tmpdir))
+    try:
+        model = dpf.core.Model(allkindofcomplexity)
+        ns = dpf.core.operators.scoping.on_named_selection(
+            requested_location=dpf.core.locations.nodal,
+            named_selection_name="_CM82",
+            data_sources=model.metadata.data_sources,
+        )
+        scoping = ns.outputs.mesh_scoping()
+        assert cache.size > 0
+        ns = dpf.core.operators.scoping.on_named_selection(
+            requested_location=dpf.core.locations.nodal,
+            named_selection_name="_CM82",
+            data_sources=model.metadata.data_sources,
+        )
+        scoping_cached = ns.outputs.mesh_scoping()
+        assert scoping_cached.ids == scoping.ids
+        assert scoping_cached.location == scoping.location
+
+        # the outputs supported by the mesh of the data sources are cached
+        cache.clear()
+        stress = model.results.stress()
+        fc = stress.outputs.fields_container()
+        assert cache.size > 0
+
+        def evaluated(*args):
+            raise AssertionError("The operator is evaluated by the server.")
+
+        with monkeypatch.context() as m:
+            m.setattr(dpf.core.dpf_operator, "_convertOutputMessageToPythonInstance", evaluated)
+            stress = model.results.stress()
+            fc_cached = stress.outputs.fields_container()
+        assert np.allclose(fc_cached[0].data, fc[0].data)
+        assert fc_cached[0].meshed_region.nodes.n_nodes == fc[0].meshed_region.nodes.n_nodes
+        assert np.allclose(
+            fc_cached.time_freq_support.time_frequencies.data,
+            fc.time_freq_support.time_frequencies.data,
+        )
+
+        # outputs depending on client side fields are not cached
+        cache.clear()
+        op = dpf.core.Operator("min_max")
+        field = dpf.core.Field(nentities=3)
+        field.data = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+        field.scoping.ids = [1, 2, 3]
+        op.connect(0, field)
+        op.get_output(0, dpf.core.types.field)
+        assert cache.size == 0
+    finally:
+        dpf.core.settings.disable_result_cache()
+
+
+def test_lazy_arithmetic_operators():
+    field = dpf.core.fields_factory.create_3d_vector_field(2)
+    field.data = [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+    field.scoping.ids = [1, 2]
+    forward = ops.utility.forward_field(field)
+
+    expr = forward ** 2 + forward ** 2
+    assert isinstance(expr, ops.math.add_fc)
+    assert "_lazy_inputs" in expr.__dict__
+    out = expr.outputs.fields_container()
+    assert "_lazy_inputs" not in expr.__dict__
+    assert np.allclose(out[0].data, np.array(field.data) ** 2 * 2.0)
+
+
+def test_result_cache_fake_server(fake_dpf_server, tmpdir):
+    from ansys.dpf.core.result_cache import ResultCache
+
+    fake_server = fake_dpf_server.connect(as_global=False)
+    cache = ResultCache(str(tmpdir))
+    field = dpf.core.fields_factory.create_scalar_field(2, server=fake_server)
+    field.data = [1.0, 2.0]
+    field.scoping.ids = [1, 2]
+    field.shell_layers = dpf.core.shell_layers.top
+    field.field_definition._modify_field_def(name="stress")
+    cache.store("field", field)
+    cached = cache.load("field", dpf.core.types.field, fake_server)
+    assert np.allclose(cached.data, field.data)
+    assert cached.name == "stress"
+    assert cached.shell_layers == dpf.core.shell_layers.top
+
+    # the mesh of a field is the mesh of the data sources it is computed from
+    mesh = dpf.core.MeshedRegion(num_nodes=2, server=fake_server)
+    field.meshed_region = mesh
+    cache.store("supported", field)
+    assert cache.load("supported", dpf.core.types.field, fake_server) is None
+    data_sources = ["data_sources", "rst", {"rst": [["file.rst", 1, 1]]}]
+    cache.store("supported", field, data_sources)
+    cached = cache.load("supported", dpf.core.types.field, fake_server)
+    assert cached.meshed_region._message.id == mesh._message.id
+
+    # the inputs are not referenced while no cache is active
+    op = dpf.core.operators.math.sqr(server=fake_server)
+    field_ref = weakref.ref(field)
+    op.connect(0, field)
+    del field, cached
+    gc.collect()
+    assert field_ref() is None
+    assert op._connections is None
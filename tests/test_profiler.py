@@ -0,0 +1,65 @@
+import json
+
+import grpc
+import numpy as np
+import pytest
+
+from ansys.dpf import core as dpf
+from ansys.dpf.core import profiler
+
+
+@pytest.fixture(scope="module")
+def profiled_server():
+    dpf.settings.set_grpc_profiling()
+    try:
+        server = dpf.start_local_server(as_global=False)
+    finally:
+        dpf.settings.set_grpc_profiling(False)
+    yield server
+    server.shutdown()
+
+
+def test_profile_field_data(profiled_server, tmpdir):
+    field = dpf.Field(nentities=3, server=profiled_server)
+    field.data = np.arange(9, dtype=float)
+    with dpf.profile() as p:
+        data = field.data
+    assert np.allclose(data.ravel(), np.arange(9))
+    assert len(p) > 0
+    stats = p.stats(by="api")
+    assert any(api.endswith("data") for api in stats)
+    method_stats = p.stats()
+    assert sum(s["count"] for s in method_stats.values()) == len(p)
+    assert sum(s["received"] for s in method_stats.values()) >= data.nbytes
+    assert "count" in p.table()
+    counts, _ = p.histogram(bins=3)
+    assert counts.sum() == len(p)
+
+    path = str(tmpdir.join("trace.json"))
+    p.to_chrome_trace(path)
+    with open(path) as f:
+        trace = json.load(f)
+    assert len(trace["traceEvents"]) == len(p)
+
+
+def test_profile_inactive(profiled_server):
+    dpf.settings.set_grpc_profiling()
+    try:
+        with dpf.profile() as p:
+            pass
+    finally:
+        dpf.settings.set_grpc_profiling(False)
+    field = dpf.Field(nentities=3, server=profiled_server)
+    field.data = np.arange(9, dtype=float)
+    assert len(p) == 0
+
+
+def test_profiling_disabled():
+    assert not profiler.PROFILING
+    # the channels of the servers started without profiling are not intercepted
+    assert isinstance(dpf.SERVER.channel, grpc.Channel)
+    assert type(dpf.SERVER.channel).__module__.startswith("grpc._channel")
+    with dpf.profile() as p:
+        field = dpf.Field(nentities=3)
+        field.data = np.arange(9, dtype=float)
+    assert len(p) == 0
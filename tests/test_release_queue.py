@@ -0,0 +1,54 @@
+import gc
+
+from ansys.dpf import core as dpf
+
+
+def test_deferred_release_fields():
+    server = dpf.SERVER
+    server.flush_released_objects()
+    init = server.live_objects.get("Field", 0)
+    fields = [dpf.Field(nentities=1) for _ in range(100)]
+    assert server.live_objects["Field"] == init + 100
+    released = server._release_queue.released
+    del fields
+    gc.collect()
+    assert server.live_objects.get("Field", 0) == init
+    server.flush_released_objects()
+    assert server._release_queue.pending == 0
+    assert server._release_queue.released >= released + 100
+
+
+def test_immediate_release_scoping():
+    server = dpf.SERVER
+    server.flush_released_objects()
+    try:
+        dpf.settings.set_deferred_release(False)
+        scoping = dpf.Scoping()
+        del scoping
+        gc.collect()
+        assert server._release_queue.pending == 0
+    finally:
+        dpf.settings.set_deferred_release()
+
+
+def test_failed_batch_release_falls_back_to_each_object(monkeypatch):
+    import grpc
+
+    class _Unavailable(grpc.RpcError):
+        def code(self):
+            return grpc.StatusCode.UNAVAILABLE
+
+    def _release_all(server, batch):
+        raise _Unavailable()
+
+    server = dpf.SERVER
+    server.flush_released_objects()
+    queue = server._release_queue
+    monkeypatch.setattr(queue, "_release_all", _release_all)
+    fields = [dpf.Field(nentities=1) for _ in range(10)]
+    released = queue.released
+    del fields
+    gc.collect()
+    server.flush_released_objects()
+    assert queue.pending == 0
+    assert queue.released >= released + 10
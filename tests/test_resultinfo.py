@@ -59,6 +59,16 @@ def test_get_result_resultinfo_from_index(model):
     assert res.name == "acceleration"
 
 
+def test_available_results_resultinfo_cached(model):
+    res = model.metadata.result_info
+    results = res.available_results
+    assert len(results) == res.n_results
+    assert res.available_results == results
+    assert res["acceleration"] is results[2]
+    assert res._names[2] == "acceleration"
+    assert "acceleration" in res
+
+
 def test_print_result_info(model):
     print(model.metadata.result_info)
 
@@ -82,3 +92,17 @@ def test_delete_auto_resultinfo(velocity_acceleration):
     del res
     with pytest.raises(Exception):
         res_shallow_copy.n_results
+
+
+def test_result_info_fake_server(fake_dpf_server):
+    server = fake_dpf_server.connect(as_global=False)
+    result_info = dpf.core.ResultInfo(fake_dpf_server.new_result_info(), server=server)
+    assert "stress" in result_info
+    assert result_info["stress"].n_components == 6
+    assert [r.name for r in result_info] == ["displacement", "stress"]
+    assert result_info.analysis_type == "static"
+    assert result_info.job_name == "file"
+    assert result_info.solver_version == "21.2"
+    assert str(result_info)
+    assert fake_dpf_server.result_info_requests == {"GetStringProperties": 1, "ListResult": 2}
+    del result_info, server
@@ -240,3 +240,31 @@ def test_auto_delete_scoping_local():
     del s
     with scop.as_local_scoping() as s:
         assert s[0] == 1
+
+
+def test_chunk_size_tuner():
+    tuner = dpf.core.scoping._ChunkSizeTuner()
+    size = tuner.chunk_size()
+    assert size == dpf.core.misc.DEFAULT_FILE_CHUNK_SIZE
+    tuner.record(size, 10, 10 * size, 1.0)
+    assert tuner.chunk_size() == 2 * size
+    tuner.record(2 * size, 10, 10 * size, 0.5)
+    assert tuner.chunk_size() == 4 * size
+    tuner.record(4 * size, 10, 10 * size, 0.8)
+    assert tuner.chunk_size() == 2 * size
+    # too short transfers are not measured
+    tuner.reset()
+    tuner.record(size, 1, size, 1.0)
+    assert tuner.chunk_size() == size
+
+
+def test_set_ids_chunk_size_auto_tuning():
+    dpf.core.settings.set_chunk_size_auto_tuning()
+    try:
+        ids = np.arange(1, 2_000_001, dtype=np.int32)
+        for _ in range(3):
+            scop = Scoping()
+            scop.ids = ids
+            assert np.array_equal(scop._get_ids(np_array=True), ids)
+    finally:
+        dpf.core.settings.set_chunk_size_auto_tuning(False)
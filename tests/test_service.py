@@ -91,6 +91,24 @@ def test_upload_download(allkindofcomplexity, tmpdir):
     assert os.path.exists(os.path.join(tmpdir, "file.vtk"))
 
 
+def test_file_transfer_manager(allkindofcomplexity, tmpdir):
+    manager = dpf.core.FileTransferManager(skip_unchanged=True)
+    path = transfer_to_local_path(allkindofcomplexity)
+    manager.forget_uploads()
+    report = manager.upload_files([path], use_tmp_dir=True)
+    assert len(report.transferred) == 1
+    assert report.nbytes == os.path.getsize(path)
+    report = manager.upload_files([path], use_tmp_dir=True)
+    assert report.skipped == report.paths
+    report = dpf.core.FileTransferManager().upload_files([path], use_tmp_dir=True)
+    assert report.transferred == report.paths
+    assert dpf.core.upload_file_in_tmp_folder(path) == report.paths[0]
+    target = os.path.join(tmpdir, "downloaded.rst")
+    report = manager.download_files({report.paths[0]: target})
+    assert report.paths == [target]
+    assert os.path.getsize(target) == os.path.getsize(path)
+
+
 @pytest.mark.skipif(running_docker, reason="Path hidden within docker container")
 def test_download_folder(allkindofcomplexity, plate_msup, multishells, tmpdir):
     file = dpf.core.upload_file_in_tmp_folder(allkindofcomplexity)
@@ -256,5 +274,48 @@ def test_dpf_join():
         assert conc == "temp\\file.rst"
 
 
+def test_file_transfer_manager_fake_server(fake_dpf_server, tmpdir):
+    paths = []
+    for i in range(3):
+        path = os.path.join(tmpdir, f"file{i}.rst")
+        with open(path, "wb") as f:
+            f.write(os.urandom(dpf.core.misc.DEFAULT_FILE_CHUNK_SIZE * 2 + i))
+        paths.append(path)
+    server = fake_dpf_server.connect(as_global=False)
+    manager = dpf.core.FileTransferManager(server, retries=1, skip_unchanged=True)
+    fake_dpf_server.interrupted_transfers = 1
+    report = manager.upload_files(paths, use_tmp_dir=True)
+    assert report.paths == [fake_dpf_server.tmp_dir + f"/file{i}.rst" for i in range(3)]
+    assert len(report.transferred) == 3 and report.throughput
+    assert fake_dpf_server.interrupted_transfers == 0
+    # the retried upload is counted once by the progress
+    assert manager._sent == sum(os.path.getsize(p) for p in paths)
+    # the files are sent every time by default
+    uploaded_bytes = fake_dpf_server.uploaded_bytes
+    path = dpf.core.upload_file_in_tmp_folder(paths[0], server=server)
+    assert path == report.paths[0]
+    assert fake_dpf_server.uploaded_bytes == uploaded_bytes + os.path.getsize(paths[0])
+    # unchanged files are not sent again
+    uploaded_bytes = fake_dpf_server.uploaded_bytes
+    report = manager.upload_files(paths, use_tmp_dir=True)
+    assert report.skipped == report.paths
+    assert fake_dpf_server.uploaded_bytes == uploaded_bytes
+    with open(paths[1], "ab") as f:
+        f.write(b"changed")
+    report = manager.upload_files(paths, use_tmp_dir=True)
+    assert report.transferred == [fake_dpf_server.tmp_dir + "/file1.rst"]
+
+    fake_dpf_server.interrupted_transfers = 1
+    targets = {p: os.path.join(tmpdir, f"downloaded{i}") for i, p in enumerate(report.paths)}
+    report = manager.download_files(targets)
+    assert report.paths == list(targets.values())
+    assert fake_dpf_server.interrupted_transfers == 0
+    for path, target in zip(paths, report.paths):
+        with open(path, "rb") as a, open(target, "rb") as b:
+            assert a.read() == b.read()
+        assert not os.path.exists(target + ".part")
+    del manager, server
+
+
 if __name__ == "__main__":
     test_dpf_join()
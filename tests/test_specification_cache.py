@@ -0,0 +1,52 @@
+from ansys.dpf import core as dpf
+from ansys.dpf.core import specification_cache
+from ansys.dpf.core.dpf_operator import OperatorSpecification, PinSpecification
+
+
+def _specification(name):
+    pin = PinSpecification("field", ["field", "fields_container"], False, "input", False)
+    return OperatorSpecification(name, "description", {"category": "math"}, {0: pin}, {0: pin})
+
+
+def test_specification_cache_memory():
+    cache = specification_cache.SpecificationCache()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return _specification("norm")
+
+    spec = cache.get("4.0", "norm", fetch)
+    assert cache.get("4.0", "norm", fetch) is spec
+    assert len(calls) == 1
+    cache.get("5.0", "norm", fetch)
+    assert len(calls) == 2
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_specification_cache_disk(tmpdir):
+    spec = specification_cache.SpecificationCache(str(tmpdir)).get(
+        "4.0", "norm", lambda: _specification("norm")
+    )
+    cache = specification_cache.SpecificationCache(str(tmpdir))
+    loaded = cache.get("4.0", "norm", lambda: None)
+    assert loaded is not spec
+    assert loaded == spec
+    assert loaded.inputs[0].type_names == ["field", "fields_container"]
+    cache.clear()
+    assert cache.get("4.0", "norm", lambda: None) is None
+
+
+def test_operator_specification_cached():
+    spec = dpf.Operator.operator_specification("min_max")
+    assert dpf.Operator.operator_specification("min_max") is spec
+    op = dpf.Operator("min_max")
+    assert op._spec is spec
+
+
+def test_generated_operator_static_specification():
+    op = dpf.operators.math.norm()
+    spec = specification_cache._static_specification(type(op), op.name)
+    assert op._spec is spec
+    assert spec.inputs[0].name == "field"
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from ansys.dpf import core as dpf
+from ansys.dpf.core import transport
+
+
+def test_transport_policy():
+    policy = dpf.TransportPolicy(precision="float", compression="gzip")
+    assert policy.dtype == np.float32
+    assert policy.replace(precision="double") == dpf.TransportPolicy("double", "gzip")
+    with pytest.raises(ValueError):
+        dpf.TransportPolicy(precision="half")
+    with pytest.raises(ValueError):
+        dpf.TransportPolicy(compression="zstd")
+
+
+def test_transport_policy_override():
+    server = dpf.SERVER
+    assert transport._policy(server) == server.transport
+    with dpf.transport_policy(precision="float"):
+        assert transport._policy(server).precision == "float"
+        with dpf.transport_policy(compression="deflate"):
+            assert transport._policy(server) == dpf.TransportPolicy("float", "deflate")
+    assert transport._policy(server) == server.transport
+
+
+def test_field_data_single_precision():
+    field = dpf.fields_factory.create_3d_vector_field(2)
+    field.data = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    field.scoping.ids = [1, 2]
+    with dpf.transport_policy(precision="float", compression="gzip"):
+        data = field.data
+        entity = field.get_entity_data(1)
+        field.scoping.ids = [3, 4]
+    assert data.dtype == np.float32
+    assert np.allclose(data, [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    assert np.allclose(entity, [[4.0, 5.0, 6.0]])
+    assert field.data.dtype == np.float64
+    assert list(field.scoping.ids) == [3, 4]
+
+
+def test_single_precision_not_written_back():
+    value = 0.1 + 1e-12
+    field = dpf.fields_factory.create_scalar_field(2)
+    field.data = [value, value]
+    with dpf.transport_policy(precision="float"):
+        with field.as_local_field() as local:
+            local.append([value], 3)
+        copy = field.deep_copy()
+    assert field.data[0] == value
+    assert copy.data[0] == value
@@ -1,3 +1,5 @@
+import asyncio
+
 import numpy as np
 import pytest
 
@@ -45,6 +47,21 @@ def test_connect_field_workflow():
     assert np.allclose(fOut.data, [7.0, 8.0, 9.0])
 
 
+def test_get_output_async_workflow():
+    wf = dpf.core.Workflow()
+    op = dpf.core.Operator("min_max")
+    inpt = dpf.core.Field(nentities=3)
+    inpt.data = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    inpt.scoping.ids = [1, 2, 3]
+    wf.set_input_name("field", op.inputs.field)
+    wf.set_output_name("min", op.outputs.field_min)
+    wf.connect("field", inpt)
+    f_out = asyncio.run(
+        wf.get_output_async("min", dpf.core.types.field)
+    )
+    assert np.allclose(f_out.data, [1.0, 2.0, 3.0])
+
+
 def test_connect_list_workflow(velocity_acceleration):
     wf = dpf.core.Workflow()
     model = dpf.core.Model(velocity_acceleration)